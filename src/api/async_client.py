@@ -0,0 +1,329 @@
+"""Asynchronous Altoro Mutual API client for concurrent per-account requests.
+
+This module mirrors AltoroAPI on top of httpx.AsyncClient so that the
+per-account detail and transaction lookups can run concurrently instead of
+one round-trip at a time:
+- Same token handling and retry semantics as the synchronous client
+- Bounded concurrency via asyncio.Semaphore
+- Async context manager support for proper resource cleanup
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Any, Optional, Iterable
+
+import httpx
+import orjson
+
+from src.api.client import (
+    Token,
+    DEFAULT_HEADERS,
+    TOKEN_LIFETIME,
+    TOKEN_REFRESH_BUFFER,
+    JSON_CONTENT_HEADERS,
+    MAX_TRANSACTIONS_RESPONSE_BYTES,
+    aread_capped_json,
+    extract_transactions,
+    TRANSACTION_KEYS,
+    RECENT_TRANSACTION_KEYS,
+)
+from src.api.retry_handler import with_async_api_retry
+from src.api.endpoints import (
+    API_LOGIN,
+    API_ACCOUNTS,
+    API_ACCOUNT_DETAILS,
+    API_TRANSACTIONS_POST,
+)
+from src.api.exceptions import APIAuthenticationError, response_excerpt
+from src.core.logger import log
+
+
+# Connection pool limits for concurrent fan-out to a single host
+ASYNC_CONNECTION_LIMITS = httpx.Limits(max_connections=50)
+
+# Maximum number of in-flight per-account requests
+MAX_CONCURRENT_REQUESTS = 10
+
+
+class AsyncAltoroAPI:
+    """
+    Asynchronous Altoro Mutual REST API client.
+
+    Usage:
+        async with AsyncAltoroAPI(base_url, username, password) as api:
+            await api.authenticate()
+            details = await api.get_all_account_details(["800002", "800003"])
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        user: str,
+        pwd: str,
+        timeout: float = 20.0,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ):
+        """
+        Initialize async API client with credentials and connection settings.
+
+        Args:
+            base_url: Base URL of the Altoro Mutual API
+            user: API username
+            pwd: API password
+            timeout: Request timeout in seconds (default: 20.0)
+            max_concurrency: Maximum concurrent requests (default: 10)
+        """
+        self.base = base_url.rstrip("/")
+        # Endpoint URLs resolved once - the base never changes after construction
+        self._url_login = self.base + API_LOGIN
+        self._url_accounts = self.base + API_ACCOUNTS
+        self._account_tmpl = self.base + API_ACCOUNT_DETAILS.replace(
+            "{accountNo}", "%s"
+        )
+        self._transactions_tmpl = self.base + API_TRANSACTIONS_POST.replace(
+            "{accountNo}", "%s"
+        )
+        self.user = user
+        self.pwd = pwd
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self._tok: Optional[Token] = None
+        # Monotonic deadline after which requests re-authenticate
+        self._valid_until = 0.0
+        # Authorization header built once per token, reused on every request
+        self._auth_headers: Dict[str, str] = {}
+        self._auth_json_headers: Dict[str, str] = dict(JSON_CONTENT_HEADERS)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._auth_lock: Optional[asyncio.Lock] = None
+
+    async def __aenter__(self):
+        """Async context manager entry - create persistent HTTP client."""
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=ASYNC_CONNECTION_LIMITS,
+            http2=True,
+            headers=DEFAULT_HEADERS,
+        )
+        self._auth_lock = asyncio.Lock()
+        log.debug("Async API client initialized for {}", self.base)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit - close HTTP client."""
+        if self._client:
+            await self._client.aclose()
+            log.debug("Async API client connection closed")
+        self._client = None
+        return False
+
+    async def _ensure_valid_token(self):
+        """
+        Re-authenticate once the cached _valid_until deadline has passed.
+
+        Callers check the deadline before awaiting this, so the lock is only
+        taken on expiry; concurrent callers share it so only one of them
+        re-authenticates.
+        """
+        async with self._auth_lock:
+            if time.monotonic() >= self._valid_until:
+                log.debug("Token expired or missing, re-authenticating...")
+                await self.authenticate()
+
+    @with_async_api_retry(max_retries=2, backoff_factor=2.0)
+    async def authenticate(self):
+        """
+        Authenticate with the AltoroMutual API and obtain Bearer token.
+
+        Raises:
+            APIAuthenticationError: If credentials are invalid
+            MaxRetriesExceededError: If retry attempts exhausted
+        """
+        try:
+            log.info("Authenticating to {} as {}...", self._url_login, self.user)
+            r = await self._client.post(
+                self._url_login,
+                content=orjson.dumps({"username": self.user, "password": self.pwd}),
+                headers=JSON_CONTENT_HEADERS,
+            )
+            r.raise_for_status()
+
+            auth_header = orjson.loads(r.content).get("Authorization", "")
+            if not auth_header:
+                raise APIAuthenticationError(
+                    "No Authorization header in login response"
+                )
+
+            token_value = (
+                auth_header.replace("Bearer ", "")
+                if auth_header.startswith("Bearer ")
+                else auth_header
+            )
+            self._auth_headers = {"Authorization": token_value}
+            self._auth_json_headers = {**self._auth_headers, **JSON_CONTENT_HEADERS}
+            self._tok = Token(value=token_value, exp=time.monotonic() + TOKEN_LIFETIME)
+            self._valid_until = self._tok.exp - TOKEN_REFRESH_BUFFER
+
+            log.info("Authentication successful (token expires in 1 hour)")
+
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code in (401, 403):
+                log.error(
+                    "Authentication failed: Invalid credentials for user {}", self.user
+                )
+                raise APIAuthenticationError(
+                    f"Invalid credentials for user {self.user}",
+                    status_code=e.response.status_code,
+                    response_body=response_excerpt(e.response),
+                ) from e
+            raise
+
+    @with_async_api_retry(max_retries=3, backoff_factor=2.0)
+    async def accounts(self) -> List[Dict[str, Any]]:
+        """
+        Retrieve all accounts for the authenticated user.
+
+        Returns:
+            List of account dictionaries from the "Accounts" array
+        """
+        if time.monotonic() >= self._valid_until:
+            await self._ensure_valid_token()
+
+        log.debug("Fetching accounts from {}", self._url_accounts)
+        r = await self._client.get(self._url_accounts, headers=self._auth_headers)
+        r.raise_for_status()
+
+        accounts_list = orjson.loads(r.content).get("Accounts", [])
+        log.info("Retrieved {} accounts from API", len(accounts_list))
+        return accounts_list
+
+    @with_async_api_retry(max_retries=3, backoff_factor=2.0)
+    async def get_account_details(self, account_id: str) -> Dict[str, Any]:
+        """
+        Retrieve detailed information for a specific account.
+
+        Args:
+            account_id: Account number/identifier
+
+        Returns:
+            Dictionary with account details including balance, type, etc.
+        """
+        if time.monotonic() >= self._valid_until:
+            await self._ensure_valid_token()
+
+        log.debug("Fetching account details for {}", account_id)
+        r = await self._client.get(
+            self._account_tmpl % account_id, headers=self._auth_headers
+        )
+        r.raise_for_status()
+
+        details = orjson.loads(r.content)
+        log.debug("Retrieved details for account {}", account_id)
+        return details
+
+    @with_async_api_retry(max_retries=3, backoff_factor=2.0)
+    async def transactions(
+        self, account_id: str, start: Optional[str] = None, end: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve transactions for a specific account.
+
+        Args:
+            account_id: Account number
+            start: Start date in YYYY-MM-DD format (optional)
+            end: End date in YYYY-MM-DD format (optional)
+
+        Returns:
+            List of transaction dictionaries
+        """
+        if time.monotonic() >= self._valid_until:
+            await self._ensure_valid_token()
+
+        if start and end:
+            keys = TRANSACTION_KEYS
+            log.debug(
+                "Fetching transactions for {} from {} to {}", account_id, start, end
+            )
+            request = self._client.build_request(
+                "POST",
+                self._transactions_tmpl % account_id,
+                content=orjson.dumps({"startDate": start, "endDate": end}),
+                headers=self._auth_json_headers,
+            )
+        else:
+            keys = RECENT_TRANSACTION_KEYS
+            log.debug("Fetching last 10 transactions for {}", account_id)
+            request = self._client.build_request(
+                "GET",
+                self._transactions_tmpl % account_id,
+                headers=self._auth_headers,
+            )
+
+        # Streamed and size-capped like AltoroAPI.transactions()
+        r = await self._client.send(request, stream=True)
+        try:
+            if r.is_error:
+                # Error bodies are small; read them so the retry handler can
+                # attach an excerpt to the raised exception
+                await r.aread()
+            r.raise_for_status()
+            transactions = extract_transactions(
+                await aread_capped_json(r, MAX_TRANSACTIONS_RESPONSE_BYTES), keys
+            )
+        finally:
+            await r.aclose()
+
+        log.info(
+            "Retrieved {} transactions for account {}", len(transactions), account_id
+        )
+        return transactions
+
+    async def get_all_account_details(
+        self, account_ids: Iterable[str]
+    ) -> List[Dict[str, Any] | BaseException]:
+        """
+        Retrieve details for many accounts concurrently.
+
+        Args:
+            account_ids: Account numbers to look up
+
+        Returns:
+            List aligned with account_ids containing either the details
+            dictionary or the exception raised for that account.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(account_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get_account_details(account_id)
+
+        return await asyncio.gather(
+            *(fetch(account_id) for account_id in account_ids), return_exceptions=True
+        )
+
+    async def get_all_transactions(
+        self,
+        account_ids: Iterable[str],
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+    ) -> List[List[Dict[str, Any]] | BaseException]:
+        """
+        Retrieve transactions for many accounts concurrently.
+
+        Args:
+            account_ids: Account numbers to look up
+            start: Start date in YYYY-MM-DD format (optional)
+            end: End date in YYYY-MM-DD format (optional)
+
+        Returns:
+            List aligned with account_ids containing either the transaction
+            list or the exception raised for that account.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(account_id: str) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.transactions(account_id, start, end)
+
+        return await asyncio.gather(
+            *(fetch(account_id) for account_id in account_ids), return_exceptions=True
+        )
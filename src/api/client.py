@@ -9,26 +9,231 @@ This module provides a production-ready API client with:
 """
 
 import httpx
+import orjson
+import threading
 import time
-from typing import Dict, List, Any, Optional
-from pydantic import BaseModel
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
 
 from src.api.retry_handler import with_api_retry
-from src.api.exceptions import APIAuthenticationError
+from src.api.endpoints import (
+    API_LOGIN,
+    API_ACCOUNTS,
+    API_ACCOUNT_DETAILS,
+    API_TRANSACTIONS_POST,
+    API_TRANSACTIONS_BATCH,
+)
+from src.api.exceptions import APIError, APIAuthenticationError, response_excerpt
 from src.core.logger import log
 
 
 # Token expiration buffer - refresh token this many seconds before it expires
 TOKEN_REFRESH_BUFFER = 300  # 5 minutes
 
+# Token lifetime granted by the API on login
+TOKEN_LIFETIME = 3600  # 1 hour
 
-class Token(BaseModel):
-    """API authentication token with expiration tracking."""
+# Background refresh fires this many seconds before the inline refresh buffer,
+# so request threads never hit the blocking re-authentication path
+BACKGROUND_REFRESH_LEAD = 60
+
+# Headers sent on every request. Compression is advertised explicitly so large
+# transactions payloads travel gzip/brotli-encoded; httpx decodes them
+# transparently (brotli support comes from the httpx[brotli] extra)
+DEFAULT_HEADERS = {"Accept": "application/json", "Accept-Encoding": "gzip, br"}
+
+# Request bodies are pre-encoded with orjson, so the content type is set explicitly
+JSON_CONTENT_HEADERS = {"Content-Type": "application/json"}
+
+# Status codes meaning the batch transactions endpoint is not available; None
+# marks a 200 response that can't be split by account
+BATCH_UNSUPPORTED_STATUS_CODES = {404, 405, 501, None}
+
+# Keys that may hold the transaction array, in order of likelihood
+TRANSACTION_KEYS = ("transactions", "lastTenTransactions", "Transactions")
+
+# GET without a date range usually answers with lastTenTransactions
+RECENT_TRANSACTION_KEYS = ("lastTenTransactions", "transactions", "Transactions")
+
+# Upper bound on a transactions response body; larger payloads are rejected
+# while streaming instead of being buffered in full
+MAX_TRANSACTIONS_RESPONSE_BYTES = 50 * 1024 * 1024  # 50 MB
+
+# Account details are reused for this many seconds before being re-fetched
+ACCOUNT_DETAILS_TTL = 60
+
+# Maximum number of cached account details entries
+ACCOUNT_DETAILS_CACHE_SIZE = 512
+
+# Connection pool limits - keep connections alive so TLS/TCP handshakes are reused
+CONNECTION_LIMITS = httpx.Limits(
+    max_keepalive_connections=20, max_connections=100, keepalive_expiry=30.0
+)
+
+
+@dataclass(slots=True)
+class Token:
+    """API authentication token with expiration tracking.
+
+    exp is a time.monotonic() deadline, so wall-clock jumps (NTP sync,
+    container migration) cannot make a valid token look expired.
+    """
 
     value: str
     exp: float
 
 
+def extract_transactions(
+    response: Any, keys: Tuple[str, ...] = TRANSACTION_KEYS
+) -> List[Dict[str, Any]]:
+    """
+    Extract the transaction array from a transactions endpoint response.
+
+    Args:
+        response: Decoded JSON body from the transactions endpoint
+        keys: Candidate array keys, most likely first (default: TRANSACTION_KEYS)
+
+    Returns:
+        List of transaction dictionaries (empty if the shape is unrecognized)
+
+    Note:
+        API returns different keys based on endpoint:
+        POST with dates: {"transactions": [...]}
+        GET without dates: {"lastTenTransactions": [...]} or similar
+    """
+    if isinstance(response, dict):
+        # First key present wins; callers order keys by the expected shape
+        for key in keys:
+            transactions = response.get(key)
+            if transactions is not None:
+                return transactions
+        return []
+    if isinstance(response, list):
+        # Already a list, return as-is
+        return response
+    return []
+
+
+def _group_batch_transactions(
+    transactions: List[Dict[str, Any]], account_ids: List[str]
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Split a batch transactions response by account.
+
+    Args:
+        transactions: Flat transaction list from the batch endpoint
+        account_ids: Account numbers the batch was requested for
+
+    Returns:
+        Dictionary mapping each requested account_id to its transaction list
+
+    Raises:
+        APIError: With status_code None if any transaction lacks an
+            "accountId" or names an account that wasn't requested, i.e. the
+            response can't be attributed to accounts
+    """
+    grouped: Dict[str, List[Dict[str, Any]]] = {
+        account_id: [] for account_id in account_ids
+    }
+    for txn in transactions:
+        account_id = txn.get("accountId") if isinstance(txn, dict) else None
+        bucket = grouped.get(str(account_id)) if account_id is not None else None
+        if bucket is None:
+            raise APIError(
+                f"Batch transaction without a requested accountId: {account_id!r}"
+            )
+        bucket.append(txn)
+    return grouped
+
+
+def _check_declared_size(response: httpx.Response, limit: int) -> None:
+    """
+    Reject a response whose Content-Length already exceeds a size limit.
+
+    Args:
+        response: httpx.Response opened with client.stream()
+        limit: Maximum number of body bytes to accept
+
+    Raises:
+        APIError: If the declared body size exceeds limit
+    """
+    declared = response.headers.get("Content-Length")
+    if declared and declared.isdigit() and int(declared) > limit:
+        raise APIError(
+            f"Response body of {declared} bytes exceeds {limit} byte limit",
+            status_code=response.status_code,
+        )
+
+
+def _append_capped(
+    body: bytearray, chunk: bytes, limit: int, response: httpx.Response
+) -> None:
+    """
+    Append a received body chunk, enforcing a size limit.
+
+    Args:
+        body: Bytes received so far, extended in place
+        chunk: Newly received bytes
+        limit: Maximum number of body bytes to accept
+        response: Response the chunk belongs to (for the error status code)
+
+    Raises:
+        APIError: If the received body size exceeds limit
+    """
+    body += chunk
+    if len(body) > limit:
+        raise APIError(
+            f"Response body exceeds {limit} byte limit",
+            status_code=response.status_code,
+        )
+
+
+def read_capped_json(response: httpx.Response, limit: int) -> Any:
+    """
+    Read a streamed response body up to a size limit and decode it as JSON.
+
+    Args:
+        response: httpx.Response opened with client.stream()
+        limit: Maximum number of body bytes to accept
+
+    Returns:
+        Decoded JSON body
+
+    Raises:
+        APIError: If the declared or received body size exceeds limit
+
+    Note:
+        A Content-Length above the limit is rejected before any body bytes
+        are read; otherwise chunks are accumulated and checked as they arrive.
+    """
+    _check_declared_size(response, limit)
+    body = bytearray()
+    for chunk in response.iter_bytes():
+        _append_capped(body, chunk, limit, response)
+    return orjson.loads(body)
+
+
+async def aread_capped_json(response: httpx.Response, limit: int) -> Any:
+    """
+    Async counterpart of read_capped_json() for httpx.AsyncClient streams.
+
+    Args:
+        response: httpx.Response opened with AsyncClient.send(stream=True)
+        limit: Maximum number of body bytes to accept
+
+    Returns:
+        Decoded JSON body
+
+    Raises:
+        APIError: If the declared or received body size exceeds limit
+    """
+    _check_declared_size(response, limit)
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        _append_capped(body, chunk, limit, response)
+    return orjson.loads(body)
+
+
 class AltoroAPI:
     """
     Altoro Mutual REST API client with automatic retry and token management.
@@ -36,7 +241,7 @@ class AltoroAPI:
     Features:
     - Connection pooling via persistent httpx.Client
     - Automatic token refresh before expiration
-    - Exponential backoff retry on transient failures (500, 503, timeouts)
+    - Exponential backoff retry on transient failures (500, 502, 503, 504, timeouts)
     - Custom exception hierarchy for precise error handling
     - Context manager support for proper resource cleanup
 
@@ -58,26 +263,76 @@ class AltoroAPI:
             timeout: Request timeout in seconds (default: 20.0)
         """
         self.base = base_url.rstrip("/")
+        # Endpoint URLs resolved once - the base never changes after construction
+        self._url_login = self.base + API_LOGIN
+        self._url_accounts = self.base + API_ACCOUNTS
+        self._account_tmpl = self.base + API_ACCOUNT_DETAILS.replace(
+            "{accountNo}", "%s"
+        )
+        self._transactions_tmpl = self.base + API_TRANSACTIONS_POST.replace(
+            "{accountNo}", "%s"
+        )
+        self._url_transactions_batch = self.base + API_TRANSACTIONS_BATCH
         self.user = user
         self.pwd = pwd
         self.timeout = timeout
         self._tok: Optional[Token] = None
+        # Monotonic deadline after which requests re-authenticate inline;
+        # cached so the per-request check is a single float comparison
+        self._valid_until = 0.0
+        # Authorization header built once per token, reused on every request
+        self._auth_headers: Dict[str, str] = {}
+        self._auth_json_headers: Dict[str, str] = dict(JSON_CONTENT_HEADERS)
         self._client: Optional[httpx.Client] = None
+        self._batch_supported = True
+        # account_id -> (monotonic expiry, details); insertion ordered for eviction
+        self._details_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        # Guards _details_cache and _details_generation: Part 6 worker threads
+        # read and fill it while the refresh timer thread clears it
+        self._details_lock = threading.Lock()
+        # Bumped on every new token, so a fetch that started under the
+        # previous token doesn't store its result after the clear
+        self._details_generation = 0
+        self._refresh_timer: Optional[threading.Timer] = None
+        self._refresh_lock = threading.Lock()
+        # Set by __exit__ under _refresh_lock; a refresh timer that already
+        # fired (cancel() can't stop it) then neither logs in nor reschedules
+        self._closed = False
 
     def __enter__(self):
         """Context manager entry - create persistent HTTP client."""
-        self._client = httpx.Client(timeout=self.timeout)
-        log.debug(f"API client initialized for {self.base}")
+        self._closed = False
+        self._client = self._create_client()
+        log.debug("API client initialized for {}", self.base)
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - close HTTP client and cleanup resources."""
+        # Waits for an in-flight background refresh, so its new timer is
+        # cancelled below and its client is the one closed
+        with self._refresh_lock:
+            self._closed = True
+        self._cancel_refresh()
         if self._client:
             self._client.close()
             log.debug("API client connection closed")
         self._client = None
         return False
 
+    def _create_client(self) -> httpx.Client:
+        """
+        Create a pooled HTTP/2 client for all requests to the API host.
+
+        Returns:
+            httpx.Client instance with keep-alive pool limits and HTTP/2 enabled
+        """
+        return httpx.Client(
+            timeout=self.timeout,
+            limits=CONNECTION_LIMITS,
+            http2=True,
+            headers=DEFAULT_HEADERS,
+        )
+
     def _get_client(self) -> httpx.Client:
         """
         Get the HTTP client, creating one if needed.
@@ -90,49 +345,68 @@ class AltoroAPI:
             Recommended to use context manager for connection pooling.
         """
         if self._client is None:
-            self._client = httpx.Client(timeout=self.timeout)
+            self._client = self._create_client()
         return self._client
 
-    def _headers(self) -> Dict[str, str]:
+    def _schedule_refresh(self):
         """
-        Get HTTP headers including authorization token.
+        Schedule a background token refresh ahead of expiration.
 
-        Returns:
-            Dictionary of HTTP headers
-
-        Note:
-            Returns empty dict if no token available.
+        Replaces any pending refresh timer. The timer thread is a daemon so it
+        never keeps the interpreter alive. Nothing is scheduled once the
+        client is closed.
         """
-        if self._tok:
-            return {"Authorization": f"{self._tok.value}"}
-        return {}
-
-    def _is_token_expired(self) -> bool:
+        self._cancel_refresh()
+        if self._closed:
+            return
+        delay = max(
+            0.0,
+            self._tok.exp
+            - time.monotonic()
+            - TOKEN_REFRESH_BUFFER
+            - BACKGROUND_REFRESH_LEAD,
+        )
+        self._refresh_timer = threading.Timer(delay, self._background_refresh)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _cancel_refresh(self):
+        """Cancel the pending background token refresh, if any."""
+        if self._refresh_timer:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
+    def _background_refresh(self):
         """
-        Check if the current token is expired or about to expire.
-
-        Returns:
-            True if token is None, expired, or within refresh buffer
+        Refresh the token from the timer thread.
 
-        Note:
-            Uses TOKEN_REFRESH_BUFFER to proactively refresh before expiration.
+        On failure the current token is kept; it is still valid for the
+        refresh buffer, after which each request re-authenticates inline
+        once _valid_until has passed.
         """
-        if not self._tok:
-            return True
-
-        time_until_expiry = self._tok.exp - time.time()
-        return time_until_expiry < TOKEN_REFRESH_BUFFER
+        with self._refresh_lock:
+            if self._closed:
+                return
+            try:
+                log.debug("Refreshing API token in background...")
+                self.authenticate()
+            except Exception as e:
+                log.warning(
+                    "Background token refresh failed, keeping current token: {}", e
+                )
 
-    def _ensure_valid_token(self):
+    def _reauthenticate(self):
         """
-        Ensure a valid authentication token exists, refreshing if needed.
+        Re-authenticate once the cached _valid_until deadline has passed.
 
-        Raises:
-            APIAuthenticationError: If authentication fails
+        Callers check the deadline before calling this, so the lock is only
+        taken on expiry; threads sharing the client wait on it and re-check,
+        so only one of them logs in again.
         """
-        if self._is_token_expired():
-            log.debug("Token expired or missing, re-authenticating...")
-            self.authenticate()
+        with self._refresh_lock:
+            if time.monotonic() >= self._valid_until:
+                log.debug("Token expired or missing, re-authenticating...")
+                self.authenticate()
 
     @with_api_retry(max_retries=2, backoff_factor=2.0)
     def authenticate(self):
@@ -149,20 +423,22 @@ class AltoroAPI:
 
         Note:
             Token is valid for 3600 seconds (1 hour).
-            Automatically refreshed when needed by _ensure_valid_token().
+            Refreshed by a background timer before expiration, with an
+            inline _valid_until check on each request as a fallback.
         """
         client = self._get_client()
 
         try:
-            log.info(f"Authenticating to {self.base}/api/login as {self.user}...")
+            log.info("Authenticating to {} as {}...", self._url_login, self.user)
             r = client.post(
-                f"{self.base}/api/login",
-                json={"username": self.user, "password": self.pwd},
+                self._url_login,
+                content=orjson.dumps({"username": self.user, "password": self.pwd}),
+                headers=JSON_CONTENT_HEADERS,
             )
             r.raise_for_status()
 
             # API returns "Authorization: Bearer TOKEN" in response
-            auth_header = r.json().get("Authorization", "")
+            auth_header = orjson.loads(r.content).get("Authorization", "")
             if not auth_header:
                 raise APIAuthenticationError(
                     "No Authorization header in login response"
@@ -173,23 +449,74 @@ class AltoroAPI:
                 if auth_header.startswith("Bearer ")
                 else auth_header
             )
-            self._tok = Token(value=token_value, exp=time.time() + 3600)
+            self._set_token(token_value, TOKEN_LIFETIME)
 
             log.info("Authentication successful (token expires in 1 hour)")
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code in (401, 403):
                 log.error(
-                    f"Authentication failed: Invalid credentials for user {self.user}"
+                    "Authentication failed: Invalid credentials for user {}", self.user
                 )
                 raise APIAuthenticationError(
                     f"Invalid credentials for user {self.user}",
                     status_code=e.response.status_code,
-                    response_body=e.response.text[:500],
+                    response_body=response_excerpt(e.response),
                 ) from e
             # Let retry decorator handle other status codes
             raise
 
+    def _set_token(self, token_value: str, lifetime: float):
+        """
+        Install a Bearer token and schedule its refresh.
+
+        Args:
+            token_value: Token sent in the Authorization header
+            lifetime: Seconds until the token expires
+        """
+        self._auth_headers = {"Authorization": token_value}
+        self._auth_json_headers = {**self._auth_headers, **JSON_CONTENT_HEADERS}
+        self._tok = Token(value=token_value, exp=time.monotonic() + lifetime)
+        self._valid_until = self._tok.exp - TOKEN_REFRESH_BUFFER
+        # Details fetched under the previous token are not reused
+        with self._details_lock:
+            self._details_cache.clear()
+            self._details_generation += 1
+        self._schedule_refresh()
+
+    def export_token(self) -> Optional[Dict[str, Any]]:
+        """
+        Get the current token in a form that can be persisted between runs.
+
+        Returns:
+            {"token": str, "expires_at": float} with expires_at as a Unix
+            timestamp, or None if not authenticated
+        """
+        if self._tok is None:
+            return None
+        remaining = self._tok.exp - time.monotonic()
+        return {"token": self._tok.value, "expires_at": time.time() + remaining}
+
+    def restore_token(self, saved: Dict[str, Any]) -> bool:
+        """
+        Reuse a token saved by export_token() instead of logging in.
+
+        Args:
+            saved: Dictionary returned by export_token()
+
+        Returns:
+            True if the token was installed; False if it expires within
+            TOKEN_REFRESH_BUFFER, in which case authenticate() is needed
+        """
+        remaining = saved["expires_at"] - time.time()
+        if remaining <= TOKEN_REFRESH_BUFFER:
+            return False
+        self._set_token(saved["token"], remaining)
+        log.info(
+            "Reusing saved API token for {} (expires in {:.0f}s)", self.user, remaining
+        )
+        return True
+
     @with_api_retry(max_retries=3, backoff_factor=2.0)
     def accounts(self) -> List[Dict[str, Any]]:
         """
@@ -197,7 +524,7 @@ class AltoroAPI:
 
         Automatically:
         - Checks and refreshes token if needed
-        - Retries on transient failures (500, 503, timeouts)
+        - Retries on transient failures (500, 502, 503, 504, timeouts)
         - Logs request details for debugging
 
         Returns:
@@ -214,16 +541,17 @@ class AltoroAPI:
             accounts = api.accounts()
             # [{"Name": "Savings", "id": "800002"}, ...]
         """
-        self._ensure_valid_token()
+        if time.monotonic() >= self._valid_until:
+            self._reauthenticate()
         client = self._get_client()
 
-        log.debug(f"Fetching accounts from {self.base}/api/account")
-        r = client.get(f"{self.base}/api/account", headers=self._headers())
+        log.debug("Fetching accounts from {}", self._url_accounts)
+        r = client.get(self._url_accounts, headers=self._auth_headers)
         r.raise_for_status()
 
-        response = r.json()
+        response = orjson.loads(r.content)
         accounts_list = response.get("Accounts", [])
-        log.info(f"Retrieved {len(accounts_list)} accounts from API")
+        log.info("Retrieved {} accounts from API", len(accounts_list))
         return accounts_list
 
     @with_api_retry(max_retries=3, backoff_factor=2.0)
@@ -233,7 +561,7 @@ class AltoroAPI:
 
         Automatically:
         - Checks and refreshes token if needed
-        - Retries on transient failures (500, 503, timeouts)
+        - Retries on transient failures (500, 502, 503, 504, timeouts)
         - Logs request details for debugging
 
         Args:
@@ -251,17 +579,41 @@ class AltoroAPI:
         Example:
             details = api.get_account_details("800002")
             # {"accountName": "Savings", "balance": "1000.00", ...}
+
+        Note:
+            Results are cached per account for ACCOUNT_DETAILS_TTL seconds and
+            dropped on re-authentication, so repeat lookups within a run skip
+            the round-trip. The cached dictionary is shared between callers.
+            The cache is safe to use from several threads at once.
         """
-        self._ensure_valid_token()
+        now = time.monotonic()
+        with self._details_lock:
+            cached = self._details_cache.get(account_id)
+            generation = self._details_generation
+        if cached and cached[0] > now:
+            log.debug("Using cached account details for {}", account_id)
+            return cached[1]
+
+        if now >= self._valid_until:
+            self._reauthenticate()
         client = self._get_client()
 
-        log.debug(f"Fetching account details for {account_id}")
-        r = client.get(f"{self.base}/api/account/{account_id}", headers=self._headers())
+        log.debug("Fetching account details for {}", account_id)
+        r = client.get(self._account_tmpl % account_id, headers=self._auth_headers)
         r.raise_for_status()
 
-        details = r.json()
-        log.debug(f"Retrieved details for account {account_id}")
-
+        details = orjson.loads(r.content)
+        log.debug("Retrieved details for account {}", account_id)
+
+        with self._details_lock:
+            if generation == self._details_generation:
+                if (
+                    account_id not in self._details_cache
+                    and len(self._details_cache) >= ACCOUNT_DETAILS_CACHE_SIZE
+                ):
+                    # Evict the oldest entry
+                    del self._details_cache[next(iter(self._details_cache))]
+                self._details_cache[account_id] = (now + ACCOUNT_DETAILS_TTL, details)
         return details
 
     @with_api_retry(max_retries=3, backoff_factor=2.0)
@@ -273,7 +625,7 @@ class AltoroAPI:
 
         Automatically:
         - Checks and refreshes token if needed
-        - Retries on transient failures (500, 503, timeouts)
+        - Retries on transient failures (500, 502, 503, 504, timeouts)
         - Logs request details for debugging
 
         Args:
@@ -301,46 +653,152 @@ class AltoroAPI:
             # Date-filtered transactions
             txns = api.transactions("800002", "2025-01-01", "2025-03-31")
         """
-        self._ensure_valid_token()
+        if time.monotonic() >= self._valid_until:
+            self._reauthenticate()
         client = self._get_client()
 
         if start and end:
             # Use POST with date range body for filtered transactions
-            log.debug(f"Fetching transactions for {account_id} from {start} to {end}")
-            body = {"startDate": start, "endDate": end}
-            r = client.post(
-                f"{self.base}/api/account/{account_id}/transactions",
-                json=body,
-                headers=self._headers(),
+            keys = TRANSACTION_KEYS
+            log.debug(
+                "Fetching transactions for {} from {} to {}", account_id, start, end
+            )
+            request = client.build_request(
+                "POST",
+                self._transactions_tmpl % account_id,
+                content=orjson.dumps({"startDate": start, "endDate": end}),
+                headers=self._auth_json_headers,
             )
         else:
             # Use GET for last 10 transactions
-            log.debug(f"Fetching last 10 transactions for {account_id}")
-            r = client.get(
-                f"{self.base}/api/account/{account_id}/transactions",
-                headers=self._headers(),
+            keys = RECENT_TRANSACTION_KEYS
+            log.debug("Fetching last 10 transactions for {}", account_id)
+            request = client.build_request(
+                "GET",
+                self._transactions_tmpl % account_id,
+                headers=self._auth_headers,
             )
 
-        r.raise_for_status()
-        response = r.json()
-
-        # API returns different keys based on endpoint:
-        # POST with dates: {"transactions": [...]}
-        # GET without dates: {"lastTenTransactions": [...]} or similar
-        # Extract the transaction array from the response
-        if isinstance(response, dict):
-            # Try common keys in order of likelihood
-            transactions = (
-                response.get("transactions")
-                or response.get("lastTenTransactions")
-                or response.get("Transactions")
-                or []
+        # Stream the body so oversized date ranges are rejected before they
+        # are fully buffered in memory
+        r = client.send(request, stream=True)
+        try:
+            if r.is_error:
+                # Error bodies are small; read them so the retry handler can
+                # attach an excerpt to the raised exception
+                r.read()
+            r.raise_for_status()
+            transactions = extract_transactions(
+                read_capped_json(r, MAX_TRANSACTIONS_RESPONSE_BYTES), keys
             )
-        elif isinstance(response, list):
-            # Already a list, return as-is
-            transactions = response
-        else:
-            transactions = []
+        finally:
+            r.close()
 
-        log.info(f"Retrieved {len(transactions)} transactions for account {account_id}")
+        log.info(
+            "Retrieved {} transactions for account {}", len(transactions), account_id
+        )
         return transactions
+
+    @with_api_retry(max_retries=3, backoff_factor=2.0)
+    def _post_transactions_batch(
+        self, account_ids: List[str], start: str, end: str
+    ) -> List[Dict[str, Any]]:
+        """
+        POST a single multi-account transactions query.
+
+        Args:
+            account_ids: Account numbers to query
+            start: Start date in YYYY-MM-DD format
+            end: End date in YYYY-MM-DD format
+
+        Returns:
+            Flat list of transaction dictionaries for all requested accounts
+        """
+        if time.monotonic() >= self._valid_until:
+            self._reauthenticate()
+        client = self._get_client()
+
+        log.debug(
+            "Fetching batch transactions for {} accounts from {} to {}",
+            len(account_ids),
+            start,
+            end,
+        )
+        r = client.post(
+            self._url_transactions_batch,
+            content=orjson.dumps(
+                {"accountIds": account_ids, "startDate": start, "endDate": end}
+            ),
+            headers=self._auth_json_headers,
+        )
+        r.raise_for_status()
+        return extract_transactions(orjson.loads(r.content))
+
+    @property
+    def batch_supported(self) -> bool:
+        """False once the batch transactions endpoint has been found missing."""
+        return self._batch_supported
+
+    def transactions_batch(
+        self, account_ids: List[str], start: str, end: str, fallback: bool = True
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Retrieve date-filtered transactions for several accounts at once.
+
+        Uses the batch endpoint so one round-trip replaces one per account.
+        If the server does not support it (404, 405 or 501, or a response
+        whose transactions don't all name one of the requested accounts),
+        falls back to per-account transactions() calls and remembers the
+        result so later batches skip the probe.
+
+        Args:
+            account_ids: Account numbers to query
+            start: Start date in YYYY-MM-DD format
+            end: End date in YYYY-MM-DD format
+            fallback: Fall back to per-account requests when the batch
+                endpoint is unsupported (default: True). If False, raise
+                APIError instead so the caller can fan out itself.
+
+        Returns:
+            Dictionary mapping each requested account_id to its transaction list
+
+        Raises:
+            APIAuthenticationError: If authentication token is invalid
+            APIError: On non-retryable client or server errors, or if the
+                batch endpoint is unsupported and fallback is False
+            MaxRetriesExceededError: If retry attempts exhausted
+
+        Example:
+            by_account = api.transactions_batch(["800002", "800003"], "2025-01-01", "2025-03-31")
+            # {"800002": [...], "800003": [...]}
+        """
+        account_ids = [str(account_id) for account_id in account_ids]
+
+        if self._batch_supported:
+            try:
+                transactions = self._post_transactions_batch(account_ids, start, end)
+                grouped = _group_batch_transactions(transactions, account_ids)
+            except APIError as e:
+                if e.status_code not in BATCH_UNSUPPORTED_STATUS_CODES:
+                    raise
+                log.info(
+                    "Batch transactions endpoint unavailable ({}), falling back to per-account requests",
+                    e,
+                )
+                self._batch_supported = False
+                if not fallback:
+                    raise
+            else:
+                log.info(
+                    "Retrieved {} transactions for {} accounts in one batch",
+                    len(transactions),
+                    len(account_ids),
+                )
+                return grouped
+        elif not fallback:
+            raise APIError("Batch transactions endpoint not supported")
+
+        return {
+            account_id: self.transactions(account_id, start, end)
+            for account_id in account_ids
+        }
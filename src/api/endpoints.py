@@ -109,3 +109,34 @@ Response:
         ]
     }
 """
+
+API_TRANSACTIONS_BATCH = "/api/account/transactions/batch"
+"""
+POST /api/account/transactions/batch
+Retrieve date-filtered transactions for several accounts in one request.
+
+Not part of the stock AltoroMutual API - clients must fall back to
+per-account requests when the server answers 404, 405 or 501.
+
+Request body:
+    {
+        "accountIds": ["800002", "800003"],
+        "startDate": "2025-02-01",
+        "endDate": "2025-04-15"
+    }
+
+Response:
+    {
+        "transactions": [
+            {
+                "accountId": "800002",
+                "transactionId": "...",
+                "date": "...",
+                "description": "...",
+                "debit": "...",
+                "credit": "..."
+            },
+            ...
+        ]
+    }
+"""
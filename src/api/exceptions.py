@@ -4,6 +4,26 @@ This module provides specific exception types for different API error conditions
 enabling precise error handling and recovery strategies.
 """
 
+RESPONSE_BODY_LIMIT = 500
+"""Maximum number of response body bytes kept on an APIError"""
+
+
+def response_excerpt(response, limit: int = RESPONSE_BODY_LIMIT) -> str:
+    """
+    Decode the leading bytes of an HTTP response body for error context.
+
+    Slices the raw bytes before decoding so large error pages are never
+    decoded in full just to keep a short prefix.
+
+    Args:
+        response: httpx.Response whose body has been read
+        limit: Maximum number of bytes to keep (default: 500)
+
+    Returns:
+        Decoded body prefix, with undecodable bytes replaced
+    """
+    return response.content[:limit].decode("utf-8", "replace")
+
 
 class APIError(Exception):
     """Base exception for all API-related errors."""
@@ -0,0 +1,117 @@
+"""Persistent TTL cache for decoded API responses.
+
+Backed by a single SQLite file so cached responses survive between runs:
+- Values are stored as orjson-encoded blobs
+- Each entry has an optional wall-clock expiry
+- Safe to share between worker threads
+- The database file is readable by its owner only (it may hold tokens)
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+
+from src.core.logger import log
+
+
+class ResponseCache:
+    """
+    SQLite-backed key/value cache with per-entry expiry.
+
+    Usage:
+        with ResponseCache("artifacts/cache/api_cache.sqlite") as cache:
+            details = cache.get("acct:800002")
+            if details is None:
+                details = api.get_account_details("800002")
+                cache.set("acct:800002", details, ttl=12 * 3600)
+    """
+
+    def __init__(self, path: str):
+        """
+        Open (and create if needed) the cache database.
+
+        Args:
+            path: SQLite database file path; parent directories are created.
+                The file is created, or restricted if it already exists, with
+                0600 permissions; SQLite gives its journal the same mode.
+        """
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            # O_CREAT's mode doesn't apply to an existing file
+            os.fchmod(fd, 0o600)
+        finally:
+            os.close(fd)
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache "
+            "(key TEXT PRIMARY KEY, expires REAL, value BLOB NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - close the database."""
+        self.close()
+        return False
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Decoded value, or None if missing or expired
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT expires, value FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        expires, value = row
+        if expires is not None and expires <= time.time():
+            return None
+        log.debug("Response cache hit for {}", key)
+        return orjson.loads(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value
+            ttl: Seconds until the entry expires; None keeps it indefinitely
+        """
+        expires = None if ttl is None else time.time() + ttl
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, expires, value) VALUES (?, ?, ?)",
+                (key, expires, orjson.dumps(value)),
+            )
+
+    def delete(self, key: str) -> None:
+        """
+        Remove a value, if present.
+
+        Args:
+            key: Cache key
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
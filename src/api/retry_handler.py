@@ -4,10 +4,11 @@ This module provides a decorator for automatic retry logic with exponential back
 similar to the web layer's session retry mechanism but specialized for API calls.
 """
 
+import asyncio
 import time
 import random
 from functools import wraps
-from typing import Callable, Any
+from typing import Callable, Any, List
 import httpx
 
 from src.api.exceptions import (
@@ -15,6 +16,7 @@ from src.api.exceptions import (
     APIAuthenticationError,
     APIConnectionError,
     MaxRetriesExceededError,
+    response_excerpt,
 )
 from src.core.logger import log
 
@@ -22,13 +24,28 @@ from src.core.logger import log
 # HTTP status codes that should trigger a retry
 RETRYABLE_STATUS_CODES = {
     500,  # Internal Server Error
+    502,  # Bad Gateway
+    503,  # Service Unavailable
+    504,  # Gateway Timeout
 }
 
-# HTTP status codes that are explicitly handled (no retry)
+# HTTP status codes that are explicitly handled (no retry):
+# status code -> (exception class, message prefix)
 HANDLED_STATUS_CODES = {
-    400,  # Bad Request
-    401,  # Unauthorized
-    501,  # Not Implemented
+    400: (APIError, "Bad Request"),
+    401: (APIAuthenticationError, "Authentication failed"),
+    403: (APIAuthenticationError, "Forbidden"),
+    501: (APIError, "Not Implemented"),
+}
+
+# Retried transport errors: exception type -> (log label, exhausted-retries message).
+# Any other httpx.RequestError is retried as a generic request error.
+RETRYABLE_REQUEST_ERRORS = {
+    httpx.ConnectError: ("Connection error", "Connection failed"),
+    httpx.ConnectTimeout: ("Connection error", "Connection failed"),
+    httpx.ReadTimeout: ("Timeout", "Request timeout"),
+    httpx.WriteTimeout: ("Timeout", "Request timeout"),
+    httpx.PoolTimeout: ("Timeout", "Request timeout"),
 }
 
 
@@ -57,8 +74,8 @@ def with_api_retry(
             ...
 
     Retry Behavior:
-        - Retries on: 500 (Internal Server Error), network errors, timeouts
-        - Does NOT retry on: 400, 401, 501, and all other HTTP status codes
+        - Retries on: 500, 502, 503, 504 (server errors), network errors, timeouts
+        - Does NOT retry on: 400, 401, 403, 501, and all other HTTP status codes
         - Uses exponential backoff: wait = backoff_factor ^ attempt
         - Adds jitter to prevent synchronized retries
         - Logs each retry attempt with context
@@ -67,7 +84,8 @@ def with_api_retry(
         - 200: Success (no exception)
         - 400: Bad Request → APIError (no retry)
         - 401: Unauthorized → APIAuthenticationError (no retry)
-        - 500: Internal Server Error → Retry with backoff
+        - 403: Forbidden → APIAuthenticationError (no retry)
+        - 500/502/503/504: Server errors → Retry with backoff
         - 501: Not Implemented → APIError (no retry)
         - All others: Generic APIError (no retry)
 
@@ -76,6 +94,8 @@ def with_api_retry(
         - Preserves original exception context for debugging
     """
 
+    base_waits = _backoff_schedule(max_retries, backoff_factor, max_backoff)
+
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
@@ -89,142 +109,118 @@ def with_api_retry(
 
                     # Success! Log if this was a retry
                     if attempt > 0:
-                        log.info(f"{func.__name__} succeeded after {attempt} retries")
+                        log.info(
+                            "{} succeeded after {} retries", func.__name__, attempt
+                        )
 
                     return result
 
-                except httpx.HTTPStatusError as e:
-                    last_exception = e
-                    attempt += 1
-                    status_code = e.response.status_code
-
-                    # Handle specific status codes
-                    if status_code == 401:
-                        # Authentication error - don't retry, raise immediately
-                        raise APIAuthenticationError(
-                            f"Authentication failed (401): {e}",
-                            status_code=status_code,
-                            response_body=e.response.text[:500],
-                        ) from e
-
-                    elif status_code == 400:
-                        # Bad Request - don't retry
-                        raise APIError(
-                            f"Bad Request (400): {e}",
-                            status_code=status_code,
-                            response_body=e.response.text[:500],
-                        ) from e
-
-                    elif status_code == 501:
-                        # Not Implemented - don't retry
-                        raise APIError(
-                            f"Not Implemented (501): {e}",
-                            status_code=status_code,
-                            response_body=e.response.text[:500],
-                        ) from e
-
-                    elif status_code == 500:
-                        # Internal Server Error - retry with backoff
-                        if attempt > max_retries:
-                            raise MaxRetriesExceededError(
-                                f"Server error (500) persisted after {max_retries} retries",
-                                attempts=attempt,
-                                last_error=e,
-                                status_code=status_code,
-                            ) from e
-
-                        wait_time = _calculate_backoff(
-                            attempt, backoff_factor, max_backoff, jitter
-                        )
-                        log.warning(
-                            f"Server error (500) in {func.__name__} (attempt {attempt}/{max_retries}). "
-                            f"Retrying in {wait_time:.2f}s..."
-                        )
-                        time.sleep(wait_time)
-                        continue
-
-                    else:
-                        # All other status codes - generic error, don't retry
-                        raise APIError(
-                            f"HTTP error {status_code}: {e}",
-                            status_code=status_code,
-                            response_body=e.response.text[:500],
-                        ) from e
-
-                except (httpx.ConnectError, httpx.ConnectTimeout) as e:
-                    # Connection error - retry with backoff
+                except (httpx.HTTPStatusError, httpx.RequestError) as e:
                     last_exception = e
                     attempt += 1
-
-                    if attempt > max_retries:
-                        raise MaxRetriesExceededError(
-                            f"Connection failed after {max_retries} retries: {e}",
-                            attempts=attempt,
-                            last_error=e,
-                        ) from e
-
-                    wait_time = _calculate_backoff(
-                        attempt, backoff_factor, max_backoff, jitter
-                    )
-                    log.warning(
-                        f"Connection error in {func.__name__} (attempt {attempt}/{max_retries}). "
-                        f"Retrying in {wait_time:.2f}s..."
+                    wait_time = _retry_wait_or_raise(
+                        e,
+                        attempt,
+                        func.__name__,
+                        max_retries,
+                        base_waits,
+                        jitter,
                     )
                     time.sleep(wait_time)
                     continue
 
-                except (httpx.ReadTimeout, httpx.WriteTimeout, httpx.PoolTimeout) as e:
-                    # Timeout error - retry with backoff
-                    last_exception = e
-                    attempt += 1
+                except Exception as e:
+                    # Unknown error - don't retry, log and raise
+                    log.error(
+                        "Unexpected error in {}: {}: {}",
+                        func.__name__,
+                        type(e).__name__,
+                        e,
+                    )
+                    raise
+
+            # Should never reach here, but just in case
+            raise MaxRetriesExceededError(
+                f"Exhausted all {max_retries} retries for {func.__name__}",
+                attempts=attempt,
+                last_error=last_exception,
+            ) from last_exception
 
-                    if attempt > max_retries:
-                        raise MaxRetriesExceededError(
-                            f"Request timeout after {max_retries} retries: {e}",
-                            attempts=attempt,
-                            last_error=e,
-                        ) from e
+        return wrapper
 
-                    wait_time = _calculate_backoff(
-                        attempt, backoff_factor, max_backoff, jitter
-                    )
-                    log.warning(
-                        f"Timeout in {func.__name__} (attempt {attempt}/{max_retries}). "
-                        f"Retrying in {wait_time:.2f}s..."
-                    )
-                    time.sleep(wait_time)
-                    continue
+    return decorator
 
-                except httpx.RequestError as e:
-                    # Generic request error - retry with backoff
-                    last_exception = e
-                    attempt += 1
 
-                    if attempt > max_retries:
-                        raise APIConnectionError(
-                            f"Request failed after {max_retries} retries: {e}",
-                            attempts=attempt,
-                            last_error=e,
-                        ) from e
+def with_async_api_retry(
+    max_retries: int = 3,
+    backoff_factor: float = 2.0,
+    max_backoff: float = 32.0,
+    jitter: bool = True,
+):
+    """
+    Async counterpart of with_api_retry for coroutine methods.
+
+    Applies the same status code handling and backoff schedule as
+    with_api_retry, but waits with asyncio.sleep() so other in-flight
+    requests keep running while this one backs off.
 
-                    wait_time = _calculate_backoff(
-                        attempt, backoff_factor, max_backoff, jitter
-                    )
-                    log.warning(
-                        f"Request error in {func.__name__} (attempt {attempt}/{max_retries}). "
-                        f"Retrying in {wait_time:.2f}s..."
+    Args:
+        max_retries: Maximum number of retry attempts (default: 3)
+        backoff_factor: Multiplier for exponential backoff (default: 2.0)
+        max_backoff: Maximum backoff time in seconds (default: 32.0)
+        jitter: Add random jitter to prevent thundering herd (default: True)
+
+    Returns:
+        Decorated coroutine function with automatic retry logic
+
+    Usage:
+        @with_async_api_retry(max_retries=3, backoff_factor=2.0)
+        async def get_accounts(self):
+            ...
+    """
+
+    base_waits = _backoff_schedule(max_retries, backoff_factor, max_backoff)
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        async def wrapper(*args, **kwargs) -> Any:
+            last_exception = None
+            attempt = 0
+
+            while attempt <= max_retries:
+                try:
+                    result = await func(*args, **kwargs)
+
+                    if attempt > 0:
+                        log.info(
+                            "{} succeeded after {} retries", func.__name__, attempt
+                        )
+
+                    return result
+
+                except (httpx.HTTPStatusError, httpx.RequestError) as e:
+                    last_exception = e
+                    attempt += 1
+                    wait_time = _retry_wait_or_raise(
+                        e,
+                        attempt,
+                        func.__name__,
+                        max_retries,
+                        base_waits,
+                        jitter,
                     )
-                    time.sleep(wait_time)
+                    await asyncio.sleep(wait_time)
                     continue
 
                 except Exception as e:
-                    # Unknown error - don't retry, log and raise
                     log.error(
-                        f"Unexpected error in {func.__name__}: {type(e).__name__}: {e}"
+                        "Unexpected error in {}: {}: {}",
+                        func.__name__,
+                        type(e).__name__,
+                        e,
                     )
                     raise
 
-            # Should never reach here, but just in case
             raise MaxRetriesExceededError(
                 f"Exhausted all {max_retries} retries for {func.__name__}",
                 attempts=attempt,
@@ -236,27 +232,124 @@ def with_api_retry(
     return decorator
 
 
-def _calculate_backoff(
-    attempt: int, backoff_factor: float, max_backoff: float, jitter: bool
+def _retry_wait_or_raise(
+    e: Exception,
+    attempt: int,
+    func_name: str,
+    max_retries: int,
+    base_waits: List[float],
+    jitter: bool,
 ) -> float:
     """
-    Calculate exponential backoff time with optional jitter.
+    Classify an httpx error and decide whether the request should be retried.
 
     Args:
-        attempt: Current attempt number (1-indexed)
+        e: httpx.HTTPStatusError or httpx.RequestError raised by the request
+        attempt: Current attempt number (1-indexed, already incremented)
+        func_name: Name of the wrapped function for logging
+        max_retries: Maximum number of retry attempts
+        base_waits: Precomputed backoff schedule from _backoff_schedule()
+        jitter: Whether to add random jitter
+
+    Returns:
+        Seconds to wait before the next attempt
+
+    Raises:
+        APIAuthenticationError: On 401 responses
+        APIError: On non-retryable status codes
+        MaxRetriesExceededError: When retries are exhausted
+        APIConnectionError: When a generic request error persists
+    """
+    # Classify by exact type: the wrapper only passes HTTPStatusError or a
+    # RequestError, and httpx defines no HTTPStatusError subclasses
+    if type(e) is httpx.HTTPStatusError:
+        status_code = e.response.status_code
+
+        # Handle specific status codes - don't retry, raise immediately
+        handled = HANDLED_STATUS_CODES.get(status_code)
+        if handled:
+            exc_cls, prefix = handled
+            raise exc_cls(
+                f"{prefix} ({status_code}): {e}",
+                status_code=status_code,
+                response_body=response_excerpt(e.response),
+            ) from e
+
+        if status_code not in RETRYABLE_STATUS_CODES:
+            # All other status codes - generic error, don't retry
+            raise APIError(
+                f"HTTP error {status_code}: {e}",
+                status_code=status_code,
+                response_body=response_excerpt(e.response),
+            ) from e
+
+        # Server error - retry with backoff
+        label = f"Server error ({status_code})"
+        if attempt > max_retries:
+            raise MaxRetriesExceededError(
+                f"{label} persisted after {max_retries} retries",
+                attempts=attempt,
+                last_error=e,
+                status_code=status_code,
+            ) from e
+
+    else:
+        # Transport error - retry with backoff
+        labels = RETRYABLE_REQUEST_ERRORS.get(type(e))
+        label = labels[0] if labels else "Request error"
+        if attempt > max_retries:
+            if labels is None:
+                raise APIConnectionError(
+                    f"Request failed after {max_retries} retries: {e}"
+                ) from e
+            raise MaxRetriesExceededError(
+                f"{labels[1]} after {max_retries} retries: {e}",
+                attempts=attempt,
+                last_error=e,
+            ) from e
+
+    wait_time = _calculate_backoff(base_waits[attempt - 1], jitter)
+    log.warning(
+        "{} in {} (attempt {}/{}). Retrying in {:.2f}s...",
+        label,
+        func_name,
+        attempt,
+        max_retries,
+        wait_time,
+    )
+    return wait_time
+
+
+def _backoff_schedule(
+    max_retries: int, backoff_factor: float, max_backoff: float
+) -> List[float]:
+    """
+    Precompute the exponential backoff schedule for a decorator.
+
+    Args:
+        max_retries: Maximum number of retry attempts
         backoff_factor: Exponential backoff multiplier
         max_backoff: Maximum backoff time in seconds
-        jitter: Whether to add random jitter
 
     Returns:
-        Backoff time in seconds
+        List where index (attempt - 1) holds the base wait for that attempt
     """
     # Exponential backoff: backoff_factor ^ (attempt - 1)
-    backoff = min(backoff_factor ** (attempt - 1), max_backoff)
+    return [min(backoff_factor**i, max_backoff) for i in range(max_retries + 1)]
+
+
+def _calculate_backoff(base_wait: float, jitter: bool) -> float:
+    """
+    Apply optional jitter to a precomputed backoff time.
+
+    Args:
+        base_wait: Base backoff time in seconds from the schedule
+        jitter: Whether to add random jitter
 
+    Returns:
+        Backoff time in seconds
+    """
     # Add jitter (random value between 0 and backoff * 0.1)
     if jitter:
-        jitter_amount = random.uniform(0, backoff * 0.1)
-        backoff += jitter_amount
-
-    return backoff
+        return base_wait + random.random() * base_wait * 0.1
+    return base_wait
@@ -4,6 +4,10 @@ This module provides reusable authentication workflows to eliminate duplicated
 login sequences and session context setup across orchestration files.
 """
 
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
+
 from playwright.sync_api import Page
 
 from src.web.pages.login_page import LoginPage
@@ -17,9 +21,10 @@ def authenticate_user(page: Page, screenshot_dir: str) -> LoginPage:
     Perform standard authentication workflow.
 
     This function encapsulates the complete login sequence:
-    1. Navigate to login page
-    2. Submit credentials
+    1. Reuse the session preloaded from Part 1's storage state, if still valid
+    2. Otherwise navigate to login page and submit credentials
     3. Verify successful login
+    4. Save session cookies for cheap recovery
 
     Args:
         page: Playwright Page instance
@@ -34,13 +39,42 @@ def authenticate_user(page: Page, screenshot_dir: str) -> LoginPage:
         ...     login_page = authenticate_user(page, settings.screenshot_dir)
     """
     login_page = LoginPage(page, screenshot_dir)
+
+    # Cookies already in the context come from browser_session's storage
+    # state; if the server still accepts them the login form is skipped
+    login_page.save_session()
+    if login_page.restore_session(settings.base_url):
+        log.info("Login reused from saved storage state")
+        return login_page
+
     login_page.goto(settings.base_url)
     login_page.login(settings.user, settings.password)
     login_page.assert_logged_in()
+    login_page.save_session()
     log.info("Login successful")
     return login_page
 
 
+@lru_cache(maxsize=1)
+def get_session_credentials() -> Mapping[str, str]:
+    """
+    Get the read-only credentials used for session recovery.
+
+    Built once from settings and shared by every page instance; the mapping
+    is immutable, so handing out the same object is safe.
+
+    Returns:
+        Read-only mapping with 'username', 'password', and 'base_url' keys
+    """
+    return MappingProxyType(
+        {
+            "username": settings.user,
+            "password": settings.password,
+            "base_url": settings.base_url,
+        }
+    )
+
+
 def setup_session_context(page_instance: BasePage, login_page: LoginPage) -> None:
     """
     Configure session recovery context for a page instance.
@@ -59,11 +93,7 @@ def setup_session_context(page_instance: BasePage, login_page: LoginPage) -> Non
     """
     page_instance.set_session_context(
         login_page=login_page,
-        credentials={
-            "username": settings.user,
-            "password": settings.password,
-            "base_url": settings.base_url,
-        },
+        credentials=get_session_credentials(),
     )
 
 
@@ -1,5 +1,8 @@
 """Application configuration using Pydantic settings with environment variable support."""
 
+from functools import lru_cache
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -22,30 +25,65 @@ class Settings(BaseSettings):
             screenshot_dir: Path for error screenshots
             trace_dir: Path for Playwright traces
             excel_path: Output path for Excel reports
+            cache_dir: Path for persistent API response and page caches
+            storage_state_path: Browser session saved by Part 1 and reused by
+                Parts 2-5 to skip the login form (owner-only file, deleted
+                by run_all after Part 5)
 
         Orchestration:
             max_login_retries: Maximum login retry attempts
+            scrape_concurrency: Parallel browser sessions for Part 2 and Part 5
+                scraping, and the default for run_many_transfers()
+            page_cache_ttl: Seconds to reuse cached Part 5 category page HTML
+                between runs (0 disables the cache)
+            parallel_parts: Run Parts 2, 3 and 5 concurrently after login
             date_format: Date parsing format string
             filter_start: Transaction filter start date
             filter_end: Transaction filter end date
             api_filter_start: API filter start date
             api_filter_end: API filter end date
+            api_async: Fetch Part 6 API data with the asyncio client
+            api_transactions_batch: Try the non-stock batch transactions
+                endpoint before per-account requests
+            api_cache_ttl: Seconds to reuse cached account details; also
+                enables the transactions cache and reuse of the API token
+                between runs (0 disables all three)
+            api_snapshot_required: Run Part 6 API retrieval even without web
+                data to reconcile against (False skips it)
 
         Transfer Scenario:
             transfer_from: Source account for transfers
             transfer_to: Destination account for transfers
             transfer_amount: Transfer amount
+            transfer_screenshot_policy: When to save the transfer confirmation
+                screenshot ("always", "on_error" or "never"); "api" never
+                takes one and posts the transfer form without rendering it
+            transfer_screenshot_format: "png" (viewport) or "jpeg" (clipped
+                to the confirmation message)
 
         Humanization:
             enable_humanized_behavior: Enable human-like interaction delays
             humanization_level: Interaction speed (fast, normal, slow)
             min_action_delay_ms: Minimum delay between actions
             max_action_delay_ms: Maximum delay between actions
-            typing_speed_ms: Milliseconds per character when typing
+            typing_speed_ms: Milliseconds per character of the pause after humanized typing
 
         Session Management:
             max_session_retries: Maximum retry attempts on session timeout
             enable_session_monitoring: Enable automatic session recovery
+            login_wait_ms: Milliseconds to wait for the page after submitting
+                the login form
+            assert_login_ms: Milliseconds to wait when asserting a login
+
+        Logging:
+            log_diagnose: Include variable values in logged tracebacks
+
+        Debugging:
+            enable_trace: Record a Playwright trace per part into trace_dir
+            trace_screenshots: Include screenshots in recorded traces
+            block_assets: Abort image, media, font, stylesheet and analytics
+                requests (set False for visually faithful traces); never
+                applied to Part 1 or to Part 4 sessions that take screenshots
     """
 
     base_url: str = "https://demo.testfire.net"
@@ -57,20 +95,31 @@ class Settings(BaseSettings):
     screenshot_dir: str = "artifacts/screenshots"
     trace_dir: str = "artifacts/traces"
     excel_path: str = "artifacts/outputs/Altoro_Report.xlsx"
+    cache_dir: str = "artifacts/cache"
+    storage_state_path: str = "artifacts/cache/storage_state.json"  # Part 1 login
 
     # orchestrator knobs
     max_login_retries: int = 3
+    scrape_concurrency: int = 1  # Browser sessions scraping accounts/products at once
+    page_cache_ttl: int = 0  # Cached product category pages; 0 = always fetch
+    parallel_parts: bool = False  # Parts 2, 3 and 5 in their own browsers at once
     date_format: str = "%Y-%m-%d"  # Format for transaction dates (yyyy-mm-dd)
     transaction_time_format: str = "%Y-%m-%d %H:%M"  # Format for transaction timestamps
     filter_start: str = "2025-02-01"  # Transaction filter start date (yyyy-mm-dd)
     filter_end: str = "2025-04-15"  # Transaction filter end date (yyyy-mm-dd)
     api_filter_start: str = "2025-02-01"
     api_filter_end: str = "2025-04-15"
+    api_async: bool = False  # asyncio client instead of worker threads for Part 6
+    api_transactions_batch: bool = False  # Batch endpoint isn't in the stock API
+    api_cache_ttl: int = 0  # Cached account details incl. balances; 0 = always fetch
+    api_snapshot_required: bool = True  # False skips Part 6 without web data
 
     # transfer scenario
     transfer_from: str = "800002 Savings"
     transfer_to: str = "800003 Checking"
     transfer_amount: float = 250.00
+    transfer_screenshot_policy: Literal["always", "on_error", "never", "api"] = "always"
+    transfer_screenshot_format: Literal["png", "jpeg"] = "png"  # jpeg: clipped
 
     # humanization settings
     enable_humanized_behavior: bool = False
@@ -82,8 +131,34 @@ class Settings(BaseSettings):
     # session management settings
     max_session_retries: int = 2  # Maximum retries on session timeout
     enable_session_monitoring: bool = True  # Enable automatic session recovery
+    login_wait_ms: int = 5000  # Lower fails fast, higher tolerates slow servers
+    assert_login_ms: int = 7000  # Login assertion (verification) timeout
+
+    # logging settings
+    log_diagnose: bool = False  # Variable-annotated tracebacks (slow, may leak values)
+
+    # debugging settings
+    enable_trace: bool = False  # Playwright tracing (slow, large files)
+    trace_screenshots: bool = False  # Screenshots are the costliest trace content
+    block_assets: bool = True  # Scrapers read text only; skip images, CSS, fonts
+
+    model_config = SettingsConfigDict(
+        env_file=".env", env_prefix="ALTORO_", env_file_encoding="utf-8"
+    )
+
 
-    model_config = SettingsConfigDict(env_file=".env", env_prefix="ALTORO_")
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Get the process-wide Settings instance.
+
+    The .env file is read and validated on the first call only; later calls
+    return the cached instance. Call get_settings.cache_clear() to reload.
+
+    Returns:
+        Shared Settings instance
+    """
+    return Settings()
 
 
-settings = Settings()
+settings = get_settings()
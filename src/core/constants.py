@@ -4,6 +4,8 @@ This module centralizes all magic numbers, hard-coded strings, and configuration
 constants used throughout the application for easy maintenance and consistency.
 """
 
+import re
+
 # Excel Sheet Names
 
 SHEET_ACCOUNT_SUMMARY = "Account_Summary"
@@ -44,6 +46,16 @@ TRANSACTION_DISPLAY_COLUMNS = [
 ]
 """Standard column order for transaction sheets"""
 
+TRANSACTION_FIELDS = [
+    "transaction_id",
+    "transaction_time",
+    "account_id",
+    "action",
+    "debit",
+    "credit",
+]
+"""Scraped transaction fields shown in TRANSACTION_DISPLAY_COLUMNS, in order"""
+
 ACCOUNT_SUMMARY_COLUMNS = [
     "Account ID/Number",
     "Account Name/Type",
@@ -52,6 +64,39 @@ ACCOUNT_SUMMARY_COLUMNS = [
 ]
 """Standard column order for account summary sheet"""
 
+PRODUCT_COLUMNS = [
+    "Section",
+    "Category",
+    "Product Name",
+    "Description",
+    "Features",
+    "Promotions",
+    "Terms",
+]
+"""Column order for product catalog sheet; product rows are tuples in this order"""
+
+API_ACCOUNT_COLUMNS = [
+    "account_id",
+    "account_name",
+    "account_type",
+    "balance",
+    "available_balance",
+    "api_source",
+]
+"""Column order for accounts retrieved via the REST API (Part 6)"""
+
+API_TRANSACTION_COLUMNS = [
+    "account_id",
+    "transaction_id",
+    "transaction_date",
+    "description",
+    "debit",
+    "credit",
+    "amount",
+    "api_source",
+]
+"""Column order for transactions retrieved via the REST API (Part 6)"""
+
 API_SOURCE_ACCOUNT_LIST = "GET /api/account"
 """API source identifier for account list endpoint"""
 
@@ -61,6 +106,15 @@ API_SOURCE_ACCOUNT_DETAILS = "GET /api/account/{accountNo}"
 API_SOURCE_TRANSACTIONS_POST = "POST /api/account/{accountNo}/transactions"
 """API source identifier for date-filtered transactions endpoint"""
 
+API_MAX_WORKERS = 16
+"""Maximum worker threads for concurrent per-account API requests"""
+
+API_TRANSACTIONS_BATCH_SIZE = 25
+"""Maximum accounts per batch transactions request"""
+
+API_LIVE_TRANSACTIONS_CACHE_TTL = 300
+"""Seconds to cache transactions for date ranges that end today or later"""
+
 # Session Management
 
 DEFAULT_MAX_RETRIES = 2
@@ -76,6 +130,12 @@ SESSION_ERROR_KEYWORDS = [
 ]
 """Keywords in error messages that indicate a session/timeout issue"""
 
+SESSION_ERROR_PATTERN = re.compile(
+    "|".join(re.escape(keyword) for keyword in SESSION_ERROR_KEYWORDS),
+    re.IGNORECASE,
+)
+"""Compiled alternation of SESSION_ERROR_KEYWORDS for single-pass matching"""
+
 
 # HTML Selectors
 # Note: These are kept as reference. Actual selectors are in page classes
@@ -4,15 +4,19 @@ This module provides reusable DataFrame operations used across orchestration fil
 including column normalization, aggregation, and summary calculations.
 """
 
-from typing import List, Tuple
+import re
+from functools import lru_cache
+from typing import List, Pattern, Sequence, Tuple
+import numpy as np
 import pandas as pd
+from pandas.api.types import union_categoricals
 
 from src.core.logger import log
 from src.core.constants import VARIANCE_TOLERANCE
 
 
 def normalize_column_names(
-    df: pd.DataFrame, mapping_rules: List[Tuple[List[str], str]]
+    df: pd.DataFrame, mapping_rules: Sequence[Tuple[Sequence[str], str]]
 ) -> pd.DataFrame:
     """
     Normalize DataFrame column names based on keyword matching rules.
@@ -38,11 +42,16 @@ def normalize_column_names(
         # "Account ID/Number" → "account_id"
         # "Total Balance" → "total_balance"
     """
+    rules, any_keyword = _compile_mapping_rules(
+        tuple((tuple(keywords), target_name) for keywords, target_name in mapping_rules)
+    )
     column_mapping = {}
 
     for col in df.columns:
         col_lower = col.lower()
-        for keywords, target_name in mapping_rules:
+        if not any_keyword.search(col_lower):
+            continue
+        for keywords, target_name in rules:
             # Check if ALL keywords are present in column name
             if all(keyword in col_lower for keyword in keywords):
                 column_mapping[col] = target_name
@@ -50,11 +59,69 @@ def normalize_column_names(
 
     if column_mapping:
         df = df.rename(columns=column_mapping)
-        log.info(f"    Normalized columns: {column_mapping}")
+        log.info("    Normalized columns: {}", column_mapping)
 
     return df
 
 
+@lru_cache(maxsize=32)
+def _compile_mapping_rules(
+    mapping_rules: Tuple[Tuple[Tuple[str, ...], str], ...],
+) -> Tuple[Tuple[Tuple[Tuple[str, ...], str], ...], Pattern]:
+    """
+    Prepare normalize_column_names() rules once per distinct rule set.
+
+    Args:
+        mapping_rules: Hashable (keywords, target_name) rules
+
+    Returns:
+        Tuple of (rules with lowercased keywords, regex matching any keyword)
+    """
+    # Lowercase keywords once so matching is case-insensitive on both sides
+    rules = tuple(
+        (tuple(keyword.lower() for keyword in keywords), target_name)
+        for keywords, target_name in mapping_rules
+    )
+    # One regex pass rejects columns containing no rule keyword at all
+    any_keyword = re.compile(
+        "|".join(re.escape(keyword) for keywords, _ in rules for keyword in keywords)
+    )
+    return rules, any_keyword
+
+
+def categorize_keys(
+    left: pd.DataFrame, right: pd.DataFrame, key: str = "account_id"
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Convert a join key to one shared categorical dtype on both DataFrames.
+
+    Merges and groupbys on matching categoricals hash the integer codes
+    instead of the strings. Categories are sorted, so outer merges keep
+    the same lexicographic key order as on plain strings.
+
+    Args:
+        left: First DataFrame with the key column
+        right: Second DataFrame with the key column
+        key: Column to convert (default: "account_id")
+
+    Returns:
+        Tuple of (left, right) shallow copies with the converted key column
+
+    Example:
+        >>> api_df, web_df = categorize_keys(api_df, web_df)
+        >>> merged = pd.merge(api_df, web_df, on="account_id", how="outer")
+    """
+    dtype = pd.CategoricalDtype(
+        union_categoricals(
+            [pd.Categorical(left[key]), pd.Categorical(right[key])],
+            sort_categories=True,
+        ).categories
+    )
+    left = _with_column(left, key, left[key].astype(dtype))
+    right = _with_column(right, key, right[key].astype(dtype))
+    return left, right
+
+
 def calculate_net_amount(
     df: pd.DataFrame,
     credit_col: str = "credit",
@@ -77,9 +144,7 @@ def calculate_net_amount(
         >>> df = calculate_net_amount(transactions_df)
         # Adds column: net_amount = credit - debit
     """
-    df = df.copy()
-    df[result_col] = df[credit_col] - df[debit_col]
-    return df
+    return _with_column(df, result_col, df[credit_col] - df[debit_col])
 
 
 def group_and_sum_by_account(
@@ -101,7 +166,8 @@ def group_and_sum_by_account(
         count_col: Column to count for transaction count (default: "transaction_id")
 
     Returns:
-        Grouped DataFrame with totals and transaction count
+        Grouped DataFrame with totals and transaction count, one row per
+        account in order of first appearance
 
     Example:
         >>> summary = group_and_sum_by_account(
@@ -113,20 +179,14 @@ def group_and_sum_by_account(
     if sum_cols is None:
         sum_cols = ["debit", "credit"]
 
-    # Build aggregation dictionary
-    agg_dict = {col: "sum" for col in sum_cols}
-    agg_dict[count_col] = "count"
-
-    result = df.groupby(group_col).agg(agg_dict).reset_index()
+    # Named aggregations produce the final column names directly
+    aggregations = {col: pd.NamedAgg(column=col, aggfunc="sum") for col in sum_cols}
+    aggregations["transaction_count"] = pd.NamedAgg(column=count_col, aggfunc="count")
 
-    # Rename count column to transaction_count
-    col_names = list(result.columns)
-    for i, col in enumerate(col_names):
-        if col == count_col:
-            col_names[i] = "transaction_count"
-    result.columns = col_names
-
-    return result
+    # sort=False skips sorting the group keys; rows keep first-seen account order
+    return df.groupby(group_col, sort=False, observed=True, as_index=False).agg(
+        **aggregations
+    )
 
 
 def calculate_variance(
@@ -139,7 +199,8 @@ def calculate_variance(
     """
     Calculate variance between two columns.
 
-    Computes col1 - col2 for each row, handling None/NaN values gracefully.
+    Computes col1 - col2 for each row, handling None/NaN values gracefully:
+    rows where either value is missing (or a column is absent) get NaN.
 
     Args:
         df: Source DataFrame
@@ -159,20 +220,89 @@ def calculate_variance(
         ...     result_col="balance_variance"
         ... )
     """
-    df = df.copy()
+    # Vectorized subtraction: None/NaN in either column propagates as NaN
+    return _with_column(
+        df, result_col, _numeric_values(df, col1) - _numeric_values(df, col2)
+    )
 
-    df[result_col] = df.apply(
-        lambda row: (
-            row.get(col1, 0) - row.get(col2, 0)
-            if pd.notna(row.get(col1)) and pd.notna(row.get(col2))
-            else None
-        ),
-        axis=1,
+
+def calculate_variances(
+    df: pd.DataFrame, pairs: Sequence[Tuple[str, str, str]]
+) -> pd.DataFrame:
+    """
+    Calculate several column variances in one vectorized subtraction.
+
+    Same result as calling calculate_variance() once per pair, but both
+    sides are gathered into 2-D float arrays and subtracted in one pass.
+
+    Args:
+        df: Source DataFrame
+        pairs: (col1, col2, result_col) tuples; each result is col1 - col2
+
+    Returns:
+        DataFrame with the variance columns added, in pair order
+
+    Example:
+        >>> df = calculate_variances(
+        ...     reconciliation_df,
+        ...     [
+        ...         ("balance", "balance_web", "balance_variance"),
+        ...         ("available_balance", "available_balance_web", "available_variance"),
+        ...     ],
+        ... )
+    """
+    # reindex turns absent columns into NaN, matching calculate_variance
+    left = df.reindex(columns=[col1 for col1, _, _ in pairs]).to_numpy(
+        dtype=float, na_value=np.nan
+    )
+    right = df.reindex(columns=[col2 for _, col2, _ in pairs]).to_numpy(
+        dtype=float, na_value=np.nan
     )
+    variances = left - right
 
+    df = df.copy(deep=False)
+    for i, (_, _, result_col) in enumerate(pairs):
+        df[result_col] = variances[:, i]
     return df
 
 
+def _with_column(df: pd.DataFrame, col: str, values) -> pd.DataFrame:
+    """
+    Return a copy of df with one column added, leaving df unchanged.
+
+    Args:
+        df: Source DataFrame
+        col: Name of the column to add or replace
+        values: Column values aligned with df's rows
+
+    Returns:
+        New DataFrame sharing the existing column data with df
+
+    Note:
+        A shallow copy is enough: adding a column never writes into the
+        existing column buffers, so they are shared instead of duplicated.
+    """
+    df = df.copy(deep=False)
+    df[col] = values
+    return df
+
+
+def _numeric_values(df: pd.DataFrame, col: str) -> np.ndarray:
+    """
+    Get a column as a float array, with None and missing columns as NaN.
+
+    Args:
+        df: Source DataFrame
+        col: Column name
+
+    Returns:
+        Float64 NumPy array aligned with df's rows
+    """
+    if col not in df.columns:
+        return np.full(len(df), np.nan)
+    return df[col].to_numpy(dtype=float, na_value=np.nan)
+
+
 def add_match_status(
     df: pd.DataFrame,
     variance_col: str,
@@ -207,16 +337,13 @@ def add_match_status(
         ...     tolerance=0.01
         ... )
     """
-    df = df.copy()
-
-    def determine_status(variance):
-        if variance is None or pd.isna(variance):
-            return missing_label
-        elif abs(variance) < tolerance:
-            return match_label
-        else:
-            return variance_label
-
-    df[status_col] = df[variance_col].apply(determine_status)
-
-    return df
+    variance = _numeric_values(df, variance_col)
+    return _with_column(
+        df,
+        status_col,
+        np.select(
+            [np.isnan(variance), np.abs(variance) < tolerance],
+            [missing_label, match_label],
+            default=variance_label,
+        ),
+    )
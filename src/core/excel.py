@@ -1,12 +1,42 @@
 """Excel writer with auto-formatting for financial data."""
 
 import os
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence
 import pandas as pd
 from openpyxl.utils import get_column_letter
 from openpyxl.styles import Font, PatternFill, Alignment
 from pathlib import Path
 
 
+# xlsxwriter workbook options: constant_memory flushes each row to disk once
+# the next row starts, so rows must be written in order (see write_df)
+XLSX_OPTIONS = {
+    "constant_memory": True,
+    "default_date_format": "yyyy-mm-dd hh:mm:ss",
+}
+
+# One lock per workbook path, held by each ExcelWriter from open to close, so
+# parts running in parallel threads never interleave their load/save cycles
+_workbook_locks: Dict[str, threading.RLock] = {}
+_workbook_locks_guard = threading.Lock()
+
+
+def _workbook_lock(path: str) -> threading.RLock:
+    """
+    Get the lock serializing writers of one workbook file.
+
+    Args:
+        path: Workbook file path
+
+    Returns:
+        Lock shared by every ExcelWriter for the same absolute path
+    """
+    with _workbook_locks_guard:
+        return _workbook_locks.setdefault(os.path.abspath(path), threading.RLock())
+
+
 class ExcelWriter:
     """
     Excel writer that automatically formats columns and prevents scientific notation.
@@ -16,7 +46,8 @@ class ExcelWriter:
     - Formats monetary columns with thousands separators
     - Displays negative numbers in parentheses
     - Prevents scientific notation for large numbers
-    - Appends to existing files, preserving other sheets
+    - Writes new files with xlsxwriter for speed
+    - Appends to existing files with openpyxl, preserving other sheets
     - Replaces sheet if same name already exists
     - Header row styling (bold, blue background, white text)
     - Freeze panes at header row for easy scrolling
@@ -32,12 +63,21 @@ class ExcelWriter:
     MAX_COLUMN_WIDTH = 75  # Maximum column width in characters
     COLUMN_PADDING = 2  # Extra padding added to column width
 
+    # Rows converted and written per batch on the xlsxwriter path
+    WRITE_CHUNK_ROWS = 10_000
+
     # Number format strings for Excel
     MONETARY_FORMAT = "#,##0.00;(#,##0.00)"  # Currency with 2 decimals, comma separator, negatives in parentheses
     NUMERIC_FORMAT = "#,##0"  # Integer with comma separator
 
+    # Python format specs used to measure numeric widths, by NumPy dtype kind
+    WIDTH_FORMAT_SPECS = {"f": ",.2f", "i": ",", "u": ","}
+
     # Keywords to identify monetary columns
     MONETARY_KEYWORDS = ["amount", "balance", "total", "credit", "debit"]
+    MONETARY_PATTERN = re.compile(
+        "|".join(map(re.escape, MONETARY_KEYWORDS)), re.IGNORECASE
+    )
 
     def __init__(self, path: str) -> None:
         """
@@ -49,22 +89,42 @@ class ExcelWriter:
         Note:
             Creates parent directories if they don't exist.
             Opens file in append mode if it exists, preserving other sheets.
-            Opens file in write mode if it doesn't exist yet.
+            Opens file in write mode (xlsxwriter) if it doesn't exist yet.
             Replaces sheet if same name already exists in the file.
+            Blocks while another writer has the same file open; close()
+            must be called (excel_writer_context does this) to release it.
         """
         Path(path).parent.mkdir(parents=True, exist_ok=True)
         self.path = path
+        self._lock = _workbook_lock(path)
+        self._lock.acquire()
+        try:
+            self._open(path)
+        except BaseException:
+            self._lock.release()
+            raise
 
-        # Use append mode if file exists, otherwise write mode
-        file_mode = "a" if os.path.exists(path) else "w"
+    def _open(self, path: str) -> None:
+        """
+        Open the pandas ExcelWriter for a new or existing workbook.
 
-        # if_sheet_exists is only valid in append mode
-        if file_mode == "a":
+        Args:
+            path: Workbook file path
+        """
+        # New workbooks are written with xlsxwriter, which serializes much
+        # faster than openpyxl. Existing workbooks need openpyxl, the only
+        # engine that can append while preserving other sheets (write-only
+        # mode can't load them); it saves through lxml's incremental
+        # serializer when lxml is installed.
+        if os.path.exists(path):
             self.writer = pd.ExcelWriter(
-                path, engine="openpyxl", mode=file_mode, if_sheet_exists="replace"
+                path, engine="openpyxl", mode="a", if_sheet_exists="replace"
             )
         else:
-            self.writer = pd.ExcelWriter(path, engine="openpyxl", mode=file_mode)
+            self.writer = pd.ExcelWriter(
+                path, engine="xlsxwriter", engine_kwargs={"options": XLSX_OPTIONS}
+            )
+        self._xlsx_formats = {}
 
     def write_df(self, sheet: str, df: pd.DataFrame) -> None:
         """
@@ -83,8 +143,227 @@ class ExcelWriter:
         - Freeze panes at header row
         - Auto-filter enabled on all columns
         """
-        # Write DataFrame to sheet
-        df.to_excel(self.writer, index=False, sheet_name=sheet)
+        number_formats = self._number_formats(df)
+        self._write_sheet(
+            sheet,
+            list(df.columns),
+            self._frame_rows(df),
+            [self._column_width(col, self._data_width(df[col])) for col in df.columns],
+            [number_formats.get(col) for col in df.columns],
+        )
+
+    def write_dict_row(self, sheet: str, row: Mapping[str, Any]) -> None:
+        """
+        Write a single record to an Excel sheet with write_df's formatting.
+
+        Cheaper than write_df for one-row reports: the header, widths and
+        number formats come straight from the mapping, without building a
+        DataFrame.
+
+        Args:
+            sheet: Name of the Excel sheet to create
+            row: Column header to value mapping, in column order
+        """
+        widths = []
+        number_formats = []
+        for col, value in row.items():
+            # Numbers (including bools, as with pandas' numeric dtypes) get
+            # the same formats and width measurement as write_df columns
+            if isinstance(value, (int, float)):
+                number_formats.append(
+                    self.MONETARY_FORMAT
+                    if self.MONETARY_PATTERN.search(str(col))
+                    else self.NUMERIC_FORMAT
+                )
+                spec = self.WIDTH_FORMAT_SPECS["f" if isinstance(value, float) else "i"]
+                data_width = len(format(value, spec))
+            else:
+                number_formats.append(None)
+                data_width = 0 if value is None else len(str(value))
+            widths.append(self._column_width(col, data_width))
+
+        self._write_sheet(
+            sheet, list(row), [tuple(row.values())], widths, number_formats
+        )
+
+    def write_header_only(self, sheet: str, columns: Sequence[Any]) -> None:
+        """
+        Write a sheet holding only a styled header row.
+
+        Produces the same sheet as write_df with an empty DataFrame of these
+        columns, without building one.
+
+        Args:
+            sheet: Name of the Excel sheet to create
+            columns: Column headers, in order
+        """
+        self._write_sheet(
+            sheet,
+            list(columns),
+            [],
+            [self._column_width(col, 0) for col in columns],
+            [None] * len(columns),
+        )
+
+    def _write_sheet(
+        self,
+        sheet: str,
+        columns: List[Any],
+        rows: Iterable[Sequence[Any]],
+        widths: List[int],
+        number_formats: List[Optional[str]],
+    ) -> None:
+        """
+        Write rows to a sheet with the engine the workbook was opened with.
+
+        Args:
+            sheet: Name of the sheet to create
+            columns: Column headers
+            rows: Row value tuples, with None for empty cells
+            widths: Column widths in characters
+            number_formats: Number format per column, None to leave it General
+        """
+        if self.writer.engine == "xlsxwriter":
+            self._write_xlsxwriter_sheet(sheet, columns, rows, widths, number_formats)
+        else:
+            self._append_openpyxl_rows(sheet, columns, rows)
+            self._format_openpyxl_sheet(sheet, columns, widths, number_formats)
+
+    @classmethod
+    def _frame_rows(cls, df: pd.DataFrame) -> Iterable[tuple]:
+        """
+        Yield DataFrame rows as plain tuples, converted in batches.
+
+        Only one WRITE_CHUNK_ROWS batch of converted rows is held in memory
+        at a time.
+
+        Args:
+            df: DataFrame being written
+
+        Yields:
+            Row value tuples, with None for missing values
+        """
+        for start in range(0, len(df), cls.WRITE_CHUNK_ROWS):
+            chunk = df.iloc[start : start + cls.WRITE_CHUNK_ROWS]
+            # Missing values (NaN/NaT/None) become empty cells, as with to_excel
+            values = chunk.astype(object).where(chunk.notna(), None)
+            yield from values.itertuples(index=False, name=None)
+
+    def _write_xlsxwriter_sheet(
+        self,
+        sheet: str,
+        columns: List[Any],
+        rows: Iterable[Sequence[Any]],
+        widths: List[int],
+        number_formats: List[Optional[str]],
+    ) -> None:
+        """
+        Write and format a sheet of a new xlsxwriter workbook.
+
+        Widths and number formats are set once per column with set_column(),
+        which xlsxwriter applies to every data cell in that column. Rows are
+        written strictly top to bottom, as the workbook's constant_memory
+        mode requires.
+
+        Args:
+            sheet: Name of the sheet to create
+            columns: Column headers
+            rows: Row value tuples, with None for empty cells
+            widths: Column widths in characters
+            number_formats: Number format per column, None to leave it General
+        """
+        ws = self.writer.book.add_worksheet(sheet)
+        header_format = self._xlsx_format(
+            "header",
+            {
+                "bold": True,
+                "font_color": "#FFFFFF",
+                "bg_color": "#366092",
+                "pattern": 1,
+                "align": "center",
+                "valign": "vcenter",
+            },
+        )
+
+        for i, (width, number_format) in enumerate(zip(widths, number_formats)):
+            column_format = (
+                self._xlsx_format(number_format, {"num_format": number_format})
+                if number_format
+                else None
+            )
+            ws.set_column(i, i, width, column_format)
+
+        # Freeze panes at row 2 (freezes header row)
+        ws.freeze_panes(1, 0)
+
+        ws.write_row(0, 0, [str(col) for col in columns], header_format)
+
+        row_count = 0
+        for row_count, row in enumerate(rows, 1):
+            ws.write_row(row_count, 0, row)
+
+        # Add auto-filter to all columns
+        if row_count > 0:  # Only add filter if there's data
+            ws.autofilter(0, 0, row_count, len(columns) - 1)
+
+    def _xlsx_format(self, key: str, properties: dict):
+        """
+        Get a workbook-level xlsxwriter format, creating it on first use.
+
+        Args:
+            key: Cache key for the format
+            properties: xlsxwriter format properties
+
+        Returns:
+            xlsxwriter Format shared by every sheet in this workbook
+        """
+        if key not in self._xlsx_formats:
+            self._xlsx_formats[key] = self.writer.book.add_format(properties)
+        return self._xlsx_formats[key]
+
+    def _append_openpyxl_rows(
+        self, sheet: str, columns: List[Any], rows: Iterable[Sequence[Any]]
+    ) -> None:
+        """
+        Write rows to an openpyxl sheet as plain tuples.
+
+        Replaces the sheet in place if it already exists. Rows are appended
+        directly instead of going through to_excel(), which styles every
+        cell individually before formatting is applied.
+
+        Args:
+            sheet: Name of the sheet to (re)create
+            columns: Column headers
+            rows: Row value tuples, with None for empty cells
+        """
+        book = self.writer.book
+        if sheet in book.sheetnames:
+            index = book.sheetnames.index(sheet)
+            book.remove(book[sheet])
+            ws = book.create_sheet(sheet, index)
+        else:
+            ws = book.create_sheet(sheet)
+
+        ws.append(columns)
+        for row in rows:
+            ws.append(row)
+
+    def _format_openpyxl_sheet(
+        self,
+        sheet: str,
+        columns: List[Any],
+        widths: List[int],
+        number_formats: List[Optional[str]],
+    ) -> None:
+        """
+        Apply write_df formatting to a sheet of an appended openpyxl workbook.
+
+        Args:
+            sheet: Name of the sheet just written
+            columns: Column headers
+            widths: Column widths in characters
+            number_formats: Number format per column, None to leave it General
+        """
         ws = self.writer.book[sheet]
 
         # Define header styling
@@ -94,70 +373,107 @@ class ExcelWriter:
         )
         header_alignment = Alignment(horizontal="center", vertical="center")
 
-        # Auto-adjust column widths based on BOTH header AND data content
-        for i, col in enumerate(df.columns, 1):
+        max_row = ws.max_row
+
+        # Single pass per column: width, header style, then number format
+        for i, (width, number_format) in enumerate(zip(widths, number_formats), 1):
             col_letter = get_column_letter(i)
 
-            # Calculate header width
-            header_width = len(str(col))
-
-            # Calculate maximum data width in this column
-            max_data_width = 0
-            for row in range(2, ws.max_row + 1):
-                cell = ws[f"{col_letter}{row}"]
-                if cell.value is not None:
-                    # For numbers, estimate formatted length with commas/decimals
-                    if isinstance(cell.value, (int, float)):
-                        # Estimate formatted string length (e.g., 1234567.89 → "1,234,567.89")
-                        if isinstance(cell.value, float):
-                            formatted_length = len(f"{cell.value:,.2f}")
-                        else:
-                            formatted_length = len(f"{cell.value:,}")
-                        max_data_width = max(max_data_width, formatted_length)
-                    else:
-                        # For strings and other types, use actual length
-                        max_data_width = max(max_data_width, len(str(cell.value)))
-
-            # Use the larger of header or data width, plus padding
-            calculated_width = max(header_width, max_data_width) + self.COLUMN_PADDING
-            final_width = max(
-                self.MIN_COLUMN_WIDTH, min(self.MAX_COLUMN_WIDTH, calculated_width)
-            )
-            ws.column_dimensions[col_letter].width = final_width
+            # Width already fits BOTH header AND data content
+            ws.column_dimensions[col_letter].width = width
 
             # Apply header styling to first row
-            header_cell = ws[f"{col_letter}1"]
+            header_cell = ws.cell(row=1, column=i)
             header_cell.font = header_font
             header_cell.fill = header_fill
             header_cell.alignment = header_alignment
 
+            # Format numeric columns to prevent scientific notation
+            if number_format is None:
+                continue
+
+            # Apply format to all data cells in this column (skip header row).
+            # iter_cols walks the cells directly instead of parsing an A1
+            # coordinate per row; openpyxl only honours per-cell formats,
+            # so a column-dimension default would not reach written cells.
+            for column_cells in ws.iter_cols(
+                min_col=i, max_col=i, min_row=2, max_row=max_row
+            ):
+                for cell in column_cells:
+                    cell.number_format = number_format
+
         # Freeze panes at row 2 (freezes header row)
         ws.freeze_panes = "A2"
 
         # Add auto-filter to all columns
-        if ws.max_row > 1:  # Only add filter if there's data
-            ws.auto_filter.ref = f"A1:{get_column_letter(ws.max_column)}{ws.max_row}"
+        if max_row > 1:  # Only add filter if there's data
+            ws.auto_filter.ref = f"A1:{get_column_letter(ws.max_column)}{max_row}"
 
-        # Format numeric columns to prevent scientific notation
-        for i, col in enumerate(df.columns, 1):
-            col_letter = get_column_letter(i)
+    def _column_width(self, col, data_width: int) -> int:
+        """
+        Calculate a column width from its header and data content.
 
-            # Check if column contains numeric data
-            if pd.api.types.is_numeric_dtype(df[col]):
-                # Determine if this is a monetary column
-                is_monetary = any(
-                    keyword in col.lower() for keyword in self.MONETARY_KEYWORDS
-                )
+        Args:
+            col: Column header
+            data_width: Width of the widest value (see _data_width)
 
-                # Select appropriate number format
-                number_format = (
-                    self.MONETARY_FORMAT if is_monetary else self.NUMERIC_FORMAT
-                )
+        Returns:
+            Width in characters, padded and clamped to the min/max widths
+        """
+        # Use the larger of header or data width, plus padding
+        calculated_width = max(len(str(col)), data_width) + self.COLUMN_PADDING
+        return max(self.MIN_COLUMN_WIDTH, min(self.MAX_COLUMN_WIDTH, calculated_width))
 
-                # Apply format to all data cells in this column (skip header row)
-                for row in range(2, ws.max_row + 1):
-                    cell = ws[f"{col_letter}{row}"]
-                    cell.number_format = number_format
+    def _number_formats(self, df: pd.DataFrame) -> Dict[Any, str]:
+        """
+        Select number formats for the numeric columns of a DataFrame.
+
+        Args:
+            df: DataFrame being written
+
+        Returns:
+            Mapping of column to MONETARY_FORMAT (numeric columns named like
+            money) or NUMERIC_FORMAT (other numeric columns). Non-numeric
+            columns are absent, so their headers are never scanned.
+        """
+        return {
+            col: (
+                self.MONETARY_FORMAT
+                if self.MONETARY_PATTERN.search(str(col))
+                else self.NUMERIC_FORMAT
+            )
+            for col, dtype in df.dtypes.items()
+            if pd.api.types.is_numeric_dtype(dtype)
+        }
+
+    @classmethod
+    def _data_width(cls, series: pd.Series) -> int:
+        """
+        Estimate the widest displayed value in a column.
+
+        Args:
+            series: Column data as written to the sheet
+
+        Returns:
+            Character width of the longest formatted value (0 if all empty)
+
+        Note:
+            Numbers are measured as formatted with thousands separators
+            (e.g., 1234567.89 → "1,234,567.89"). The formatted length only
+            grows with magnitude, so measuring the column's min and max is
+            enough instead of formatting every value.
+        """
+        values = series.dropna()
+        if values.empty:
+            return 0
+
+        # Format spec chosen once from the dtype, never per value
+        spec = cls.WIDTH_FORMAT_SPECS.get(values.dtype.kind)
+        if spec is not None:
+            return max(len(format(values.min(), spec)), len(format(values.max(), spec)))
+
+        # Strings and other types use their actual length
+        return int(values.astype(str).str.len().max())
 
     def close(self) -> None:
         """
@@ -165,4 +481,7 @@ class ExcelWriter:
 
         Must be called after all DataFrames have been written.
         """
-        self.writer.close()
+        try:
+            self.writer.close()
+        finally:
+            self._lock.release()
@@ -5,7 +5,7 @@ the repetitive pattern of creating ExcelWriter, writing DataFrames, and closing.
 """
 
 from contextlib import contextmanager
-from typing import Generator
+from typing import Generator, Optional
 from pathlib import Path
 import pandas as pd
 
@@ -46,7 +46,38 @@ def excel_writer_context(
         yield writer
     finally:
         writer.close()
-        log.info(f"Excel file written: {file_path}")
+        log.info("Excel file written: {}", file_path)
+
+
+@contextmanager
+def shared_writer_context(
+    file_path: str, shared_writer: Optional[ExcelWriter] = None
+) -> Generator[ExcelWriter, None, None]:
+    """
+    Context manager yielding a run-wide writer, or a writer of its own.
+
+    Lets a part write into the ExcelWriter that run_all keeps open across
+    parts, so the workbook is loaded and saved once per run, while still
+    working standalone.
+
+    Args:
+        file_path: Path to Excel file, used when no shared writer is given
+        shared_writer: Open ExcelWriter owned (and closed) by the caller
+
+    Yields:
+        shared_writer if given, otherwise a writer from excel_writer_context
+        that is closed on exit
+
+    Example:
+        >>> with shared_writer_context(settings.excel_path, shared_writer) as writer:
+        ...     writer.write_df("Sheet1", df1)
+    """
+    if shared_writer is not None:
+        yield shared_writer
+        return
+
+    with excel_writer_context(file_path) as writer:
+        yield writer
 
 
 def write_single_sheet(
@@ -78,7 +109,7 @@ def write_single_sheet(
     with excel_writer_context(file_path, ensure_dir) as writer:
         writer.write_df(sheet_name, dataframe)
         if log_details:
-            log.info(f"Wrote {sheet_name} sheet ({len(dataframe)} rows)")
+            log.info("Wrote {} sheet ({} rows)", sheet_name, len(dataframe))
 
 
 def write_multiple_sheets(
@@ -87,6 +118,17 @@ def write_multiple_sheets(
     """
     Write multiple DataFrames to different sheets in one Excel file.
 
+    All sheets go through one ExcelWriter, so the workbook is opened and
+    saved once regardless of the number of sheets.
+
+    Note:
+        Sheets are written serially on purpose. Writing them to separate
+        workbooks in threads and merging afterwards does not pay off here:
+        openpyxl cannot copy worksheets between workbooks (copy_worksheet
+        is same-workbook only, and a cell-by-cell copy would cost more than
+        the write), and the formatting work is pure Python and holds the
+        GIL. New workbooks are already written with xlsxwriter.
+
     Args:
         file_path: Path to Excel file
         sheets: Dictionary mapping sheet names to DataFrames
@@ -105,4 +147,4 @@ def write_multiple_sheets(
     with excel_writer_context(file_path, ensure_dir) as writer:
         for sheet_name, dataframe in sheets.items():
             writer.write_df(sheet_name, dataframe)
-            log.info(f"Wrote {sheet_name} sheet ({len(dataframe)} rows)")
+            log.info("Wrote {} sheet ({} rows)", sheet_name, len(dataframe))
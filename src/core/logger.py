@@ -3,13 +3,22 @@
 from loguru import logger
 from pathlib import Path
 
+from src.core.config import settings
+
 # Create logs directory if it doesn't exist
 LOG_DIR = Path("artifacts/logs")
 LOG_DIR.mkdir(parents=True, exist_ok=True)
 
-# Configure logger with rotation, async writing, and full error diagnostics
+# Configure logger with rotation and async writing. Variable-annotated
+# tracebacks (diagnose) are expensive and can leak credentials, so they are
+# opt-in via ALTORO_LOG_DIAGNOSE.
 logger.add(
-    LOG_DIR / "run.log", rotation="1 MB", enqueue=True, backtrace=True, diagnose=True
+    LOG_DIR / "run.log",
+    rotation="1 MB",
+    enqueue=True,
+    backtrace=True,
+    diagnose=settings.log_diagnose,
+    catch=True,
 )
 
 # Export logger instance for use across the application
@@ -1,10 +1,11 @@
 """Session timeout/logout handler with automatic retry."""
 
+import random
 import time
-from functools import wraps
-from typing import Callable, Any
+from functools import lru_cache, wraps
+from typing import Callable, Any, Literal, Tuple
 from src.core.logger import log
-from src.core.constants import DEFAULT_MAX_RETRIES, SESSION_ERROR_KEYWORDS
+from src.core.constants import DEFAULT_MAX_RETRIES, SESSION_ERROR_PATTERN
 
 
 class SessionExpiredError(Exception):
@@ -13,12 +14,57 @@ class SessionExpiredError(Exception):
     pass
 
 
-def with_session_retry(max_retries: int = DEFAULT_MAX_RETRIES):
+def is_session_error(message: str) -> bool:
+    """
+    Check whether an error message looks like a session/page error.
+
+    Args:
+        message: Error message to classify
+
+    Returns:
+        True if any SESSION_ERROR_KEYWORDS phrase appears (case-insensitive)
+    """
+    return SESSION_ERROR_PATTERN.search(message) is not None
+
+
+@lru_cache(maxsize=1)
+def _retryable_errors() -> Tuple[type, ...]:
+    """
+    Exception types that are always treated as session/page errors.
+
+    Playwright is imported lazily so this module stays importable without it.
+
+    Returns:
+        Tuple of exception classes for isinstance checks
+    """
+    errors = [ConnectionError]
+    try:
+        from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+        from playwright._impl._errors import TargetClosedError
+
+        errors += [PlaywrightTimeoutError, TargetClosedError]
+    except ImportError:
+        pass
+    return tuple(errors)
+
+
+def with_session_retry(
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    base_delay: float = 1.0,
+    cap: float = 8.0,
+    jitter: Literal["full", "decorrelated", "none"] = "full",
+):
     """
     Decorator to automatically handle session timeouts and re-authenticate.
 
     Args:
         max_retries: Maximum number of retry attempts on session failure
+        base_delay: Base backoff delay in seconds (default: 1.0)
+        cap: Maximum backoff delay in seconds (default: 8.0)
+        jitter: Backoff randomization (default: "full"):
+            - "full": uniform(0, min(cap, base_delay * 2^attempt))
+            - "decorrelated": min(cap, uniform(base_delay, previous * 3))
+            - "none": min(cap, base_delay * 2^attempt)
 
     Usage:
         @with_session_retry(max_retries=2)
@@ -28,90 +74,170 @@ def with_session_retry(max_retries: int = DEFAULT_MAX_RETRIES):
 
     The decorated method's class must have:
         - self.page: Playwright Page object
-        - self.login_page: LoginPage instance with is_logged_out() and login() methods
-        - self.credentials: dict with 'username' and 'password' keys
+        - self.login_page: LoginPage instance with is_logged_out(),
+          restore_session(), login() and save_session() methods, or None if
+          no session context has been set
+        - self.credentials: mapping with 'username', 'password' and 'base_url'
+          keys, or None
     """
 
     def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(self, *args, **kwargs) -> Any:
-            last_exception = None
+            # Fast path: almost every call succeeds first time, so the retry
+            # loop is only entered once the first exception is caught
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                return _slow_retry_path(
+                    self, func, e, args, kwargs, max_retries, base_delay, cap, jitter
+                )
 
-            for attempt in range(1, max_retries + 1):
-                try:
-                    # Execute the wrapped method
-                    result = func(self, *args, **kwargs)
-                    return result
+        return wrapper
+
+    return decorator
 
-                except Exception as e:
-                    last_exception = e
-                    error_message = str(e).lower()
 
-                    # Check if this looks like a session/page error
-                    is_session_error = any(
-                        phrase in error_message for phrase in SESSION_ERROR_KEYWORDS
+def _slow_retry_path(
+    self: Any,
+    func: Callable,
+    error: Exception,
+    args: tuple,
+    kwargs: dict,
+    max_retries: int,
+    base_delay: float,
+    cap: float,
+    jitter: str,
+) -> Any:
+    """
+    Recover from a failed session-retry call and re-run it.
+
+    Args:
+        self: Instance the decorated method is bound to
+        func: Decorated method
+        error: Exception raised by the first call
+        args: Positional arguments of the original call
+        kwargs: Keyword arguments of the original call
+        max_retries: Maximum number of attempts, including the first call
+        base_delay: Base backoff delay in seconds
+        cap: Maximum backoff delay in seconds
+        jitter: "full", "decorrelated" or "none"
+
+    Returns:
+        Result of the first successful retry
+    """
+    delay = base_delay
+
+    for attempt in range(1, max_retries + 1):
+        if attempt > 1:
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                error = e
+
+        # Check if this is a session/page error: by type first, then falling
+        # back to the message for errors raised as plain exceptions
+        if not isinstance(error, _retryable_errors()) and not is_session_error(
+            str(error)
+        ):
+            # Not a session error, re-raise immediately
+            log.debug("Non-session error in {}: {}", func.__name__, error)
+            raise error
+
+        # Session context is declared on BasePage (None until
+        # set_session_context), so a missing attribute is a bug and
+        # surfaces as AttributeError instead of being skipped
+        login_page = self.login_page
+        credentials = self.credentials
+
+        # Check if actually logged out
+        if login_page is not None:
+            try:
+                if login_page.is_logged_out():
+                    log.warning(
+                        "Session expired during {} (attempt {}/{}). Re-authenticating...",
+                        func.__name__,
+                        attempt,
+                        max_retries,
                     )
 
-                    if not is_session_error:
-                        # Not a session error, re-raise immediately
-                        log.debug(f"Non-session error in {func.__name__}: {e}")
-                        raise
-
-                    # Check if actually logged out
-                    if hasattr(self, "login_page"):
-                        try:
-                            if self.login_page.is_logged_out():
-                                log.warning(
-                                    f"Session expired during {func.__name__} (attempt {attempt}/{max_retries}). "
-                                    f"Re-authenticating..."
-                                )
-
-                                # Re-authenticate
-                                if hasattr(self, "credentials"):
-                                    self.login_page.goto(self.credentials["base_url"])
-                                    self.login_page.login(
-                                        self.credentials["username"],
-                                        self.credentials["password"],
-                                    )
-                                    self.login_page.assert_logged_in()
-                                    log.info(
-                                        f"Re-authentication successful. Retrying {func.__name__}..."
-                                    )
-
-                                    # Exponential backoff before retry
-                                    time.sleep(min(2**attempt, 8))
-                                    continue
-                                else:
-                                    raise SessionExpiredError(
-                                        f"Session expired but no credentials available for re-auth in {func.__name__}"
-                                    )
-                        except Exception as auth_error:
-                            log.error(f"Re-authentication failed: {auth_error}")
-                            if attempt == max_retries:
-                                raise SessionExpiredError(
-                                    f"Failed to recover session after {max_retries} attempts in {func.__name__}"
-                                ) from last_exception
-
-                    # If we couldn't determine logout status or re-auth failed, retry if attempts remain
-                    if attempt < max_retries:
-                        log.warning(
-                            f"Retrying {func.__name__} due to error: {e} (attempt {attempt}/{max_retries})"
-                        )
-                        time.sleep(min(2**attempt, 8))
+                    # Re-authenticate, trying the saved cookies before the form
+                    if credentials is not None:
+                        if login_page.restore_session(credentials["base_url"]):
+                            log.info(
+                                "Session restored from saved cookies. Retrying {}...",
+                                func.__name__,
+                            )
+                        else:
+                            login_page.goto(credentials["base_url"])
+                            login_page.login(
+                                credentials["username"],
+                                credentials["password"],
+                            )
+                            login_page.assert_logged_in()
+                            login_page.save_session()
+                            log.info(
+                                "Re-authentication successful. Retrying {}...",
+                                func.__name__,
+                            )
+
+                        # Jittered exponential backoff before retry
+                        delay = _backoff_delay(attempt, delay, base_delay, cap, jitter)
+                        time.sleep(delay)
                         continue
                     else:
-                        # Out of retries
-                        raise
-
-            # Should never reach here, but just in case
-            raise (
-                last_exception
-                if last_exception
-                else SessionExpiredError(
-                    f"Unknown error in {func.__name__} after {max_retries} retries"
-                )
+                        raise SessionExpiredError(
+                            f"Session expired but no credentials available for re-auth in {func.__name__}"
+                        )
+            except Exception as auth_error:
+                log.error("Re-authentication failed: {}", auth_error)
+                if attempt == max_retries:
+                    raise SessionExpiredError(
+                        f"Failed to recover session after {max_retries} attempts in {func.__name__}"
+                    ) from error
+
+        # If we couldn't determine logout status or re-auth failed, retry if attempts remain
+        if attempt < max_retries:
+            log.warning(
+                "Retrying {} due to error: {} (attempt {}/{})",
+                func.__name__,
+                error,
+                attempt,
+                max_retries,
             )
+            delay = _backoff_delay(attempt, delay, base_delay, cap, jitter)
+            time.sleep(delay)
+            continue
+        else:
+            # Out of retries
+            raise error
 
-        return wrapper
+    raise error
 
-    return decorator
+
+def _backoff_delay(
+    attempt: int, previous: float, base_delay: float, cap: float, jitter: str
+) -> float:
+    """
+    Calculate the wait before the next session retry.
+
+    Jitter spreads out retries from pages or workers that hit the same
+    session expiry at once, so they don't all re-authenticate together.
+
+    Args:
+        attempt: Current attempt number (1-indexed)
+        previous: Previous delay (base_delay before the first retry)
+        base_delay: Base backoff delay in seconds
+        cap: Maximum backoff delay in seconds
+        jitter: "full", "decorrelated" or "none"
+
+    Returns:
+        Delay in seconds
+    """
+    if jitter == "decorrelated":
+        return min(cap, random.uniform(base_delay, previous * 3))
+
+    delay = min(cap, base_delay * 2**attempt)
+    if jitter == "full":
+        return random.uniform(0, delay)
+    return delay
@@ -1,6 +1,7 @@
 """Part 1: Login automation orchestration for Altoro Mutual."""
 
-from src.web.browser import browser_session
+from src.web.browser import browser_session, save_storage_state
+from src.web.page_pool import pooled_page
 from src.web.pages.login_page import LoginPage
 from src.core.config import settings
 from src.core.logger import log
@@ -25,10 +26,14 @@ def run_part1_login() -> None:
     Note:
         Uses configuration from settings (base_url, user, password, etc.)
         Saves error screenshots to settings.screenshot_dir
-        Saves browser trace to settings.trace_dir
+        Saves browser trace to settings.trace_dir/trace_part1.zip
+        Saves the logged-in session to settings.storage_state_path (owner-only
+        permissions; run_all deletes it once Parts 2-5 are done)
     """
-    with browser_session(settings.trace_dir) as browser_context:
-        page = browser_context.new_page()
+    # Failed logins are screenshotted, so the page is loaded fully styled
+    with browser_session(
+        settings.trace_dir, trace_name="trace_part1.zip", block_assets=False
+    ) as browser_context, pooled_page(browser_context) as page:
         login_page = LoginPage(page, settings.screenshot_dir)
         login_page.goto(settings.base_url)
 
@@ -37,20 +42,35 @@ def run_part1_login() -> None:
             try:
                 login_page.login(settings.user, settings.password)
                 login_page.assert_logged_in()
-                log.info(f"Login successful (attempt {attempt})")
+                log.info("Login successful (attempt {})", attempt)
                 break
             except Exception:
                 screenshot_path = login_page.error_screenshot(
                     f"login_attempt_{attempt}"
                 )
                 log.exception(
-                    f"Login attempt {attempt} failed. Screenshot: {screenshot_path}"
+                    "Login attempt {} failed. Screenshot: {}", attempt, screenshot_path
                 )
                 if attempt == settings.max_login_retries:
                     raise
 
-        # Negative login
-        page.goto(f"{settings.base_url}/login.jsp")
-        login_page.login(settings.user, "wrong_password")
+        # Save the logged-in session so Parts 2-5 can skip the login form
+        save_storage_state(browser_context, settings.storage_state_path)
+        log.info("Saved session storage state: {}", settings.storage_state_path)
+
+        # Negative login: start from a logged-out state and only wait for the
+        # DOM, the login form is all that's needed
+        page.context.clear_cookies()
+        login_page.goto(settings.base_url)
+        # submit_credentials() doesn't wait for a logged-in page, which never
+        # appears for a wrong password; the error message is waited for instead
+        login_page.submit_credentials(settings.user, "wrong_password")
+        error_message = login_page.capture_error_message(
+            timeout=login_page.login_wait_timeout
+        )
         screenshot_path = login_page.error_screenshot("negative_login")
-        log.info(f"Captured negative login state: {screenshot_path}")
+        log.info(
+            "Captured negative login state: {} (message: {})",
+            screenshot_path,
+            error_message or "none",
+        )
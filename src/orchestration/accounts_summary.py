@@ -1,16 +1,25 @@
 """Part 2: Account summary and transaction history automation orchestration."""
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
 import pandas as pd
 from src.web.browser import browser_session
-from src.web.pages.accounts_page import AccountsPage
+from src.web.page_pool import pooled_page
+from src.web.pages.accounts_page import AccountRecord, AccountsPage
 from src.core.config import settings
 from src.core.logger import log
 from src.core.auth_helpers import authenticate_user, setup_session_context
-from src.core.excel_helpers import write_single_sheet
-from src.core.constants import SHEET_ACCOUNT_SUMMARY, SHEET_TRANSACTIONS_PREFIX
+from src.core.excel import ExcelWriter
+from src.core.excel_helpers import shared_writer_context
+from src.core.constants import (
+    ACCOUNT_SUMMARY_COLUMNS,
+    SHEET_ACCOUNT_SUMMARY,
+    SHEET_TRANSACTIONS_PREFIX,
+)
 
 
-def run_part2_accounts() -> None:
+def run_part2_accounts(shared_writer: Optional[ExcelWriter] = None) -> None:
     """
     Execute Part 2: Account summary and transaction history scraping.
 
@@ -25,81 +34,213 @@ def run_part2_accounts() -> None:
        - Transactions_[AccountID].xlsx: Transaction history per account
 
     Features:
+    - Account pages fetched over HTTP and parsed without rendering, falling
+      back to browser scraping if that fails
     - Automatic session recovery if timeout occurs during scraping
     - Creates output directory if it doesn't exist
     - Overwrites existing Excel files
 
+    Args:
+        shared_writer: ExcelWriter kept open across parts by run_all; if None
+            the part opens and saves the workbook itself
+
     Note:
         Uses configuration from settings (base_url, user, password, excel_path, etc.)
-        Saves browser trace to settings.trace_dir
+        Saves browser trace to settings.trace_dir/trace_part2.zip
         All Excel files saved to parent directory of settings.excel_path
     """
 
     log.info("PART 2: Account Summary & Transaction History Extraction")
 
-    with browser_session(settings.trace_dir) as browser_context:
-        page = browser_context.new_page()
-
-        # Authenticate user and setup session context
-        login_page = authenticate_user(page, settings.screenshot_dir)
-        accounts_page = AccountsPage(page)
-        setup_session_context(accounts_page, login_page)
-
-        # Open accounts page and run scraping (with automatic session recovery)
-        log.info("Opening account summary page...")
-        accounts_page.open()
-
-        log.info("Starting account and transaction data extraction...")
-        accounts_page.run()
-
-        num_accounts = len(accounts_page.accounts_summary)
-        log.info(f"Extraction complete - {num_accounts} accounts processed")
-
-    # 1. Save Account Summary to main Excel workbook
-    if accounts_page.accounts_summary:
-        # Convert accounts_summary dict to list of dicts for DataFrame
-        summary_data = list(accounts_page.accounts_summary.values())
-        summary_df = pd.DataFrame(summary_data)
-
-        log.info("Account Summary Statistics:")
-        log.info(f"  • Total accounts: {len(summary_df)}")
-
-        # Write to Account_Summary sheet in Altoro_Report.xlsx
-        write_single_sheet(settings.excel_path, SHEET_ACCOUNT_SUMMARY, summary_df)
-        log.info(f"Saved account summary to sheet: {SHEET_ACCOUNT_SUMMARY}")
-    else:
-        log.warning("No account summary data to save")
-
-    # 2. Save Transaction History for each account as separate sheets in main workbook
-    if accounts_page.transaction_history:
-        total_transactions = 0
-        sheets_written = 0
-
-        for account_id, transactions in accounts_page.transaction_history.items():
-            if transactions:
-                # Convert transactions list to DataFrame
-                transactions_df = pd.DataFrame(transactions)
-                transaction_count = len(transactions_df)
-                total_transactions += transaction_count
-
-                # Write to Transactions_{AccountID} sheet in Altoro_Report.xlsx
-                sheet_name = f"{SHEET_TRANSACTIONS_PREFIX}{account_id}"
-                write_single_sheet(settings.excel_path, sheet_name, transactions_df)
-                sheets_written += 1
-
-                log.info(
-                    f"Saved {transaction_count} transactions for account {account_id} to sheet: {sheet_name}"
-                )
+    # The workbook is written on a background thread as soon as scraping
+    # finishes, so saving the trace and closing the browser overlap with it
+    with ThreadPoolExecutor(max_workers=1) as report_writer:
+        with browser_session(
+            settings.trace_dir,
+            trace_name="trace_part2.zip",
+            storage_state=settings.storage_state_path,
+        ) as browser_context, pooled_page(browser_context) as page:
+            # Authenticate user and setup session context
+            login_page = authenticate_user(page, settings.screenshot_dir)
+            accounts_page = AccountsPage(page)
+            setup_session_context(accounts_page, login_page)
+
+            # Open accounts page and run scraping (with automatic session recovery)
+            log.info("Opening account summary page...")
+            accounts_page.open()
+
+            log.info("Starting account and transaction data extraction...")
+            # Plain HTTP requests for the account pages are much cheaper than
+            # rendering each one; the browser is only needed if that fails
+            records = accounts_page.fetch_accounts(
+                settings.base_url, accounts_page.read_account_options()
+            )
+            if records is not None:
+                accounts_page.accounts.update(records)
+            elif settings.scrape_concurrency > 1:
+                log.info("HTTP extraction failed - scraping rendered pages")
+                _run_parallel(accounts_page, settings.scrape_concurrency)
             else:
-                log.warning(f"No transaction history for account {account_id}")
+                log.info("HTTP extraction failed - scraping rendered pages")
+                accounts_page.run()
+
+            num_accounts = len(accounts_page.accounts)
+            log.info("Extraction complete - {} accounts processed", num_accounts)
 
-        log.info("Transaction Summary:")
-        log.info(f"  • Total transaction sheets created: {sheets_written}")
-        log.info(f"  • Total transactions extracted: {total_transactions}")
-    else:
-        log.warning("No transaction history data to save")
+            report = report_writer.submit(_save_report, accounts_page, shared_writer)
 
-    log.info(f"Part 2 complete → Excel workbook: {settings.excel_path}")
+    report.result()
+    log.info("Part 2 complete → Excel workbook: {}", settings.excel_path)
+
+
+def _save_report(
+    accounts_page: AccountsPage, shared_writer: Optional[ExcelWriter] = None
+) -> None:
+    """
+    Write the scraped account summary and transaction sheets to the workbook.
+
+    Args:
+        accounts_page: AccountsPage populated by run()
+        shared_writer: Run-wide ExcelWriter, or None to open one
+    """
+    # All Part 2 sheets share one writer, so the workbook is loaded and
+    # saved once instead of once per sheet
+    with shared_writer_context(settings.excel_path, shared_writer) as writer:
+        records = accounts_page.accounts
+
+        # 1. Save Account Summary to main Excel workbook
+        if records:
+            # Rows are tuples in the standard column order, so pandas does
+            # not have to infer columns from row dicts
+            summary_df = pd.DataFrame.from_records(
+                [record.summary_row() for record in records.values()],
+                columns=ACCOUNT_SUMMARY_COLUMNS,
+            )
+
+            log.info("Account Summary Statistics:")
+            log.info("  • Total accounts: {}", len(summary_df))
+
+            # Write to Account_Summary sheet in Altoro_Report.xlsx
+            writer.write_df(SHEET_ACCOUNT_SUMMARY, summary_df)
+            log.info("Saved account summary to sheet: {}", SHEET_ACCOUNT_SUMMARY)
+        else:
+            log.warning("No account summary data to save")
+
+        # 2. Save Transaction History for each account as separate sheets in main workbook
+        if records:
+            total_transactions = 0
+            sheets_written = 0
+
+            # Build one DataFrame for every account's transactions and split it
+            # with a single groupby, instead of one DataFrame per account
+            history = {
+                account_id: record.transactions
+                for account_id, record in records.items()
+            }
+            all_transactions_df = pd.DataFrame(
+                [row for transactions in history.values() for row in transactions]
+            )
+            owners = [
+                account_id
+                for account_id, transactions in history.items()
+                for _ in transactions
+            ]
+            account_frames = (
+                # An Index, not a list: a one-element list would be read as a
+                # list of keys, giving tuple group keys
+                dict(iter(all_transactions_df.groupby(pd.Index(owners), sort=False)))
+                if owners
+                else {}
+            )
+
+            for account_id, transactions in history.items():
+                if transactions:
+                    # Drop amount columns this account has no rows for
+                    transactions_df = account_frames[account_id].dropna(
+                        axis=1, how="all"
+                    )
+                    transaction_count = len(transactions_df)
+                    total_transactions += transaction_count
+
+                    # Write to Transactions_{AccountID} sheet in Altoro_Report.xlsx
+                    sheet_name = f"{SHEET_TRANSACTIONS_PREFIX}{account_id}"
+                    writer.write_df(sheet_name, transactions_df)
+                    sheets_written += 1
+
+                    log.info(
+                        "Saved {} transactions for account {} to sheet: {}",
+                        transaction_count,
+                        account_id,
+                        sheet_name,
+                    )
+                else:
+                    log.warning("No transaction history for account {}", account_id)
+
+            log.info("Transaction Summary:")
+            log.info("  • Total transaction sheets created: {}", sheets_written)
+            log.info("  • Total transactions extracted: {}", total_transactions)
+        else:
+            log.warning("No transaction history data to save")
+
+
+def _run_parallel(accounts_page: AccountsPage, workers: int) -> None:
+    """
+    Scrape accounts in parallel browser sessions and merge into accounts_page.
+
+    Playwright's sync API is not thread-safe, so each worker thread drives its
+    own browser and logs in separately instead of sharing browser_context.
+    Accounts are split into contiguous batches so the merged results keep
+    the dropdown order.
+
+    Args:
+        accounts_page: Opened AccountsPage whose results are populated
+        workers: Maximum number of parallel browser sessions
+    """
+    accounts = accounts_page.read_account_options()
+    workers = min(workers, len(accounts))
+    if workers <= 1:
+        accounts_page.run(accounts)
+        return
+
+    size = -(-len(accounts) // workers)
+    batches = [accounts[i : i + size] for i in range(0, len(accounts), size)]
+    log.info(
+        "Scraping {} accounts in {} parallel browser sessions",
+        len(accounts),
+        len(batches),
+    )
+
+    with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+        results = list(executor.map(_scrape_batch, range(len(batches)), batches))
+
+    for accounts in results:
+        accounts_page.accounts.update(accounts)
+
+
+def _scrape_batch(
+    worker: int, accounts: List[Tuple[str, str]]
+) -> Dict[str, AccountRecord]:
+    """
+    Scrape a batch of accounts in a dedicated, separately authenticated browser.
+
+    Args:
+        worker: Worker index, used to name the trace file
+        accounts: (account_id, account_name) pairs to scrape
+
+    Returns:
+        Dictionary mapping account_id to AccountRecord for the batch
+    """
+    with browser_session(
+        settings.trace_dir,
+        trace_name=f"trace_worker{worker}.zip",
+        storage_state=settings.storage_state_path,
+    ) as browser_context, pooled_page(browser_context) as page:
+        login_page = authenticate_user(page, settings.screenshot_dir)
+        worker_page = AccountsPage(page)
+        setup_session_context(worker_page, login_page)
+        worker_page.open()
+        worker_page.run(accounts)
+        return worker_page.accounts
 
 
 if __name__ == "__main__":
@@ -9,19 +9,33 @@ This module implements:
 The reconciliation compares API-retrieved data with web-scraped data from Parts 2-3.
 """
 
+import asyncio
+import datetime
+import hashlib
+import time
 import pandas as pd
-from typing import Dict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, repeat
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 from src.api.client import AltoroAPI
+from src.api.async_client import AsyncAltoroAPI
+from src.api.response_cache import ResponseCache
 from src.core.config import settings
 from src.core.excel import ExcelWriter
 from src.core.logger import log
-from src.core.utils import parse_money, clean_account_name
+from src.core.utils import parse_money_series, clean_account_name
 from src.core.constants import (
     SHEET_API_VALIDATION,
     VARIANCE_TOLERANCE,
     API_SOURCE_ACCOUNT_LIST,
     API_SOURCE_ACCOUNT_DETAILS,
     API_SOURCE_TRANSACTIONS_POST,
+    API_MAX_WORKERS,
+    API_TRANSACTIONS_BATCH_SIZE,
+    API_LIVE_TRANSACTIONS_CACHE_TTL,
+    API_ACCOUNT_COLUMNS,
+    API_TRANSACTION_COLUMNS,
 )
 from src.api.exceptions import (
     APIError,
@@ -31,12 +45,48 @@ from src.api.exceptions import (
 )
 from src.core.dataframe_helpers import (
     normalize_column_names,
+    categorize_keys,
     calculate_net_amount,
     group_and_sum_by_account,
     calculate_variance,
+    calculate_variances,
     add_match_status,
 )
 
+# Money columns kept as raw API strings until the DataFrame is built, then
+# parsed column-wise with parse_money_series()
+API_ACCOUNT_MONEY_COLUMNS = ("balance", "available_balance")
+API_TRANSACTION_MONEY_COLUMNS = ("debit", "credit", "amount")
+
+# Low-cardinality API account columns stored as categoricals
+API_ACCOUNT_CATEGORY_DTYPES = {"account_type": "category", "api_source": "category"}
+
+# Web account column rules for normalize_column_names(), handling the
+# different possible column name formats
+ACCOUNT_MAPPING_RULES = (
+    (("account", "id"), "account_id"),
+    (("account", "number"), "account_id"),
+    (("total", "balance"), "total"),
+    (("available", "balance"), "available"),
+)
+
+# Exact display name mappings for web transactions (transaction.py Excel output)
+TXN_DISPLAY_TO_PROGRAMMATIC = {
+    "Transaction ID": "transaction_id",
+    "Transaction Time": "transaction_time",
+    "Account ID": "account_id",
+    "Action": "action",
+    "Debit": "debit",
+    "Credit": "credit",
+}
+
+# Fuzzy web transaction column rules for names the exact mapping misses
+TXN_FUZZY_RULES = (
+    (("account", "id"), "account_id"),
+    (("account", "number"), "account_id"),
+    (("transaction", "id"), "transaction_id"),
+)
+
 
 def run_part6_api_validate(
     web_accounts_df: pd.DataFrame | None = None,
@@ -58,69 +108,214 @@ def run_part6_api_validate(
 
     log.info("PART 6: REST API Integration & Data Validation - Starting")
 
+    # Nothing to reconcile against and no API-only snapshot wanted
+    if (
+        web_accounts_df is None
+        and web_transactions_df is None
+        and not settings.api_snapshot_required
+    ):
+        log.warning("No web data to reconcile and API snapshot not required")
+        _write_api_skipped_report()
+        return
+
     # Task 6.1: API Authentication & Session Management
     log.info("Task 6.1: Authenticating with REST API (admin credentials)")
 
+    cache = None
     try:
-        # Use context manager for automatic connection cleanup
-        with AltoroAPI(
-            settings.base_url, settings.api_user, settings.api_password
-        ) as api:
-            # Authenticate and obtain token
-            api.authenticate()
-
-            # Task 6.2: Programmatic Account Data Retrieval
-            log.info("\nTask 6.2: Programmatic Account Data Retrieval")
-            api_accounts_data = _retrieve_api_accounts(api)
-            api_transactions_data = _retrieve_api_transactions(api, api_accounts_data)
-
-            # Task 6.3: Date-Filtered API Queries & Cross-Validation
-            log.info("\nTask 6.3: Cross-Validation with Web Data")
-            reconciliation_report = _perform_reconciliation(
-                api_accounts_data,
-                api_transactions_data,
-                web_accounts_df,
-                web_transactions_df,
+        cache = _open_response_cache()
+
+        if settings.api_async:
+            api_accounts_data, api_transactions_data = asyncio.run(
+                _retrieve_api_data_async(cache)
             )
+        else:
+            # Use context manager for automatic connection cleanup
+            with AltoroAPI(
+                settings.base_url, settings.api_user, settings.api_password
+            ) as api:
+                # Authenticate and obtain token (or reuse a saved one)
+                _authenticate(api, cache)
+
+                # Task 6.2: Programmatic Account Data Retrieval
+                log.info("\nTask 6.2: Programmatic Account Data Retrieval")
+                api_accounts_data = _with_reauthentication(
+                    api, cache, _retrieve_api_accounts
+                )
+                api_transactions_data = _with_reauthentication(
+                    api, cache, _retrieve_api_transactions, api_accounts_data
+                )
+
+        # Task 6.3: Date-Filtered API Queries & Cross-Validation
+        log.info("\nTask 6.3: Cross-Validation with Web Data")
+        reconciliation_report = _perform_reconciliation(
+            api_accounts_data,
+            api_transactions_data,
+            web_accounts_df,
+            web_transactions_df,
+        )
 
-        # Generate Excel Report (outside context manager)
+        # Generate Excel Report
         _write_excel_report(reconciliation_report)
 
         log.info(
-            f"PART 6: Completed successfully - {SHEET_API_VALIDATION} sheet generated"
+            "PART 6: Completed successfully - {} sheet generated", SHEET_API_VALIDATION
         )
 
     except APIAuthenticationError as e:
-        log.error(f"API authentication failed: {e}")
+        log.error("API authentication failed: {}", e)
         log.warning("Invalid API credentials - skipping Part 6")
         _write_api_unavailable_report()
         return
 
     except (APIConnectionError, MaxRetriesExceededError) as e:
-        log.error(f"API connection failed after retries: {e}")
+        log.error("API connection failed after retries: {}", e)
         log.warning("API service unavailable - skipping Part 6")
         _write_api_unavailable_report()
         return
 
     except APIError as e:
-        log.error(f"API error: {e}")
+        log.error("API error: {}", e)
         log.warning("API operation failed - skipping Part 6")
         _write_api_unavailable_report()
         return
 
     except Exception as e:
-        log.error(f"Unexpected error during API validation: {type(e).__name__}: {e}")
+        log.error("Unexpected error during API validation: {}: {}", type(e).__name__, e)
         log.warning("Part 6 failed - writing error report")
         _write_api_unavailable_report()
         return
 
+    finally:
+        if cache is not None:
+            cache.close()
+
 
-def _retrieve_api_accounts(api: AltoroAPI) -> pd.DataFrame:
+def _open_response_cache() -> Optional[ResponseCache]:
+    """
+    Open the persistent API response cache if caching is enabled.
+
+    Returns:
+        ResponseCache in settings.cache_dir, or None when api_cache_ttl is 0
+    """
+    if settings.api_cache_ttl <= 0:
+        return None
+    return ResponseCache(str(Path(settings.cache_dir) / "api_cache.sqlite"))
+
+
+def _token_cache_key() -> str:
+    """Cache key for the API token saved between runs."""
+    return f"tok:{settings.base_url}:{settings.api_user}"
+
+
+def _authenticate(api: AltoroAPI, cache: Optional[ResponseCache] = None) -> bool:
+    """
+    Authenticate the client, reusing a token saved by an earlier run.
+
+    Args:
+        api: AltoroAPI client
+        cache: Persistent response cache holding the saved token (optional)
+
+    Returns:
+        True if a saved token was reused, False if the client logged in
+
+    Raises:
+        APIAuthenticationError: If credentials are invalid
+    """
+    if cache is not None:
+        saved = cache.get(_token_cache_key())
+        if saved is not None and api.restore_token(saved):
+            return True
+
+    api.authenticate()
+
+    if cache is not None:
+        token = api.export_token()
+        cache.set(_token_cache_key(), token, ttl=token["expires_at"] - time.time())
+    return False
+
+
+def _with_reauthentication(
+    api: AltoroAPI,
+    cache: Optional[ResponseCache],
+    step: Callable[..., Any],
+    *args: Any,
+) -> Any:
+    """
+    Run a retrieval step, logging in again once if its token is rejected.
+
+    A token (saved by an earlier run or not) can be revoked server-side at
+    any point between steps; the saved copy is then forgotten and the step
+    re-run under a fresh login. Responses cached by the first attempt are
+    reused by the second.
+
+    Args:
+        api: Authenticated AltoroAPI client
+        cache: Persistent response cache holding the saved token (optional)
+        step: Retrieval function called as step(api, *args, cache)
+        *args: Step arguments between the client and the cache
+
+    Returns:
+        The step's result
+
+    Raises:
+        APIAuthenticationError: If the fresh login or the retried step fails
+            authentication too
+    """
+    try:
+        return step(api, *args, cache)
+    except APIAuthenticationError:
+        log.warning("API token rejected, re-authenticating...")
+        if cache is not None:
+            cache.delete(_token_cache_key())
+        _authenticate(api, cache)
+        return step(api, *args, cache)
+
+
+def _account_cache_key(account_id: str) -> str:
+    """Cache key for an account's raw details response."""
+    return f"acct:{settings.base_url}:{settings.api_user}:{account_id}"
+
+
+def _transactions_cache_key(account_id: str, start: str, end: str) -> str:
+    """Cache key for an account's raw transactions in a date range."""
+    digest = hashlib.blake2b(
+        f"{settings.base_url}|{settings.api_user}|{account_id}|{start}|{end}".encode(),
+        digest_size=16,
+    ).hexdigest()
+    return f"txn:{digest}"
+
+
+def _transactions_cache_ttl(end: str) -> Optional[float]:
+    """
+    Cache lifetime for transactions in a date range ending on end.
+
+    Ranges that closed before today can no longer change and are kept
+    indefinitely; ranges still open (or with an unparseable end date) are
+    only reused for API_LIVE_TRANSACTIONS_CACHE_TTL seconds.
+
+    Args:
+        end: End date in YYYY-MM-DD format
+
+    Returns:
+        TTL in seconds, or None for no expiry
+    """
+    try:
+        closed = datetime.date.fromisoformat(end) < datetime.date.today()
+    except ValueError:
+        closed = False
+    return None if closed else API_LIVE_TRANSACTIONS_CACHE_TTL
+
+
+def _retrieve_api_accounts(
+    api: AltoroAPI, cache: Optional[ResponseCache] = None
+) -> pd.DataFrame:
     """
     Task 6.2 - Step A & B: Retrieve Account List and Detailed Account Information.
 
     Args:
         api: Authenticated AltoroAPI client
+        cache: Persistent response cache for account details (optional)
 
     Returns:
         DataFrame with all account details from API
@@ -130,22 +325,56 @@ def _retrieve_api_accounts(api: AltoroAPI) -> pd.DataFrame:
     try:
         accounts_list = api.accounts()
         log.info(
-            f"  Retrieved {len(accounts_list)} accounts from {API_SOURCE_ACCOUNT_LIST}"
+            "  Retrieved {} accounts from {}",
+            len(accounts_list),
+            API_SOURCE_ACCOUNT_LIST,
         )
     except APIAuthenticationError as e:
-        log.error(f"  Authentication error retrieving accounts: {e}")
+        log.error("  Authentication error retrieving accounts: {}", e)
         raise  # Re-raise to be handled by main try-except
     except (APIConnectionError, MaxRetriesExceededError) as e:
-        log.error(f"  Connection/retry error retrieving accounts: {e}")
+        log.error("  Connection/retry error retrieving accounts: {}", e)
         return pd.DataFrame()
     except APIError as e:
-        log.error(f"  API error retrieving accounts: {e}")
+        log.error("  API error retrieving accounts: {}", e)
         return pd.DataFrame()
 
     # Step B: Get detailed information for each account
     log.info("  Step B: Retrieving detailed account information...")
+    account_ids = _extract_account_ids(accounts_list)
+
+    # Detail lookups are independent round-trips, so they run concurrently;
+    # map() keeps the API's account order and re-raises authentication errors
     detailed_accounts = []
+    if account_ids:
+        with ThreadPoolExecutor(
+            max_workers=min(API_MAX_WORKERS, len(account_ids))
+        ) as executor:
+            detailed_accounts = list(
+                executor.map(
+                    _fetch_account_details, repeat(api), account_ids, repeat(cache)
+                )
+            )
 
+    df_accounts = _accounts_frame(detailed_accounts)
+    log.info(
+        "  Step B completed: {} accounts with detailed information", len(df_accounts)
+    )
+    return df_accounts
+
+
+def _extract_account_ids(accounts_list: List[Any]) -> List[str]:
+    """
+    Normalize the account list response into a flat list of account IDs.
+
+    Args:
+        accounts_list: Account entries from api.accounts(), either ID strings
+            or account objects
+
+    Returns:
+        Account IDs in response order; malformed entries are logged and skipped
+    """
+    account_ids = []
     for account in accounts_list:
         # Handle both string and dict responses from API
         if isinstance(account, str):
@@ -159,56 +388,91 @@ def _retrieve_api_accounts(api: AltoroAPI) -> pd.DataFrame:
                 or account.get("account_id", "")
             )
         else:
-            log.warning(f"  Unexpected account format: {type(account)} - {account}")
+            log.warning("  Unexpected account format: {} - {}", type(account), account)
             continue
 
         if not account_id:
-            log.warning(f"  Skipping account with missing ID: {account}")
+            log.warning("  Skipping account with missing ID: {}", account)
             continue
 
-        try:
-            # Fetch detailed account information
-            details = api.get_account_details(account_id)
-            detailed_accounts.append(
-                {
-                    "account_id": account_id,
-                    "account_name": clean_account_name(details.get("accountName", "")),
-                    "account_type": details.get("accountType", ""),
-                    "balance": parse_money(details.get("balance", "0")),
-                    "available_balance": parse_money(
-                        details.get("availableBalance", "0")
-                    ),
-                    "api_source": API_SOURCE_ACCOUNT_DETAILS,
-                }
-            )
-            log.info(f"  Account {account_id}: {details.get('accountName', 'N/A')}")
-        except APIAuthenticationError:
-            # Don't continue if auth fails - re-raise to stop processing
-            log.error(f"  Authentication error for account {account_id}")
-            raise
-        except (APIError, MaxRetriesExceededError) as e:
-            log.warning(f"  ⚠ Failed to get details for account {account_id}: {e}")
-            # Create basic entry with just the ID when details fetch fails
-            detailed_accounts.append(
-                {
-                    "account_id": account_id,
-                    "account_name": f"Account {account_id}",
-                    "account_type": "Unknown",
-                    "balance": 0.0,
-                    "available_balance": 0.0,
-                    "api_source": f"{API_SOURCE_ACCOUNT_LIST} (basic)",
-                }
-            )
+        account_ids.append(account_id)
+    return account_ids
+
+
+def _fetch_account_details(
+    api: AltoroAPI, account_id: str, cache: Optional[ResponseCache] = None
+) -> Dict[str, Any]:
+    """
+    Fetch one account's details as a report row.
+
+    Args:
+        api: Authenticated AltoroAPI client
+        account_id: Account number
+        cache: Persistent response cache; the raw response is cached, so
+            row building can change without invalidating entries (optional)
+
+    Returns:
+        Account row; a basic placeholder row if the details request failed
+
+    Raises:
+        APIAuthenticationError: If authentication fails (stops processing)
+    """
+    if cache is not None:
+        details = cache.get(_account_cache_key(account_id))
+        if details is not None:
+            return _account_row(account_id, details)
+
+    try:
+        # Fetch detailed account information
+        details = api.get_account_details(account_id)
+    except APIAuthenticationError:
+        # Don't continue if auth fails - re-raise to stop processing
+        log.error("  Authentication error for account {}", account_id)
+        raise
+    except (APIError, MaxRetriesExceededError) as e:
+        log.warning("  ⚠ Failed to get details for account {}: {}", account_id, e)
+        return _basic_account_row(account_id)
+
+    if cache is not None:
+        cache.set(_account_cache_key(account_id), details, settings.api_cache_ttl)
+    return _account_row(account_id, details)
+
+
+def _account_row(account_id: str, details: Dict[str, Any]) -> Dict[str, Any]:
+    """Build an account report row from an account details response."""
+    log.info("  Account {}: {}", account_id, details.get("accountName", "N/A"))
+    return {
+        "account_id": account_id,
+        "account_name": clean_account_name(details.get("accountName", "")),
+        "account_type": details.get("accountType", ""),
+        "balance": details.get("balance", "0"),
+        "available_balance": details.get("availableBalance", "0"),
+        "api_source": API_SOURCE_ACCOUNT_DETAILS,
+    }
+
+
+def _accounts_frame(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Build the API accounts DataFrame column-wise from account rows."""
+    df = pd.DataFrame({col: [row[col] for row in rows] for col in API_ACCOUNT_COLUMNS})
+    for col in API_ACCOUNT_MONEY_COLUMNS:
+        df[col] = parse_money_series(df[col])
+    return df.astype(API_ACCOUNT_CATEGORY_DTYPES)
 
-    df_accounts = pd.DataFrame(detailed_accounts)
-    log.info(
-        f"  Step B completed: {len(df_accounts)} accounts with detailed information"
-    )
-    return df_accounts
+
+def _basic_account_row(account_id: str) -> Dict[str, Any]:
+    """Build a basic entry with just the ID when the details fetch failed."""
+    return {
+        "account_id": account_id,
+        "account_name": f"Account {account_id}",
+        "account_type": "Unknown",
+        "balance": 0.0,
+        "available_balance": 0.0,
+        "api_source": f"{API_SOURCE_ACCOUNT_LIST} (basic)",
+    }
 
 
 def _retrieve_api_transactions(
-    api: AltoroAPI, accounts_df: pd.DataFrame
+    api: AltoroAPI, accounts_df: pd.DataFrame, cache: Optional[ResponseCache] = None
 ) -> pd.DataFrame:
     """
     Task 6.2 - Step C: Extract Transaction History via API.
@@ -218,70 +482,384 @@ def _retrieve_api_transactions(
     Args:
         api: Authenticated AltoroAPI client
         accounts_df: DataFrame with account information
+        cache: Persistent response cache for transactions (optional)
 
     Returns:
         DataFrame with all transactions from API (date-filtered)
     """
     log.info(
-        f"  Step C: Extracting transaction history (date range: {settings.api_filter_start} to {settings.api_filter_end})..."
+        "  Step C: Extracting transaction history (date range: {} to {})...",
+        settings.api_filter_start,
+        settings.api_filter_end,
     )
 
-    all_transactions = []
-    for _, account in accounts_df.iterrows():
-        account_id = str(account["account_id"])
+    account_ids = (
+        accounts_df["account_id"].astype(str).tolist()
+        if "account_id" in accounts_df.columns
+        else []
+    )
 
-        try:
-            # Date-filtered API query (Task 6.3)
-            transactions = api.transactions(
-                account_id, start=settings.api_filter_start, end=settings.api_filter_end
+    start, end = settings.api_filter_start, settings.api_filter_end
+    columns_by_id: Dict[str, Dict[str, List[Any]]] = {}
+    if cache is not None:
+        for account_id in account_ids:
+            transactions = cache.get(_transactions_cache_key(account_id, start, end))
+            if transactions is not None:
+                columns_by_id[account_id] = _transaction_columns(
+                    account_id, transactions
+                )
+    missing_ids = [a for a in account_ids if a not in columns_by_id]
+
+    # Batch endpoint first (opt-in, it isn't part of the stock API): one
+    # round-trip per API_TRANSACTIONS_BATCH_SIZE accounts; chunks that fail
+    # are retried per account below
+    if settings.api_transactions_batch and len(missing_ids) > 1 and api.batch_supported:
+        chunks = [
+            missing_ids[i : i + API_TRANSACTIONS_BATCH_SIZE]
+            for i in range(0, len(missing_ids), API_TRANSACTIONS_BATCH_SIZE)
+        ]
+        with ThreadPoolExecutor(
+            max_workers=min(API_MAX_WORKERS, len(chunks))
+        ) as executor:
+            for by_account in executor.map(
+                _fetch_transactions_batch, repeat(api), chunks, repeat(cache)
+            ):
+                for account_id, transactions in by_account.items():
+                    columns_by_id[account_id] = _transaction_columns(
+                        account_id, transactions
+                    )
+        missing_ids = [a for a in missing_ids if a not in columns_by_id]
+
+    # One round-trip per remaining account, run concurrently over the pooled
+    # client; map() re-raises authentication errors
+    if missing_ids:
+        with ThreadPoolExecutor(
+            max_workers=min(API_MAX_WORKERS, len(missing_ids))
+        ) as executor:
+            columns_by_id.update(
+                zip(
+                    missing_ids,
+                    executor.map(
+                        _fetch_account_transactions,
+                        repeat(api),
+                        missing_ids,
+                        repeat(cache),
+                    ),
+                )
             )
 
-            log.info(f"  Account {account_id}: {len(transactions)} transactions")
+    df_transactions = _transactions_frame(
+        columns_by_id[account_id] for account_id in account_ids
+    )
+    log.info(
+        "  Step C completed: {} total transactions retrieved from API",
+        len(df_transactions),
+    )
+    return df_transactions
+
 
-            for txn in transactions:
-                # Handle both string and dict transaction formats
-                if isinstance(txn, str):
-                    log.warning(
-                        f"  Transaction returned as string: {txn[:100] if len(txn) > 100 else txn}"
-                    )
-                    continue  # Skip string transactions
-                elif not isinstance(txn, dict):
-                    log.warning(f"  Unexpected transaction format: {type(txn)}")
-                    continue
+def _fetch_transactions_batch(
+    api: AltoroAPI, account_ids: List[str], cache: Optional[ResponseCache] = None
+) -> Dict[str, List[Any]]:
+    """
+    Fetch several accounts' date-filtered transactions in one batch request.
 
-                all_transactions.append(
-                    {
-                        "account_id": account_id,
-                        "transaction_id": txn.get("transactionId", txn.get("id", "")),
-                        "transaction_date": txn.get(
-                            "transactionDate", txn.get("date", "")
-                        ),
-                        "description": txn.get("description", ""),
-                        "debit": parse_money(txn.get("debit", "0")),
-                        "credit": parse_money(txn.get("credit", "0")),
-                        "amount": parse_money(txn.get("amount", "0")),
-                        "api_source": API_SOURCE_TRANSACTIONS_POST.replace(
-                            "{accountNo}", str(account_id)
-                        ),
-                    }
-                )
+    Args:
+        api: Authenticated AltoroAPI client
+        account_ids: Account numbers (at most API_TRANSACTIONS_BATCH_SIZE)
+        cache: Persistent response cache; raw transactions are stored per
+            account like _fetch_account_transactions() (optional)
+
+    Returns:
+        Dictionary mapping account_id to raw transactions; empty if the batch
+        failed, the endpoint is unsupported, or the response held no
+        transactions at all (nothing proves it was split by account, so
+        those accounts are fetched one by one instead)
 
-        except APIAuthenticationError:
-            # Don't continue if auth fails - re-raise to stop processing
-            log.error(
-                f"  Authentication error retrieving transactions for account {account_id}"
+    Raises:
+        APIAuthenticationError: If authentication fails (stops processing)
+    """
+    start, end = settings.api_filter_start, settings.api_filter_end
+    try:
+        by_account = api.transactions_batch(account_ids, start, end, fallback=False)
+    except APIAuthenticationError:
+        log.error(
+            "  Authentication error retrieving batch transactions for {} accounts",
+            len(account_ids),
+        )
+        raise
+    except (APIError, MaxRetriesExceededError) as e:
+        # An unsupported endpoint is already logged by the client
+        if api.batch_supported:
+            log.warning(
+                "  ⚠ Batch transactions failed for {} accounts, fetching per account: {}",
+                len(account_ids),
+                e,
             )
-            raise
-        except (APIError, MaxRetriesExceededError) as e:
+        return {}
+
+    # The client rejects transactions it can't attribute to an account, so a
+    # non-empty batch is validated; an empty one isn't and is neither
+    # trusted nor cached
+    if not any(by_account.values()):
+        return {}
+
+    if cache is not None:
+        ttl = _transactions_cache_ttl(end)
+        for account_id, transactions in by_account.items():
+            cache.set(
+                _transactions_cache_key(account_id, start, end), transactions, ttl
+            )
+    return by_account
+
+
+def _fetch_account_transactions(
+    api: AltoroAPI, account_id: str, cache: Optional[ResponseCache] = None
+) -> Dict[str, List[Any]]:
+    """
+    Fetch one account's date-filtered transactions as report columns.
+
+    Args:
+        api: Authenticated AltoroAPI client
+        account_id: Account number
+        cache: Persistent response cache; raw transactions are cached per
+            (account_id, start, end) (optional)
+
+    Returns:
+        Transaction columns (see _transaction_columns); empty if the
+        request failed
+
+    Raises:
+        APIAuthenticationError: If authentication fails (stops processing)
+    """
+    start, end = settings.api_filter_start, settings.api_filter_end
+    if cache is not None:
+        transactions = cache.get(_transactions_cache_key(account_id, start, end))
+        if transactions is not None:
+            return _transaction_columns(account_id, transactions)
+
+    try:
+        # Date-filtered API query (Task 6.3)
+        transactions = api.transactions(account_id, start=start, end=end)
+    except APIAuthenticationError:
+        # Don't continue if auth fails - re-raise to stop processing
+        log.error(
+            "  Authentication error retrieving transactions for account {}",
+            account_id,
+        )
+        raise
+    except (APIError, MaxRetriesExceededError) as e:
+        log.warning(
+            "  ⚠ Failed to retrieve transactions for account {}: {}", account_id, e
+        )
+        return {}
+
+    if cache is not None:
+        cache.set(
+            _transactions_cache_key(account_id, start, end),
+            transactions,
+            _transactions_cache_ttl(end),
+        )
+    return _transaction_columns(account_id, transactions)
+
+
+def _transaction_columns(
+    account_id: str, transactions: List[Any]
+) -> Dict[str, List[Any]]:
+    """Build transaction report columns from a transactions response."""
+    log.info("  Account {}: {} transactions", account_id, len(transactions))
+
+    transaction_ids, dates, descriptions = [], [], []
+    debits, credits, amounts = [], [], []
+    for txn in transactions:
+        # Handle both string and dict transaction formats
+        if isinstance(txn, str):
             log.warning(
-                f"  ⚠ Failed to retrieve transactions for account {account_id}: {e}"
+                "  Transaction returned as string: {}",
+                txn[:100] if len(txn) > 100 else txn,
             )
+            continue  # Skip string transactions
+        elif not isinstance(txn, dict):
+            log.warning("  Unexpected transaction format: {}", type(txn))
+            continue
 
-    df_transactions = pd.DataFrame(all_transactions)
-    log.info(
-        f"  Step C completed: {len(df_transactions)} total transactions retrieved from API"
+        transaction_ids.append(txn.get("transactionId", txn.get("id", "")))
+        dates.append(txn.get("transactionDate", txn.get("date", "")))
+        descriptions.append(txn.get("description", ""))
+        debits.append(txn.get("debit", "0"))
+        credits.append(txn.get("credit", "0"))
+        amounts.append(txn.get("amount", "0"))
+
+    count = len(transaction_ids)
+    api_source = API_SOURCE_TRANSACTIONS_POST.replace("{accountNo}", str(account_id))
+    return {
+        "account_id": [account_id] * count,
+        "transaction_id": transaction_ids,
+        "transaction_date": dates,
+        "description": descriptions,
+        "debit": debits,
+        "credit": credits,
+        "amount": amounts,
+        "api_source": [api_source] * count,
+    }
+
+
+def _transactions_frame(parts: Iterable[Dict[str, List[Any]]]) -> pd.DataFrame:
+    """
+    Concatenate per-account transaction columns into one DataFrame.
+
+    Args:
+        parts: Column dictionaries from _transaction_columns(), in account
+            order; failed accounts contribute an empty dictionary
+
+    Returns:
+        DataFrame with API_TRANSACTION_COLUMNS; money columns parsed to float64
+    """
+    parts = list(parts)
+    df = pd.DataFrame(
+        {
+            col: list(chain.from_iterable(part.get(col, ()) for part in parts))
+            for col in API_TRANSACTION_COLUMNS
+        },
+        dtype=object,
     )
-    return df_transactions
+    for col in API_TRANSACTION_MONEY_COLUMNS:
+        df[col] = parse_money_series(df[col])
+    return df
+
+
+async def _retrieve_api_data_async(
+    cache: Optional[ResponseCache] = None,
+) -> Tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Task 6.1 & 6.2 on the asyncio client: authenticate, then Steps A, B and C.
+
+    Same output as _retrieve_api_accounts() and _retrieve_api_transactions(),
+    but per-account requests are gathered on one event loop, bounded by
+    AsyncAltoroAPI's semaphore, instead of running on worker threads.
+
+    Args:
+        cache: Persistent response cache for account details (optional)
+
+    Returns:
+        Tuple of (accounts DataFrame, transactions DataFrame)
+
+    Raises:
+        APIAuthenticationError: If authentication fails (stops processing)
+    """
+    async with AsyncAltoroAPI(
+        settings.base_url, settings.api_user, settings.api_password
+    ) as api:
+        await api.authenticate()
+
+        log.info("\nTask 6.2: Programmatic Account Data Retrieval")
+        log.info("  Step A: Retrieving account list from API...")
+        try:
+            accounts_list = await api.accounts()
+            log.info(
+                "  Retrieved {} accounts from {}",
+                len(accounts_list),
+                API_SOURCE_ACCOUNT_LIST,
+            )
+        except APIAuthenticationError as e:
+            log.error("  Authentication error retrieving accounts: {}", e)
+            raise
+        except (APIError, MaxRetriesExceededError) as e:
+            log.error("  Error retrieving accounts: {}", e)
+            return pd.DataFrame(), pd.DataFrame()
+
+        log.info("  Step B: Retrieving detailed account information...")
+        account_ids = _extract_account_ids(accounts_list)
+        details_by_id: Dict[str, Any] = {}
+        if cache is not None:
+            for account_id in account_ids:
+                details = cache.get(_account_cache_key(account_id))
+                if details is not None:
+                    details_by_id[account_id] = details
+        missing_ids = [
+            account_id for account_id in account_ids if account_id not in details_by_id
+        ]
+        for account_id, result in zip(
+            missing_ids, await api.get_all_account_details(missing_ids)
+        ):
+            details_by_id[account_id] = result
+            if cache is not None and isinstance(result, dict):
+                cache.set(
+                    _account_cache_key(account_id), result, settings.api_cache_ttl
+                )
+
+        detailed_accounts = []
+        for account_id in account_ids:
+            result = details_by_id[account_id]
+            if isinstance(result, APIAuthenticationError):
+                raise result
+            if isinstance(result, (APIError, MaxRetriesExceededError)):
+                log.warning(
+                    "  ⚠ Failed to get details for account {}: {}", account_id, result
+                )
+                detailed_accounts.append(_basic_account_row(account_id))
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                detailed_accounts.append(_account_row(account_id, result))
+        df_accounts = _accounts_frame(detailed_accounts)
+        log.info(
+            "  Step B completed: {} accounts with detailed information",
+            len(df_accounts),
+        )
+
+        log.info(
+            "  Step C: Extracting transaction history (date range: {} to {})...",
+            settings.api_filter_start,
+            settings.api_filter_end,
+        )
+        start, end = settings.api_filter_start, settings.api_filter_end
+        transactions_by_id: Dict[str, Any] = {}
+        if cache is not None:
+            for account_id in account_ids:
+                transactions = cache.get(
+                    _transactions_cache_key(account_id, start, end)
+                )
+                if transactions is not None:
+                    transactions_by_id[account_id] = transactions
+        missing_ids = [
+            account_id
+            for account_id in account_ids
+            if account_id not in transactions_by_id
+        ]
+        for account_id, result in zip(
+            missing_ids, await api.get_all_transactions(missing_ids, start, end)
+        ):
+            transactions_by_id[account_id] = result
+            if cache is not None and isinstance(result, list):
+                cache.set(
+                    _transactions_cache_key(account_id, start, end),
+                    result,
+                    _transactions_cache_ttl(end),
+                )
+
+        parts = []
+        for account_id in account_ids:
+            result = transactions_by_id[account_id]
+            if isinstance(result, APIAuthenticationError):
+                raise result
+            if isinstance(result, (APIError, MaxRetriesExceededError)):
+                log.warning(
+                    "  ⚠ Failed to retrieve transactions for account {}: {}",
+                    account_id,
+                    result,
+                )
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                parts.append(_transaction_columns(account_id, result))
+        df_transactions = _transactions_frame(parts)
+        log.info(
+            "  Step C completed: {} total transactions retrieved from API",
+            len(df_transactions),
+        )
+
+    return df_accounts, df_transactions
 
 
 def _perform_reconciliation(
@@ -324,7 +902,7 @@ def _perform_reconciliation(
         report["account_recon"] = _reconcile_accounts(api_accounts, web_accounts)
     else:
         log.warning("  No web account data provided - skipping account reconciliation")
-        report["account_recon"] = api_accounts.copy()
+        report["account_recon"] = api_accounts.copy(deep=False)
         report["account_recon"]["web_match_status"] = "No web data for comparison"
 
     # Section 3: Transaction Reconciliation by Account
@@ -352,21 +930,18 @@ def _reconcile_accounts(api_df: pd.DataFrame, web_df: pd.DataFrame) -> pd.DataFr
     """Compare API account data with web-scraped account data."""
     log.info("    Reconciling account data...")
 
-    # Normalize API data
-    api_normalized = api_df.copy()
+    # Normalize API data; a shallow copy shares the other columns with api_df,
+    # since replacing a column never writes into the original buffers
+    api_normalized = api_df.copy(deep=False)
     api_normalized["account_id"] = api_normalized["account_id"].astype(str)
 
     # Normalize web data - handle different possible column name formats
-    mapping_rules = [
-        (["account", "id"], "account_id"),
-        (["account", "number"], "account_id"),
-        (["total", "balance"], "total"),
-        (["available", "balance"], "available"),
-    ]
-    web_normalized = normalize_column_names(web_df, mapping_rules)
-
-    # Ensure account_id is string type
+    web_normalized = normalize_column_names(web_df, ACCOUNT_MAPPING_RULES)
+
+    # Ensure account_id is string type (normalize_column_names returns web_df
+    # itself when nothing is renamed, so never assign into it directly)
     if "account_id" in web_normalized.columns:
+        web_normalized = web_normalized.copy(deep=False)
         web_normalized["account_id"] = web_normalized["account_id"].astype(str)
     else:
         log.warning("    Web data missing account_id column after normalization")
@@ -374,7 +949,8 @@ def _reconcile_accounts(api_df: pd.DataFrame, web_df: pd.DataFrame) -> pd.DataFr
         api_normalized["web_match_status"] = "No web data for comparison"
         return api_normalized
 
-    # Merge API and Web data
+    # Merge API and Web data on a shared categorical key
+    api_normalized, web_normalized = categorize_keys(api_normalized, web_normalized)
     merged = pd.merge(
         api_normalized[["account_id", "account_name", "balance", "available_balance"]],
         web_normalized[["account_id", "total", "available"]],
@@ -389,20 +965,18 @@ def _reconcile_accounts(api_df: pd.DataFrame, web_df: pd.DataFrame) -> pd.DataFr
     )
 
     # Calculate variances
-    merged = calculate_variance(
-        merged, "balance", "balance_web", result_col="balance_variance"
-    )
-    merged = calculate_variance(
+    merged = calculate_variances(
         merged,
-        "available_balance",
-        "available_balance_web",
-        result_col="available_variance",
+        [
+            ("balance", "balance_web", "balance_variance"),
+            ("available_balance", "available_balance_web", "available_variance"),
+        ],
     )
 
     # Determine match status
     merged = add_match_status(merged, "balance_variance", tolerance=VARIANCE_TOLERANCE)
 
-    log.info(f"    Reconciled {len(merged)} accounts")
+    log.info("    Reconciled {} accounts", len(merged))
     return merged
 
 
@@ -411,36 +985,17 @@ def _reconcile_transactions(api_df: pd.DataFrame, web_df: pd.DataFrame) -> pd.Da
     log.info("    Reconciling transaction data...")
 
     # Normalize web transaction column names if needed
-    # First, try exact display name mappings (from transaction.py Excel output)
-    display_to_programmatic = {
-        "Transaction ID": "transaction_id",
-        "Transaction Time": "transaction_time",
-        "Account ID": "account_id",
-        "Action": "action",
-        "Debit": "debit",
-        "Credit": "credit",
-    }
-    web_normalized = web_df.rename(
-        columns={
-            col: display_to_programmatic[col]
-            for col in web_df.columns
-            if col in display_to_programmatic
-        }
-    )
+    # First, try exact display name mappings (rename ignores absent keys)
+    web_normalized = web_df.rename(columns=TXN_DISPLAY_TO_PROGRAMMATIC)
 
     # Fallback: fuzzy matching for any columns not caught by exact mapping
-    fuzzy_rules = [
-        (["account", "id"], "account_id"),
-        (["account", "number"], "account_id"),
-        (["transaction", "id"], "transaction_id"),
-    ]
-    web_normalized = normalize_column_names(web_normalized, fuzzy_rules)
+    web_normalized = normalize_column_names(web_normalized, TXN_FUZZY_RULES)
     # Ensure account_id is string type in both DataFrames for consistent merging
     if "account_id" in api_df.columns:
-        api_df = api_df.copy()
+        api_df = api_df.copy(deep=False)
         api_df["account_id"] = api_df["account_id"].astype(str)
     if "account_id" in web_normalized.columns:
-        web_normalized = web_normalized.copy()
+        web_normalized = web_normalized.copy(deep=False)
         web_normalized["account_id"] = web_normalized["account_id"].astype(str)
 
     # Handle empty DataFrames
@@ -453,7 +1008,7 @@ def _reconcile_transactions(api_df: pd.DataFrame, web_df: pd.DataFrame) -> pd.Da
                     data_source="Web Only (API Empty)"
                 )
             except Exception as e:
-                log.warning(f"    Could not summarize web transactions: {e}")
+                log.warning("    Could not summarize web transactions: {}", e)
                 return pd.DataFrame(
                     [
                         {
@@ -476,7 +1031,7 @@ def _reconcile_transactions(api_df: pd.DataFrame, web_df: pd.DataFrame) -> pd.Da
                 data_source="API Only (Web Empty)"
             )
         except Exception as e:
-            log.warning(f"    Could not summarize API transactions: {e}")
+            log.warning("    Could not summarize API transactions: {}", e)
             return pd.DataFrame(
                 [
                     {
@@ -491,7 +1046,7 @@ def _reconcile_transactions(api_df: pd.DataFrame, web_df: pd.DataFrame) -> pd.Da
     # Verify required columns exist
     if "account_id" not in api_df.columns:
         log.error("    API transactions missing 'account_id' column")
-        log.error(f"    Available columns: {list(api_df.columns)}")
+        log.error("    Available columns: {}", list(api_df.columns))
         return pd.DataFrame(
             [
                 {
@@ -505,7 +1060,7 @@ def _reconcile_transactions(api_df: pd.DataFrame, web_df: pd.DataFrame) -> pd.Da
         log.error(
             "    Web transactions missing 'account_id' column after normalization"
         )
-        log.error(f"    Available columns: {list(web_normalized.columns)}")
+        log.error("    Available columns: {}", list(web_normalized.columns))
         return pd.DataFrame(
             [
                 {
@@ -515,6 +1070,9 @@ def _reconcile_transactions(api_df: pd.DataFrame, web_df: pd.DataFrame) -> pd.Da
             ]
         )
 
+    # Shared categorical key for the groupbys and the summary merge below
+    api_df, web_normalized = categorize_keys(api_df, web_normalized)
+
     # Group by account and calculate sums (with error handling)
     try:
         api_summary = group_and_sum_by_account(api_df, sum_cols=["debit", "credit"])
@@ -526,7 +1084,7 @@ def _reconcile_transactions(api_df: pd.DataFrame, web_df: pd.DataFrame) -> pd.Da
             }
         )
     except Exception as e:
-        log.error(f"    Failed to group API transactions: {e}")
+        log.error("    Failed to group API transactions: {}", e)
         return pd.DataFrame(
             [{"Status": "Error grouping API transactions", "Error": str(e)}]
         )
@@ -543,23 +1101,26 @@ def _reconcile_transactions(api_df: pd.DataFrame, web_df: pd.DataFrame) -> pd.Da
             }
         )
     except Exception as e:
-        log.error(f"    Failed to group web transactions: {e}")
+        log.error("    Failed to group web transactions: {}", e)
         return pd.DataFrame(
             [{"Status": "Error grouping web transactions", "Error": str(e)}]
         )
 
-    # Merge summaries
-    merged = pd.merge(api_summary, web_summary, on="account_id", how="outer")
+    # Merge summaries: join on the account_id index instead of a key column
+    merged = (
+        api_summary.set_index("account_id")
+        .join(web_summary.set_index("account_id"), how="outer")
+        .reset_index()
+    )
 
     # Calculate variances
-    merged = calculate_variance(
-        merged, "api_total_debits", "web_total_debits", result_col="debit_variance"
-    )
-    merged = calculate_variance(
-        merged, "api_total_credits", "web_total_credits", result_col="credit_variance"
-    )
-    merged = calculate_variance(
-        merged, "api_txn_count", "web_txn_count", result_col="txn_count_variance"
+    merged = calculate_variances(
+        merged,
+        [
+            ("api_total_debits", "web_total_debits", "debit_variance"),
+            ("api_total_credits", "web_total_credits", "credit_variance"),
+            ("api_txn_count", "web_txn_count", "txn_count_variance"),
+        ],
     )
 
     # Calculate net amounts
@@ -570,7 +1131,7 @@ def _reconcile_transactions(api_df: pd.DataFrame, web_df: pd.DataFrame) -> pd.Da
     # Determine match status
     merged = add_match_status(merged, "net_variance", tolerance=VARIANCE_TOLERANCE)
 
-    log.info(f"    Reconciled transactions for {len(merged)} accounts")
+    log.info("    Reconciled transactions for {} accounts", len(merged))
     return merged
 
 
@@ -584,8 +1145,8 @@ def _summarize_api_transactions(api_df: pd.DataFrame) -> pd.DataFrame:
     missing_cols = [col for col in required_cols if col not in api_df.columns]
 
     if missing_cols:
-        log.warning(f"    Missing columns for transaction summary: {missing_cols}")
-        log.warning(f"    Available columns: {list(api_df.columns)}")
+        log.warning("    Missing columns for transaction summary: {}", missing_cols)
+        log.warning("    Available columns: {}", list(api_df.columns))
         return pd.DataFrame(
             [
                 {
@@ -608,7 +1169,7 @@ def _summarize_api_transactions(api_df: pd.DataFrame) -> pd.DataFrame:
 
         return summary
     except Exception as e:
-        log.error(f"    Failed to summarize transactions: {e}")
+        log.error("    Failed to summarize transactions: {}", e)
         return pd.DataFrame(
             [{"Status": "Error summarizing transactions", "Error": str(e)}]
         )
@@ -666,12 +1227,7 @@ def _create_variance_summary(
         account_recon = report["account_recon"]
         # Only calculate matches/variances if match_status column exists (i.e., web data was available)
         if "match_status" in account_recon.columns:
-            matches = len(account_recon[account_recon["match_status"] == "Match"])
-            variances = len(
-                account_recon[
-                    account_recon["match_status"].str.contains("Variance", na=False)
-                ]
-            )
+            matches, variances = _match_counts(account_recon["match_status"])
 
             summary_rows.append(
                 {
@@ -693,10 +1249,7 @@ def _create_variance_summary(
         txn_recon = report["transaction_recon"]
         # Only calculate matches/variances if match_status column exists (i.e., web data was available)
         if "match_status" in txn_recon.columns:
-            txn_matches = len(txn_recon[txn_recon["match_status"] == "Match"])
-            txn_variances = len(
-                txn_recon[txn_recon["match_status"].str.contains("Variance", na=False)]
-            )
+            txn_matches, txn_variances = _match_counts(txn_recon["match_status"])
 
             summary_rows.append(
                 {
@@ -717,12 +1270,27 @@ def _create_variance_summary(
     return pd.DataFrame(summary_rows)
 
 
+def _match_counts(match_status: pd.Series) -> Tuple[int, int]:
+    """
+    Count matching and variance rows of a match_status column.
+
+    Boolean masks are summed directly instead of filtering the DataFrame,
+    and "Variance" is a plain substring test (regex=False).
+
+    Args:
+        match_status: match_status column from a reconciliation DataFrame
+
+    Returns:
+        Tuple of (matches, variances)
+    """
+    matches = int((match_status == "Match").sum())
+    variances = int(match_status.str.contains("Variance", na=False, regex=False).sum())
+    return matches, variances
+
+
 def _write_excel_report(report: Dict[str, pd.DataFrame]):
     """Write the comprehensive reconciliation report to Excel."""
-    log.info(f"  Writing {SHEET_API_VALIDATION} sheet to Excel...")
-
-    # Open existing Excel file and add new sheet
-    xw = ExcelWriter(settings.excel_path)
+    log.info("  Writing {} sheet to Excel...", SHEET_API_VALIDATION)
 
     # Create combined report with clear sections
     combined_sections = []
@@ -763,16 +1331,67 @@ def _write_excel_report(report: Dict[str, pd.DataFrame]):
 
     # Combine all sections
     if combined_sections:
-        final_df = pd.concat(combined_sections, ignore_index=True)
-        xw.write_df(SHEET_API_VALIDATION, final_df)
+        final_df = _stack_sections(combined_sections)
     else:
         # Fallback: write empty report
-        xw.write_df(
-            SHEET_API_VALIDATION, pd.DataFrame([{"Status": "No data available"}])
-        )
+        final_df = pd.DataFrame([{"Status": "No data available"}])
+
+    # Open existing Excel file and add new sheet
+    xw = ExcelWriter(settings.excel_path)
+    try:
+        xw.write_df(SHEET_API_VALIDATION, final_df)
+    finally:
+        xw.close()
+    log.info("  {} sheet written to {}", SHEET_API_VALIDATION, settings.excel_path)
+
+
+def _stack_sections(sections: List[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Stack report sections into one sheet-shaped DataFrame.
+
+    Same result as pd.concat(sections, ignore_index=True): columns are the
+    union in first-seen order and cells a section lacks are empty. Built as
+    one list per column, so the many one-row header and blank sections
+    don't each go through concat's block alignment.
+
+    Args:
+        sections: Section DataFrames in sheet order
+
+    Returns:
+        Combined DataFrame with a fresh RangeIndex
+    """
+    columns = list(dict.fromkeys(col for df in sections for col in df.columns))
+    data: Dict[Any, List[Any]] = {col: [] for col in columns}
+    for df in sections:
+        missing = [None] * len(df)
+        for col in columns:
+            data[col].extend(df[col].tolist() if col in df.columns else missing)
+    return pd.DataFrame(data, columns=columns)
+
+
+def _write_api_skipped_report():
+    """Write a report indicating Part 6 was skipped without calling the API."""
+    log.info("  Writing API skipped report to Excel...")
+
+    df = pd.DataFrame(
+        [
+            {
+                "Status": "Skipped",
+                "Message": "No web account or transaction data to reconcile",
+                "Note": "Set ALTORO_API_SNAPSHOT_REQUIRED=true to retrieve API data anyway",
+            }
+        ]
+    )
 
-    xw.close()
-    log.info(f"  {SHEET_API_VALIDATION} sheet written to {settings.excel_path}")
+    try:
+        xw = ExcelWriter(settings.excel_path)
+        try:
+            xw.write_df(SHEET_API_VALIDATION, df)
+        finally:
+            xw.close()
+        log.info("  API skipped report written to {}", settings.excel_path)
+    except Exception as e:
+        log.error("  Failed to write report: {}", e)
 
 
 def _write_api_unavailable_report():
@@ -793,8 +1412,10 @@ def _write_api_unavailable_report():
 
     try:
         xw = ExcelWriter(settings.excel_path)
-        xw.write_df(SHEET_API_VALIDATION, df)
-        xw.close()
-        log.info(f"  API unavailable report written to {settings.excel_path}")
+        try:
+            xw.write_df(SHEET_API_VALIDATION, df)
+        finally:
+            xw.close()
+        log.info("  API unavailable report written to {}", settings.excel_path)
     except Exception as e:
-        log.error(f"  Failed to write report: {e}")
+        log.error("  Failed to write report: {}", e)
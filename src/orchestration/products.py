@@ -1,17 +1,22 @@
 """Part 5: Product information extraction automation orchestration."""
 
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import List, Optional, Tuple
+from src.api.response_cache import ResponseCache
 from src.web.browser import browser_session
 from src.web.pages.products_page import ProductsPage
 from src.core.config import settings
 from src.core.excel import ExcelWriter
+from src.core.excel_helpers import shared_writer_context
 from src.core.logger import log
-from src.core.constants import SHEET_PRODUCT_CATALOG
+from src.core.constants import PRODUCT_COLUMNS, SHEET_PRODUCT_CATALOG
 from src.core.auth_helpers import authenticate_and_setup
 
 
-def run_part5_products() -> None:
+def run_part5_products(shared_writer: Optional[ExcelWriter] = None) -> None:
     """
     Execute Part 5: Product catalog extraction from PERSONAL and SMALL BUSINESS sections.
 
@@ -43,8 +48,16 @@ def run_part5_products() -> None:
     - Terms and conditions extraction (paragraphs starting with "Note:", "Terms:", etc.)
     - Last updated date extraction
     - Session recovery on timeout
+    - Categories scraped in settings.scrape_concurrency parallel browser
+      sessions when it is above 1
+    - Category page HTML reused across runs for settings.page_cache_ttl
+      seconds when it is above 0
     - Overwrites existing Excel file
 
+    Args:
+        shared_writer: ExcelWriter kept open across parts by run_all; if None
+            the part opens and saves the workbook itself
+
     Note:
         Uses configuration from settings:
         - base_url, user, password: Authentication
@@ -57,36 +70,138 @@ def run_part5_products() -> None:
         All products from one category share the same description, features,
         promotions, and terms.
     """
-    with browser_session(settings.trace_dir) as browser_context:
-        page = browser_context.new_page()
+    page_cache = _open_page_cache()
+    try:
+        with browser_session(
+            settings.trace_dir,
+            trace_name="trace_part5.zip",
+            storage_state=settings.storage_state_path,
+        ) as browser_context:
+            page = browser_context.new_page()
 
-        # Authenticate user and setup session context
-        products_page = ProductsPage(page)
-        authenticate_and_setup(page, settings.screenshot_dir, products_page)
+            # Authenticate user and setup session context
+            products_page = ProductsPage(
+                page, page_cache=page_cache, page_cache_ttl=settings.page_cache_ttl
+            )
+            authenticate_and_setup(page, settings.screenshot_dir, products_page)
 
-        # Scrape all products from all categories
-        log.info("Starting product catalog extraction...")
-        all_products = products_page.scrape_all_products()
-        log.info(
-            f"Product extraction complete - Total products extracted: {len(all_products)}"
-        )
+            # Scrape all products from all categories
+            log.info("Starting product catalog extraction...")
+            if settings.scrape_concurrency > 1:
+                all_products = _scrape_parallel(
+                    products_page, settings.scrape_concurrency
+                )
+            else:
+                all_products = products_page.scrape_all_products()
+            log.info(
+                "Product extraction complete - Total products extracted: {}",
+                len(all_products),
+            )
+    finally:
+        if page_cache is not None:
+            page_cache.close()
 
     # Convert to DataFrame for Excel output
-    products_df = pd.DataFrame(all_products)
+    # Rows are already tuples in column order, so no per-row key unification
+    products_df = pd.DataFrame.from_records(all_products, columns=PRODUCT_COLUMNS)
 
     # Prepare Excel output
     output_path = Path(settings.excel_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    excel_writer = ExcelWriter(str(output_path))
-    excel_writer.write_df(SHEET_PRODUCT_CATALOG, products_df)
-    excel_writer.close()
+    with shared_writer_context(str(output_path), shared_writer) as excel_writer:
+        excel_writer.write_df(SHEET_PRODUCT_CATALOG, products_df)
 
-    log.info(f"Product catalog written to Excel → {output_path}")
+    log.info("Product catalog written to Excel → {}", output_path)
     log.info(
-        f"Part 5 complete - {len(all_products)} products saved to {SHEET_PRODUCT_CATALOG} sheet"
+        "Part 5 complete - {} products saved to {} sheet",
+        len(all_products),
+        SHEET_PRODUCT_CATALOG,
     )
 
 
+def _scrape_parallel(
+    products_page: ProductsPage, workers: int
+) -> List[Tuple[str, ...]]:
+    """
+    Scrape product categories in parallel browser sessions.
+
+    The category URLs are collected on products_page, then split into
+    contiguous batches that worker threads scrape in their own, separately
+    authenticated browsers (sync Playwright objects can't cross threads).
+    Rows are merged in category order.
+
+    Args:
+        products_page: Authenticated ProductsPage used to collect the links
+        workers: Maximum number of parallel browser sessions
+
+    Returns:
+        List of all product rows (PRODUCT_COLUMNS order)
+    """
+    categories = products_page.collect_category_links()
+    workers = min(workers, len(categories))
+    if workers <= 1:
+        return products_page.scrape_categories(categories)
+
+    size = -(-len(categories) // workers)
+    batches = [categories[i : i + size] for i in range(0, len(categories), size)]
+    log.info(
+        "Scraping {} categories in {} parallel browser sessions",
+        len(categories),
+        len(batches),
+    )
+
+    with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+        results = list(
+            executor.map(
+                partial(_scrape_batch, page_cache=products_page.page_cache),
+                range(len(batches)),
+                batches,
+            )
+        )
+
+    return [row for rows in results for row in rows]
+
+
+def _scrape_batch(
+    worker: int,
+    categories: List[Tuple[str, str, str]],
+    page_cache: Optional[ResponseCache] = None,
+) -> List[Tuple[str, ...]]:
+    """
+    Scrape a batch of categories in a dedicated, separately authenticated browser.
+
+    Args:
+        worker: Worker index, used to name the trace file
+        categories: (section, category_name, url) tuples to scrape
+        page_cache: Category page cache shared with the other workers, or None
+
+    Returns:
+        Product rows for the batch
+    """
+    with browser_session(
+        settings.trace_dir,
+        trace_name=f"trace_part5_worker{worker}.zip",
+        storage_state=settings.storage_state_path,
+    ) as browser_context:
+        page = browser_context.new_page()
+        worker_page = ProductsPage(
+            page, page_cache=page_cache, page_cache_ttl=settings.page_cache_ttl
+        )
+        authenticate_and_setup(page, settings.screenshot_dir, worker_page)
+        return worker_page.scrape_categories(categories)
+
+
+def _open_page_cache() -> Optional[ResponseCache]:
+    """
+    Open the persistent category page cache if caching is enabled.
+
+    Returns:
+        ResponseCache in settings.cache_dir, or None when page_cache_ttl is 0
+    """
+    if settings.page_cache_ttl <= 0:
+        return None
+    return ResponseCache(str(Path(settings.cache_dir) / "page_cache.sqlite"))
+
+
 if __name__ == "__main__":
     run_part5_products()
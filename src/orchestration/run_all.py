@@ -1,6 +1,8 @@
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from src.core.config import settings
+from src.core.excel_helpers import excel_writer_context
 from src.core.logger import log
 from src.orchestration.account_login import run_part1_login
 from src.orchestration.accounts_summary import run_part2_accounts
@@ -8,24 +10,86 @@ from src.orchestration.transaction import run_part3_transactions
 from src.orchestration.transfer import run_part4_transfer
 from src.orchestration.products import run_part5_products
 from src.orchestration.api_validate import run_part6_api_validate
+from src.web.browser import close_main_thread_browser, discard_storage_state
 from src.core.constants import SHEET_ACCOUNT_SUMMARY, SHEET_FILTERED_TRANSACTIONS
 
+# Web sheet columns Part 6 reconciles on (display names as written by Parts 2
+# and 3, plus programmatic fallbacks); the rest are skipped when reading
+WEB_ACCOUNT_COLUMNS = frozenset(
+    {
+        "Account ID/Number",
+        "Total Balance",
+        "Available Balance",
+        "account_id",
+        "total",
+        "available",
+    }
+)
+WEB_TRANSACTION_COLUMNS = frozenset(
+    {
+        "Transaction ID",
+        "Account ID",
+        "Debit",
+        "Credit",
+        "transaction_id",
+        "account_id",
+        "debit",
+        "credit",
+    }
+)
 
-def run():
+
+def _run_browser_parts():
+    """Run Parts 1-5, which share the browser and the login saved by Part 1."""
     log.info("Part 1: Login")
     run_part1_login()
 
-    log.info("Part 2: Account summary → Excel")
-    run_part2_accounts()
+    if settings.parallel_parts:
+        # Parts 2, 3 and 5 only read from the site, so they can run side by
+        # side; each keeps its own browser since sync Playwright objects are
+        # bound to the thread that created them. Workbook writes are
+        # serialized by ExcelWriter's per-file lock (a writer shared across
+        # threads would not be), so each part saves the workbook itself.
+        log.info("Parts 2, 3 and 5: Accounts, transactions and products in parallel")
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [
+                pool.submit(run_part2_accounts),
+                pool.submit(run_part3_transactions),
+                pool.submit(run_part5_products),
+            ]
+            for future in futures:
+                future.result()
+
+        # Part 4 changes balances, so it runs after the read-only parts
+        log.info("Part 4: Transfer funds + verify")
+        run_part4_transfer()
+    else:
+        # One writer for Parts 2-5, so the workbook is loaded and saved once
+        # instead of once per part; it is saved before Part 6 reads it back
+        with excel_writer_context(settings.excel_path) as excel_writer:
+            log.info("Part 2: Account summary → Excel")
+            run_part2_accounts(excel_writer)
+
+            log.info("Part 3: Transactions + filters + high-value")
+            run_part3_transactions(excel_writer)
 
-    log.info("Part 3: Transactions + filters + high-value")
-    run_part3_transactions()
+            log.info("Part 4: Transfer funds + verify")
+            run_part4_transfer(excel_writer)
 
-    log.info("Part 4: Transfer funds + verify")
-    run_part4_transfer()
+            log.info("Part 5: Product catalog")
+            run_part5_products(excel_writer)
+
+
+def run():
+    try:
+        _run_browser_parts()
+    finally:
+        # The saved login holds live session cookies and is only needed by
+        # Parts 2-5 of this run
+        discard_storage_state(settings.storage_state_path)
 
-    log.info("Part 5: Product catalog")
-    run_part5_products()
+    # Parts 1-5 share one Chromium on this thread; Part 6 needs no browser
+    close_main_thread_browser()
 
     log.info("Part 6: API reconciliation")
     # Load web-scraped data for comparison
@@ -41,15 +105,17 @@ def run():
                     web_acc_df = pd.read_excel(
                         xf,
                         sheet_name=SHEET_ACCOUNT_SUMMARY,
+                        usecols=WEB_ACCOUNT_COLUMNS.__contains__,
                         dtype={"Account ID/Number": str},
                     )
-                    log.info(f"  Loaded {len(web_acc_df)} web accounts for comparison")
+                    log.info("  Loaded {} web accounts for comparison", len(web_acc_df))
 
                 # Load Filtered Transactions from Part 3
                 if SHEET_FILTERED_TRANSACTIONS in xf.sheet_names:
                     web_txn_df = pd.read_excel(
                         xf,
                         sheet_name=SHEET_FILTERED_TRANSACTIONS,
+                        usecols=WEB_TRANSACTION_COLUMNS.__contains__,
                         dtype={"Account ID": str},
                     )
                     # Remove summary rows (check for display column name "Transaction ID")
@@ -58,14 +124,14 @@ def run():
                     elif "transaction_id" in web_txn_df.columns:
                         web_txn_df = web_txn_df[web_txn_df["transaction_id"].notna()]
                     log.info(
-                        f"  Loaded {len(web_txn_df)} web transactions for comparison"
+                        "  Loaded {} web transactions for comparison", len(web_txn_df)
                     )
         except Exception as e:
-            log.warning(f"  Could not load web data for comparison: {e}")
+            log.warning("  Could not load web data for comparison: {}", e)
 
     run_part6_api_validate(web_acc_df, web_txn_df)
 
-    log.info(f"All parts complete. See: {settings.excel_path}")
+    log.info("All parts complete. See: {}", settings.excel_path)
 
 
 if __name__ == "__main__":
@@ -1,22 +1,26 @@
 """Part 3: Transaction analysis and advanced filtering automation orchestration."""
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
+from typing import Optional
 from src.web.browser import browser_session
-from src.web.pages.transactions_page import TransactionsPage
+from src.web.pages.transactions_page import Transaction, TransactionsPage
 from src.core.config import settings
 from src.core.excel import ExcelWriter
+from src.core.excel_helpers import shared_writer_context
 from src.core.logger import log
 from src.core.constants import (
     SHEET_FILTERED_TRANSACTIONS,
     SHEET_HIGH_VALUE_CREDITS,
     HIGH_VALUE_CREDIT_THRESHOLD,
     TRANSACTION_DISPLAY_COLUMNS,
+    TRANSACTION_FIELDS,
 )
 from src.core.auth_helpers import authenticate_and_setup
 
 
-def run_part3_transactions() -> None:
+def run_part3_transactions(shared_writer: Optional[ExcelWriter] = None) -> None:
     """
     Execute Part 3: Transaction analysis with date filtering and credit analysis.
 
@@ -45,15 +49,23 @@ def run_part3_transactions() -> None:
     - Session recovery on timeout
     - Overwrites existing Excel file
 
+    Args:
+        shared_writer: ExcelWriter kept open across parts by run_all; if None
+            the part opens and saves the workbook itself
+
     Note:
         Uses configuration from settings:
         - base_url, user, password: Authentication
         - filter_start, filter_end: Date range (yyyy-mm-dd format)
         - transaction_time_format: Datetime parsing format
         - excel_path: Output file path
-        Saves browser trace to settings.trace_dir
+        Saves browser trace to settings.trace_dir/trace_part3.zip
     """
-    with browser_session(settings.trace_dir) as browser_context:
+    with browser_session(
+        settings.trace_dir,
+        trace_name="trace_part3.zip",
+        storage_state=settings.storage_state_path,
+    ) as browser_context:
         page = browser_context.new_page()
 
         # Authenticate user and setup session context
@@ -68,97 +80,80 @@ def run_part3_transactions() -> None:
         # Note: Web UI filters all accounts automatically
         transactions_page.filter_dates(settings.filter_start, settings.filter_end)
         log.info(
-            f"Applied date filter: {settings.filter_start} to {settings.filter_end}"
+            "Applied date filter: {} to {}", settings.filter_start, settings.filter_end
         )
 
         # Extract all filtered transactions
         all_transactions = transactions_page.read_transactions(
             settings.transaction_time_format
         )
-        log.info(f"Extracted {len(all_transactions)} transactions from all accounts")
+        log.info("Extracted {} transactions from all accounts", len(all_transactions))
 
     # Convert to DataFrame for analysis
-    transactions_df = pd.DataFrame(all_transactions)
+    # Rows are Transaction tuples, so columns come from its fields
+    transactions_df = pd.DataFrame.from_records(
+        all_transactions, columns=Transaction._fields
+    )
 
     # Task 3.1: Filtered Transactions with Summary Statistics
-    if not transactions_df.empty:
-        # Prepare display DataFrame (exclude internal fields for cleaner Excel output)
-        display_df = transactions_df[
-            [
-                "transaction_id",
-                "transaction_time",
-                "account_id",
-                "action",
-                "debit",
-                "credit",
-            ]
-        ].copy()
+    # (None when there is nothing to report; the sheet is then header-only)
+    filtered_df: Optional[pd.DataFrame] = None
+    high_value_credits_df: Optional[pd.DataFrame] = None
 
-        # Rename columns for better Excel presentation
-        display_df.columns = TRANSACTION_DISPLAY_COLUMNS
-        filtered_df = display_df
+    if not transactions_df.empty:
+        # Project and rename once; both report sheets select rows from this
+        # display frame (exclude internal fields for cleaner Excel output)
+        filtered_df = transactions_df[TRANSACTION_FIELDS].rename(
+            columns=dict(zip(TRANSACTION_FIELDS, TRANSACTION_DISPLAY_COLUMNS)),
+            copy=False,
+        )
 
-        log.info(f"Task 3.1 Summary - {len(filtered_df)} transactions extracted")
+        log.info("Task 3.1 Summary - {} transactions extracted", len(filtered_df))
     else:
         log.warning("No transactions found in specified date range")
-        filtered_df = pd.DataFrame(columns=TRANSACTION_DISPLAY_COLUMNS)
 
     # Task 3.2: High-Value Credit Analysis
     if not transactions_df.empty:
-        # Filter for credits >= threshold (exclude summary row)
-        high_value_mask = transactions_df["credit"] >= HIGH_VALUE_CREDIT_THRESHOLD
-        high_value_df = transactions_df[high_value_mask].copy()
-
-        if not high_value_df.empty:
-            # Sort by credit amount in descending order
-            high_value_df = high_value_df.sort_values("credit", ascending=False)
-
-            # Prepare display DataFrame
-            display_high_value = high_value_df[
-                [
-                    "transaction_id",
-                    "transaction_time",
-                    "account_id",
-                    "action",
-                    "debit",
-                    "credit",
-                ]
-            ].copy()
-
-            display_high_value.columns = TRANSACTION_DISPLAY_COLUMNS
-            high_value_credits_df = display_high_value
-
+        # Filter for credits >= threshold (exclude summary row), sorted by
+        # credit amount in descending order. Only the positions of matching
+        # rows are sorted, on the raw credit array, and the display frame is
+        # gathered once in that order.
+        credit = transactions_df["credit"].to_numpy(dtype="float64", na_value=np.nan)
+        high_value_idx = np.flatnonzero(credit >= HIGH_VALUE_CREDIT_THRESHOLD)
+
+        if high_value_idx.size:
+            high_value_idx = high_value_idx[
+                np.argsort(-credit[high_value_idx], kind="stable")
+            ]
+            high_value_credits_df = filtered_df.iloc[high_value_idx]
             log.info(
-                f"Task 3.2 Summary - "
-                f"High-value credits (>= ${HIGH_VALUE_CREDIT_THRESHOLD:.2f}): {len(high_value_df)} transactions"
+                "Task 3.2 Summary - High-value credits (>= ${:.2f}): {} transactions",
+                HIGH_VALUE_CREDIT_THRESHOLD,
+                len(high_value_credits_df),
             )
         else:
             log.warning(
-                f"No credit transactions >= ${HIGH_VALUE_CREDIT_THRESHOLD:.2f} found"
+                "No credit transactions >= ${:.2f} found", HIGH_VALUE_CREDIT_THRESHOLD
             )
-            high_value_credits_df = pd.DataFrame(columns=TRANSACTION_DISPLAY_COLUMNS)
-    else:
-        high_value_credits_df = pd.DataFrame(columns=TRANSACTION_DISPLAY_COLUMNS)
 
     # Write Excel Output
     output_path = Path(settings.excel_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    excel_writer = ExcelWriter(str(output_path))
-
-    # Sheet 1: Filtered Transactions (Task 3.1)
-    excel_writer.write_df(SHEET_FILTERED_TRANSACTIONS, filtered_df)
-    log.info(f"Wrote {SHEET_FILTERED_TRANSACTIONS} sheet ({len(filtered_df)} rows)")
-
-    # Sheet 2: High Value Credits (Task 3.2)
-    excel_writer.write_df(SHEET_HIGH_VALUE_CREDITS, high_value_credits_df)
-    log.info(
-        f"Wrote {SHEET_HIGH_VALUE_CREDITS} sheet ({len(high_value_credits_df)} rows)"
-    )
-
-    excel_writer.close()
 
-    log.info(f"Part 3 complete → Excel workbook saved to {output_path}")
+    with shared_writer_context(str(output_path), shared_writer) as excel_writer:
+        for sheet, report_df in (
+            # Sheet 1: Filtered Transactions (Task 3.1)
+            (SHEET_FILTERED_TRANSACTIONS, filtered_df),
+            # Sheet 2: High Value Credits (Task 3.2)
+            (SHEET_HIGH_VALUE_CREDITS, high_value_credits_df),
+        ):
+            if report_df is None:
+                excel_writer.write_header_only(sheet, TRANSACTION_DISPLAY_COLUMNS)
+                log.info("Wrote {} sheet (0 rows)", sheet)
+            else:
+                excel_writer.write_df(sheet, report_df)
+                log.info("Wrote {} sheet ({} rows)", sheet, len(report_df))
+
+    log.info("Part 3 complete → Excel workbook saved to {}", output_path)
 
 
 if __name__ == "__main__":
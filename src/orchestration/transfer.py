@@ -1,13 +1,14 @@
 """Part 4: Automated fund transfer with balance verification orchestration."""
 
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, List, Optional, Tuple, Union
 from src.web.browser import browser_session
 from src.web.pages.accounts_page import AccountsPage
 from src.web.pages.transfer_page import TransferPage
 from src.core.config import settings
 from src.core.excel import ExcelWriter
+from src.core.excel_helpers import shared_writer_context
 from src.core.logger import log
 from src.core.utils import clean_account_name
 from src.core.constants import SHEET_TRANSFER_DETAILS
@@ -33,7 +34,49 @@ def get_balances(accounts_page: AccountsPage) -> Dict[str, Dict[str, Any]]:
     return accounts_by_name
 
 
-def run_part4_transfer() -> None:
+def get_balances_snapshot(
+    accounts_page: AccountsPage, known_accounts: Dict[str, Dict[str, Any]]
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Re-read balances of already known accounts, preferring plain HTTP.
+
+    Fetching the account pages over HTTP skips the browser render of every
+    account; the rendered page is only used if the snapshot fails.
+
+    Args:
+        accounts_page: AccountsPage instance to read balances from
+        known_accounts: Balances from get_balances(), indexed by account name
+
+    Returns:
+        Dictionary mapping account_name to account data, as get_balances()
+    """
+    accounts = accounts_page.fetch_balances(
+        settings.base_url,
+        [
+            (account["account_id"], account["account_name"])
+            for account in known_accounts.values()
+        ],
+    )
+    if accounts is None:
+        log.warning("HTTP balance snapshot failed, reading the account summary page")
+        accounts_page.open()
+        return get_balances(accounts_page)
+    return {account["account_name"]: account for account in accounts}
+
+
+def _blocks_assets() -> bool:
+    """
+    Whether Part 4 sessions may abort asset requests.
+
+    Returns:
+        settings.block_assets, unless confirmation screenshots can be taken
+        and need the fully styled page
+    """
+    screenshots = settings.transfer_screenshot_policy not in ("never", "api")
+    return settings.block_assets and not screenshots
+
+
+def run_part4_transfer(shared_writer: Optional[ExcelWriter] = None) -> None:
     """
     Execute Part 4: Automated fund transfer with verification and confirmation capture.
 
@@ -64,6 +107,10 @@ def run_part4_transfer() -> None:
     - Session recovery on timeout
     - Overwrites existing Excel file
 
+    Args:
+        shared_writer: ExcelWriter kept open across parts by run_all; if None
+            the part opens and saves the workbook itself
+
     Raises:
         AssertionError: If balance changes don't match expected transfer amount
 
@@ -72,11 +119,17 @@ def run_part4_transfer() -> None:
         - transfer_from: "800002 Savings"
         - transfer_to: "800003 Checking"
         - transfer_amount: 250.00
-        Saves browser trace to settings.trace_dir
-        Saves screenshot to settings.screenshot_dir
+        Saves browser trace to settings.trace_dir/trace_part4.zip
+        Saves screenshot to settings.screenshot_dir, as allowed by
+        settings.transfer_screenshot_policy
         Excel file saved to settings.excel_path
     """
-    with browser_session(settings.trace_dir) as browser_context:
+    with browser_session(
+        settings.trace_dir,
+        trace_name="trace_part4.zip",
+        storage_state=settings.storage_state_path,
+        block_assets=_blocks_assets(),
+    ) as browser_context:
         page = browser_context.new_page()
 
         # Authenticate user
@@ -88,42 +141,53 @@ def run_part4_transfer() -> None:
         accounts_page.open()
         balances_before = get_balances(accounts_page)
         log.info(
-            f"Captured balances BEFORE transfer for {len(balances_before)} accounts"
+            "Captured balances BEFORE transfer for {} accounts", len(balances_before)
         )
 
         # Initialize TransferPage with session recovery
-        transfer_page = TransferPage(page, settings.screenshot_dir)
+        transfer_page = TransferPage(
+            page,
+            settings.screenshot_dir,
+            screenshot_policy=settings.transfer_screenshot_policy,
+            screenshot_format=settings.transfer_screenshot_format,
+        )
         setup_session_context(transfer_page, login_page)
 
         # Execute transfer
         log.info(
-            f"Executing transfer: {settings.transfer_from} → {settings.transfer_to}, "
-            f"Amount: ${settings.transfer_amount:.2f}"
+            "Executing transfer: {} → {}, Amount: ${:.2f}",
+            settings.transfer_from,
+            settings.transfer_to,
+            settings.transfer_amount,
         )
         transfer_result = transfer_page.run_transfer(
             settings.transfer_from, settings.transfer_to, settings.transfer_amount
         )
-        log.info(f"Transfer executed - Status: {transfer_result['status']}")
-        log.info(f"Confirmation: {transfer_result['confirmation_message']}")
+        log.info("Transfer executed - Status: {}", transfer_result["status"])
+        log.info("Confirmation: {}", transfer_result["confirmation_message"])
         if transfer_result["reference_number"]:
-            log.info(f"Reference Number: {transfer_result['reference_number']}")
-        log.info(f"Screenshot saved: {transfer_result['screenshot']}")
+            log.info("Reference Number: {}", transfer_result["reference_number"])
+        if transfer_result["screenshot"]:
+            log.info("Screenshot saved: {}", transfer_result["screenshot"])
 
         # Get balances AFTER transfer
-        accounts_page.open()
-        balances_after = get_balances(accounts_page)
-        log.info(f"Captured balances AFTER transfer for {len(balances_after)} accounts")
+        balances_after = get_balances_snapshot(accounts_page, balances_before)
+        log.info(
+            "Captured balances AFTER transfer for {} accounts", len(balances_after)
+        )
 
     # Extract balances for verification
     source_account = balances_before.get(settings.transfer_from)
     destination_account = balances_before.get(settings.transfer_to)
 
     if not source_account:
-        log.error(f"Source account '{settings.transfer_from}' not found in balances")
+        log.error("Source account '{}' not found in balances", settings.transfer_from)
         raise ValueError(f"Source account '{settings.transfer_from}' not found")
 
     if not destination_account:
-        log.error(f"Destination account '{settings.transfer_to}' not found in balances")
+        log.error(
+            "Destination account '{}' not found in balances", settings.transfer_to
+        )
         raise ValueError(f"Destination account '{settings.transfer_to}' not found")
 
     source_balance_before = source_account["total"]
@@ -146,22 +210,28 @@ def run_part4_transfer() -> None:
 
     if source_verified:
         log.info(
-            f"Source balance verified: ${source_balance_before:.2f} → ${source_balance_after:.2f}"
+            "Source balance verified: ${:.2f} → ${:.2f}",
+            source_balance_before,
+            source_balance_after,
         )
     else:
         log.error(
-            f"Source balance mismatch: "
-            f"Expected ${source_expected:.2f}, Got ${source_actual:.2f}"
+            "Source balance mismatch: Expected ${:.2f}, Got ${:.2f}",
+            source_expected,
+            source_actual,
         )
 
     if destination_verified:
         log.info(
-            f"Destination balance verified: ${destination_balance_before:.2f} → ${destination_balance_after:.2f}"
+            "Destination balance verified: ${:.2f} → ${:.2f}",
+            destination_balance_before,
+            destination_balance_after,
         )
     else:
         log.error(
-            f"Destination balance mismatch: "
-            f"Expected ${destination_expected:.2f}, Got ${destination_actual:.2f}"
+            "Destination balance mismatch: Expected ${:.2f}, Got ${:.2f}",
+            destination_expected,
+            destination_actual,
         )
 
     # Assert verification (will raise if failed)
@@ -176,34 +246,114 @@ def run_part4_transfer() -> None:
 
     log.info("All balance changes verified successfully")
 
-    # Prepare Excel output
-    transfer_details_df = pd.DataFrame(
-        [
-            {
-                "Source Account": clean_account_name(settings.transfer_from),
-                "Destination Account": clean_account_name(settings.transfer_to),
-                "Transfer Amount": settings.transfer_amount,
-                "Confirmation Message": transfer_result["confirmation_message"],
-                "Transaction Timestamp": transfer_result["timestamp"],
-                "Source Balance Before": source_balance_before,
-                "Source Balance After": source_balance_after,
-                "Destination Balance Before": destination_balance_before,
-                "Destination Balance After": destination_balance_after,
-            }
-        ]
-    )
+    # Prepare Excel output (a single record, written without a DataFrame)
+    transfer_details = {
+        "Source Account": clean_account_name(settings.transfer_from),
+        "Destination Account": clean_account_name(settings.transfer_to),
+        "Transfer Amount": settings.transfer_amount,
+        "Confirmation Message": transfer_result["confirmation_message"],
+        "Transaction Timestamp": transfer_result["timestamp"],
+        "Source Balance Before": source_balance_before,
+        "Source Balance After": source_balance_after,
+        "Destination Balance Before": destination_balance_before,
+        "Destination Balance After": destination_balance_after,
+    }
 
     # Write to Excel
     output_path = Path(settings.excel_path)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    excel_writer = ExcelWriter(str(output_path))
-    excel_writer.write_df(SHEET_TRANSFER_DETAILS, transfer_details_df)
-    excel_writer.close()
+    with shared_writer_context(str(output_path), shared_writer) as excel_writer:
+        excel_writer.write_dict_row(SHEET_TRANSFER_DETAILS, transfer_details)
 
-    log.info(f"Transfer details written to Excel → {output_path}")
+    log.info("Transfer details written to Excel → {}", output_path)
     log.info("Part 4 complete - Transfer executed and verified successfully")
 
 
+def run_many_transfers(
+    transfers: List[Tuple[str, str, float]],
+    concurrency: Optional[int] = None,
+) -> List[Union[Dict[str, Any], Exception]]:
+    """
+    Execute many transfers in parallel browser sessions.
+
+    Transfers are split into contiguous batches that worker threads run in
+    their own browsers, each authenticated from the saved storage state
+    (sync Playwright objects can't cross threads). A failed transfer does
+    not stop the others in its batch.
+
+    Args:
+        transfers: (from_account_label, to_account_label, amount) tuples
+        concurrency: Maximum number of parallel browser sessions; defaults
+            to settings.scrape_concurrency
+
+    Returns:
+        run_transfer() result or raised exception for each transfer, in
+        input order
+    """
+    if not transfers:
+        return []
+
+    if concurrency is None:
+        concurrency = settings.scrape_concurrency
+    workers = max(1, min(concurrency, len(transfers)))
+    size = -(-len(transfers) // workers)
+    batches = [transfers[i : i + size] for i in range(0, len(transfers), size)]
+    log.info(
+        "Executing {} transfers in {} parallel browser sessions",
+        len(transfers),
+        len(batches),
+    )
+
+    with ThreadPoolExecutor(max_workers=len(batches)) as executor:
+        results = list(executor.map(_transfer_batch, range(len(batches)), batches))
+
+    return [result for batch_results in results for result in batch_results]
+
+
+def _transfer_batch(
+    worker: int, transfers: List[Tuple[str, str, float]]
+) -> List[Union[Dict[str, Any], Exception]]:
+    """
+    Execute a batch of transfers in a dedicated, separately authenticated browser.
+
+    Args:
+        worker: Worker index, used to name the trace file
+        transfers: (from_account_label, to_account_label, amount) tuples
+
+    Returns:
+        run_transfer() result or raised exception for each transfer
+    """
+    results: List[Union[Dict[str, Any], Exception]] = []
+    with browser_session(
+        settings.trace_dir,
+        trace_name=f"trace_part4_worker{worker}.zip",
+        storage_state=settings.storage_state_path,
+        block_assets=_blocks_assets(),
+    ) as browser_context:
+        page = browser_context.new_page()
+        login_page = authenticate_user(page, settings.screenshot_dir)
+        transfer_page = TransferPage(
+            page,
+            settings.screenshot_dir,
+            screenshot_policy=settings.transfer_screenshot_policy,
+            screenshot_format=settings.transfer_screenshot_format,
+        )
+        setup_session_context(transfer_page, login_page)
+
+        for from_label, to_label, amount in transfers:
+            try:
+                results.append(transfer_page.run_transfer(from_label, to_label, amount))
+            except Exception as e:
+                log.error(
+                    "Transfer {} → {} (${:.2f}) failed: {}",
+                    from_label,
+                    to_label,
+                    amount,
+                    e,
+                )
+                results.append(e)
+    return results
+
+
 if __name__ == "__main__":
     run_part4_transfer()
@@ -1,44 +1,210 @@
 """Browser session management with Playwright."""
 
-from playwright.sync_api import sync_playwright, BrowserContext
-from contextlib import contextmanager
+import atexit
+import json
+import os
+import re
+import threading
+from contextlib import ExitStack, contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Optional, Tuple
+
+from playwright.sync_api import (
+    Browser,
+    BrowserContext,
+    Playwright,
+    Route,
+    sync_playwright,
+)
+
+from src.core.config import settings
+
+# Chromium switches that skip startup work a headless scraper never needs
+CHROMIUM_ARGS = ["--disable-gpu", "--disable-dev-shm-usage", "--disable-extensions"]
+
+# Request types no scraper reads; aborted when settings.block_assets is set
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font", "stylesheet"})
+
+# Analytics and ad hosts, aborted along with BLOCKED_RESOURCE_TYPES whatever
+# the resource type (their scripts and beacons only slow page loads down)
+BLOCKED_URL_RE = re.compile(
+    r"^https?://([^/]*\.)?("
+    r"google-analytics\.com|googletagmanager\.com|doubleclick\.net"
+    r"|googlesyndication\.com|hotjar\.com|segment\.(io|com)"
+    r")(:\d+)?/",
+    re.IGNORECASE,
+)
+
+# Browser launched on the main thread and reused by every part run there;
+# sync Playwright objects can't cross threads, so other threads launch their own
+_main_thread_browser: Optional[Tuple[Playwright, Browser]] = None
+
+
+def _launch(playwright: Playwright) -> Browser:
+    """
+    Launch headless Chromium.
+
+    Args:
+        playwright: Running Playwright instance
+
+    Returns:
+        Launched Browser
+    """
+    return playwright.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+
+
+def _get_main_thread_browser() -> Browser:
+    """
+    Get the shared main-thread browser, launching it on first use.
+
+    Returns:
+        Connected Browser, relaunched if the previous one was disconnected
+    """
+    global _main_thread_browser
+    if _main_thread_browser is not None and not _main_thread_browser[1].is_connected():
+        close_main_thread_browser()
+    if _main_thread_browser is None:
+        playwright = sync_playwright().start()
+        _main_thread_browser = (playwright, _launch(playwright))
+    return _main_thread_browser[1]
+
+
+def _block_assets(route: Route) -> None:
+    """
+    Abort requests for assets the scrapers never read; let the rest through.
+
+    Args:
+        route: Intercepted request route
+    """
+    request = route.request
+    if request.resource_type in BLOCKED_RESOURCE_TYPES or BLOCKED_URL_RE.match(
+        request.url
+    ):
+        route.abort()
+    else:
+        route.continue_()
+
+
+def save_storage_state(browser_context: BrowserContext, path: str) -> None:
+    """
+    Save the context's cookies and local storage for later sessions.
+
+    The file holds live session cookies, so it is created readable by the
+    owner only (0600); remove it with discard_storage_state() once the run
+    no longer needs it.
+
+    Args:
+        browser_context: Logged-in browser context
+        path: Storage state JSON path; parent directories are created
+    """
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    state = browser_context.storage_state()
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    # O_CREAT's mode doesn't apply to an existing file
+    os.fchmod(fd, 0o600)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+
+
+def discard_storage_state(path: str) -> None:
+    """
+    Delete a storage state file saved by save_storage_state(), if present.
+
+    Args:
+        path: Storage state JSON path
+    """
+    Path(path).unlink(missing_ok=True)
+
+
+@atexit.register
+def close_main_thread_browser() -> None:
+    """Close the shared main-thread browser and stop its Playwright driver."""
+    global _main_thread_browser
+    if _main_thread_browser is None:
+        return
+    playwright, browser = _main_thread_browser
+    _main_thread_browser = None
+    try:
+        browser.close()
+    finally:
+        playwright.stop()
 
 
 @contextmanager
-def browser_session(trace_dir: str) -> Generator[BrowserContext, None, None]:
+def browser_session(
+    trace_dir: str,
+    trace_name: str = "trace.zip",
+    storage_state: Optional[str] = None,
+    block_assets: Optional[bool] = None,
+) -> Generator[BrowserContext, None, None]:
     """
-    Context manager for Playwright browser session with tracing enabled.
+    Context manager for Playwright browser session with optional tracing.
 
     Creates a Chromium browser instance with:
-    - Headless mode enabled
+    - Headless mode enabled, launched once per process on the main thread
+      and reused with a fresh context per session (other threads launch a
+      browser per session)
     - HTTPS errors ignored (for testing environments)
     - Fixed viewport size (1280x900)
-    - Tracing with screenshots, snapshots, and sources
+    - Tracing with snapshots and sources when settings.enable_trace is set,
+      plus screenshots when settings.trace_screenshots is also set
+    - Image, media, font, stylesheet and analytics requests aborted when
+      block_assets is set, so pages finish loading sooner
 
     Args:
-        trace_dir: Directory path where trace.zip will be saved
+        trace_dir: Directory path where the trace will be saved
+        trace_name: Trace file name (default: "trace.zip")
+        storage_state: Playwright storage state JSON to preload cookies and
+            local storage from; ignored if None or the file doesn't exist
+        block_assets: Abort requests no scraper reads; None uses
+            settings.block_assets. Pass False for sessions whose screenshots
+            must show the fully styled page.
 
     Yields:
         BrowserContext: Playwright browser context for page operations
     Note:
-        - Creates trace_dir if it doesn't exist
-        - Automatically closes browser and saves trace on exit
-        - Trace file saved as: {trace_dir}/trace.zip
+        - Creates trace_dir if tracing is enabled and it doesn't exist
+        - Automatically closes the context (and a per-session browser) and
+          saves trace on exit
+        - Trace file saved as: {trace_dir}/{trace_name}
+        - A preloaded storage state lets authenticate_user() skip the login
+          form while the saved session is still valid
     """
-    Path(trace_dir).mkdir(parents=True, exist_ok=True)
+    # Tracing serializes DOM snapshots (and screenshots) for every action,
+    # so it is debugging-only and off by default
+    if settings.enable_trace:
+        Path(trace_dir).mkdir(parents=True, exist_ok=True)
+
+    with ExitStack() as stack:
+        if threading.current_thread() is threading.main_thread():
+            browser = _get_main_thread_browser()
+        else:
+            playwright = stack.enter_context(sync_playwright())
+            browser = _launch(playwright)
+            stack.callback(browser.close)
 
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=True)
         browser_context = browser.new_context(
-            ignore_https_errors=True, viewport={"width": 1280, "height": 900}
+            ignore_https_errors=True,
+            viewport={"width": 1280, "height": 900},
+            storage_state=(
+                storage_state
+                if storage_state and Path(storage_state).exists()
+                else None
+            ),
         )
-        browser_context.tracing.start(screenshots=True, snapshots=True, sources=True)
+        if block_assets is None:
+            block_assets = settings.block_assets
+        if block_assets:
+            browser_context.route("**/*", _block_assets)
+        if settings.enable_trace:
+            browser_context.tracing.start(
+                screenshots=settings.trace_screenshots, snapshots=True, sources=True
+            )
 
         try:
             yield browser_context
         finally:
-            trace_path = str(Path(trace_dir) / "trace.zip")
-            browser_context.tracing.stop(path=trace_path)
-            browser.close()
+            if settings.enable_trace:
+                trace_path = str(Path(trace_dir) / trace_name)
+                browser_context.tracing.stop(path=trace_path)
+            browser_context.close()
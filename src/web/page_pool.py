@@ -0,0 +1,74 @@
+"""Reusable Playwright page pool keyed by BrowserContext."""
+
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Generator
+from weakref import WeakKeyDictionary
+
+from playwright.sync_api import BrowserContext, Page
+
+from src.core.logger import log
+
+
+# Idle pages per browser context; entries vanish with their context
+_idle_pages: "WeakKeyDictionary[BrowserContext, Deque[Page]]" = WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def acquire_page(browser_context: BrowserContext) -> Page:
+    """
+    Get an idle page from the context's pool, or open a new one.
+
+    Args:
+        browser_context: Browser context the page belongs to
+
+    Returns:
+        Open Playwright Page; its current URL is whatever the last user left
+    """
+    with _lock:
+        idle = _idle_pages.get(browser_context)
+        while idle:
+            page = idle.pop()
+            if not page.is_closed():
+                log.debug("Reusing pooled page")
+                return page
+
+    return browser_context.new_page()
+
+
+def release_page(browser_context: BrowserContext, page: Page) -> None:
+    """
+    Return a page to the context's pool for reuse.
+
+    Args:
+        browser_context: Browser context the page belongs to
+        page: Page previously obtained from acquire_page()
+    """
+    if page.is_closed():
+        return
+    with _lock:
+        _idle_pages.setdefault(browser_context, deque()).append(page)
+
+
+@contextmanager
+def pooled_page(browser_context: BrowserContext) -> Generator[Page, None, None]:
+    """
+    Context manager that acquires a pooled page and releases it on exit.
+
+    Args:
+        browser_context: Browser context the page belongs to
+
+    Yields:
+        Page: Open Playwright Page
+
+    Example:
+        >>> with browser_session(settings.trace_dir) as browser_context:
+        ...     with pooled_page(browser_context) as page:
+        ...         login_page = authenticate_user(page, settings.screenshot_dir)
+    """
+    page = acquire_page(browser_context)
+    try:
+        yield page
+    finally:
+        release_page(browser_context, page)
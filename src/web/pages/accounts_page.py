@@ -1,9 +1,13 @@
 """Account summary page automation for Altoro Mutual."""
 
-from typing import Dict, List, Iterator, Tuple, Optional, Any
+from dataclasses import dataclass, field
+from typing import Dict, List, Iterable, Iterator, Sequence, Tuple, Optional, Any
+
+import lxml.html
+import pandas as pd
 from playwright.sync_api import Page, Locator
 
-from src.core.utils import parse_money, clean_account_name
+from src.core.utils import parse_money, parse_money_series, clean_account_name
 from src.web.pages.base_page import BasePage
 from src.core.session_handler import with_session_retry
 from src.core.constants import (
@@ -13,6 +17,83 @@ from src.core.constants import (
 )
 from src.core.logger import log
 
+# Browser-side extraction scripts: each returns a whole table (or option
+# list) as plain, already trimmed strings in one round trip, instead of one
+# Playwright call per row and cell
+
+# Cell texts of every row of a table element
+TABLE_CELLS_JS = """table => Array.from(
+    table.querySelectorAll("tr"),
+    row => Array.from(row.querySelectorAll("td"), cell => cell.innerText.trim())
+)"""
+
+# XPath of the first table with a "Balance Detail" header; matching on text
+# content avoids computing innerText (a layout pass) for every header
+BALANCE_DETAIL_TABLE_XPATH = "//table[.//th[contains(., 'Balance Detail')]]"
+
+# Cell texts of every row of the Balance Detail table, or null if the page
+# has none
+BALANCE_DETAIL_CELLS_JS = """xpath => {
+    const table = document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    return table ? Array.from(
+        table.querySelectorAll("tr"),
+        row => Array.from(row.querySelectorAll("td"), cell => cell.innerText.trim())
+    ) : null;
+}"""
+
+# Everything run() reads from an account page in one round trip: the Balance
+# Detail rows plus the Credits and Debits table rows (null where the table
+# is missing or its div is hidden, matching Locator.is_visible())
+ACCOUNT_PAGE_JS = """xpath => {
+    const cells = table => Array.from(
+        table.querySelectorAll("tr"),
+        row => Array.from(row.querySelectorAll("td"), cell => cell.innerText.trim())
+    );
+    const historyRows = divSelector => {
+        const div = document.querySelector(divSelector);
+        if (!div || !div.getClientRects().length
+            || getComputedStyle(div).visibility === "hidden") {
+            return null;
+        }
+        const table = div.querySelector("table");
+        return table ? cells(table) : null;
+    };
+    const balance = document.evaluate(
+        xpath, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+    ).singleNodeValue;
+    return {
+        balance: balance ? cells(balance) : null,
+        credits: historyRows("div#credits"),
+        debits: historyRows("div#debits"),
+    };
+}"""
+
+# [value attribute, text] of every option element
+OPTION_PAIRS_JS = """options => options.map(option =>
+    [(option.getAttribute("value") ?? "").trim(), option.innerText.trim()])"""
+
+
+@dataclass(slots=True)
+class AccountRecord:
+    """Everything scraped for one account: its balances and transaction history."""
+
+    account_id: str
+    account_name: str
+    total: float
+    available: float
+    transactions: List[Dict[str, Any]] = field(default_factory=list)
+
+    def summary_row(self) -> Tuple[str, str, float, float]:
+        """
+        Get the account's Account_Summary sheet row.
+
+        Returns:
+            Tuple of values in ACCOUNT_SUMMARY_COLUMNS order
+        """
+        return self.account_id, self.account_name, self.total, self.available
+
 
 class AccountsPage(BasePage):
     """
@@ -26,8 +107,8 @@ class AccountsPage(BasePage):
     - Auto-recovery from session timeouts
 
     Attributes:
-        accounts_summary: Dictionary mapping account_id to balance data
-        transaction_history: Dictionary mapping account_id to transaction list
+        accounts: Dictionary mapping account_id to its AccountRecord, in
+            scraping order
     """
 
     def __init__(self, page: Page) -> None:
@@ -38,8 +119,25 @@ class AccountsPage(BasePage):
             page: Playwright Page object for browser automation
         """
         super().__init__(page)
-        self.accounts_summary: Dict[str, Dict[str, Any]] = {}
-        self.transaction_history: Dict[str, List[Dict[str, Any]]] = {}
+        self.accounts: Dict[str, AccountRecord] = {}
+        # Dropdown options, read once: the account list is fixed for a login
+        self._account_options: Optional[List[Tuple[str, str]]] = None
+
+    @property
+    def accounts_summary(self) -> Dict[str, Dict[str, Any]]:
+        """Dictionary mapping account_id to its Account_Summary row as a dict."""
+        return {
+            account_id: dict(zip(ACCOUNT_SUMMARY_COLUMNS, record.summary_row()))
+            for account_id, record in self.accounts.items()
+        }
+
+    @property
+    def transaction_history(self) -> Dict[str, List[Dict[str, Any]]]:
+        """Dictionary mapping account_id to its transaction list."""
+        return {
+            account_id: record.transactions
+            for account_id, record in self.accounts.items()
+        }
 
     def open(self) -> None:
         """
@@ -64,17 +162,13 @@ class AccountsPage(BasePage):
             This method only reads the dropdown options without changing UI state.
             Use iter_accounts() if you need to navigate through each account.
         """
-        account_options = self.page.locator(f"{SELECTOR_ACCOUNT_DROPDOWN} option").all()
         accounts = []
 
-        for option in account_options:
-            account_id = option.get_attribute("value")
-            account_name = option.inner_text().strip()
-
-            if account_id and account_id.strip():
+        for account_id, account_name in self.read_account_options():
+            if account_id:
                 accounts.append(
                     {
-                        "account_id": account_id.strip(),
+                        "account_id": account_id,
                         "account_name": clean_account_name(account_name),
                     }
                 )
@@ -122,15 +216,43 @@ class AccountsPage(BasePage):
 
         return accounts_data
 
-    def iter_accounts(self) -> Iterator[Tuple[str, str]]:
+    def read_account_options(self) -> List[Tuple[str, str]]:
+        """
+        Read the raw (account_id, account_name) pairs from the dropdown selector.
+
+        Returns:
+            List of (account_id, account_name) tuples, names not yet cleaned
+
+        Note:
+            Snapshots every option in one round trip, so iter_accounts()
+            walks plain tuples rather than option handles that each
+            navigation would force Playwright to re-resolve. The snapshot is
+            kept for later calls, since a user's accounts do not change
+            while they are logged in.
+        """
+        if self._account_options is None:
+            options = self.page.eval_on_selector_all(
+                f"{SELECTOR_ACCOUNT_DROPDOWN} option", OPTION_PAIRS_JS
+            )
+            log.info("Found Accounts: {}", len(options))
+            self._account_options = [tuple(option) for option in options]
+        return self._account_options
+
+    def iter_accounts(
+        self, accounts: Optional[Iterable[Tuple[str, str]]] = None
+    ) -> Iterator[Tuple[str, str]]:
         """
-        Iterate through all accounts in the dropdown selector.
+        Iterate through accounts in the dropdown selector.
 
         For each account:
         1. Selects the account from dropdown
         2. Clicks "Get Account" button
         3. Yields account ID and name
 
+        Args:
+            accounts: (account_id, account_name) pairs to visit; defaults to
+                every account in the dropdown
+
         Yields:
             Tuple of (account_id, account_name) for each account
 
@@ -138,14 +260,17 @@ class AccountsPage(BasePage):
             >>> for account_id, name in accounts_page.iter_accounts():
             ...     print(f"Processing {account_id}: {name}")
         """
-        accounts = self.page.locator(f"{SELECTOR_ACCOUNT_DROPDOWN} option").all()
-        log.info(f"Found Accounts: {len(accounts)}")
-        for account in accounts:
-            account_id = account.get_attribute("value").strip()
-            account_name = account.inner_text().strip()
-            self.select_option(SELECTOR_ACCOUNT_DROPDOWN, value=account_id)
-            self.click(SELECTOR_GET_ACCOUNT_BUTTON)
-            yield account_id, account_name
+        if accounts is None:
+            accounts = self.read_account_options()
+        # Resolved once; Locators re-query lazily, so they survive navigation
+        dropdown = self._loc(SELECTOR_ACCOUNT_DROPDOWN)
+        get_account_button = self._loc(SELECTOR_GET_ACCOUNT_BUTTON)
+        # Scraping loop with no human in it, so skip the per-action delays
+        with self.no_humanization():
+            for account_id, account_name in accounts:
+                self.select_option(dropdown, value=account_id)
+                self.click(get_account_button)
+                yield account_id, account_name
 
     def parse_summary(self) -> Dict[str, Any]:
         """
@@ -162,44 +287,109 @@ class AccountsPage(BasePage):
             Returns zeros if table not found.
 
         Note:
-            Uses Playwright locators to parse the page DOM.
+            Finds the table with a native XPath query and reads all of its
+            cells in the same browser-side evaluate (BALANCE_DETAIL_CELLS_JS).
+        """
+        # Find the Balance Detail table by its header and extract its rows
+        rows = self.page.evaluate(BALANCE_DETAIL_CELLS_JS, BALANCE_DETAIL_TABLE_XPATH)
+        return parse_balance_rows(rows or [])
+
+    def fetch_balances(
+        self, base_url: str, accounts: Iterable[Tuple[str, str]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Read account balances over HTTP without rendering the pages.
+
+        Requests each account's detail page through the page's
+        APIRequestContext, which shares the browser context's session
+        cookies, and parses its Balance Detail table like parse_summary().
+
+        Args:
+            base_url: Base URL of the site (e.g., "https://demo.testfire.net")
+            accounts: (account_id, account_name) pairs to read
+
+        Returns:
+            Records shaped like read_table()'s, or None if any account page
+            could not be fetched or parsed (e.g., the session has expired);
+            callers then fall back to open() and read_table()
+        """
+        accounts_data = []
+
+        for account_id, account_name in accounts:
+            summary = parse_balance_detail_html(
+                self._fetch_account_html(base_url, account_id)
+            )
+            if summary is None:
+                return None
+
+            accounts_data.append(
+                {
+                    "account_id": account_id,
+                    "account_name": account_name,
+                    "total": summary["Total Balance"],
+                    "available": summary["Available Balance"],
+                }
+            )
+
+        return accounts_data
+
+    def fetch_accounts(
+        self, base_url: str, accounts: Iterable[Tuple[str, str]]
+    ) -> Optional[Dict[str, AccountRecord]]:
+        """
+        Scrape balances and transaction history over HTTP, without rendering.
+
+        HTTP counterpart of run(): fetches each account's detail page like
+        fetch_balances() and parses its Balance Detail, Credits and Debits
+        tables from the static HTML (parse_account_html()).
+
+        Args:
+            base_url: Base URL of the site (e.g., "https://demo.testfire.net")
+            accounts: (account_id, account_name) pairs to read
+
+        Returns:
+            Dictionary mapping account_id to AccountRecord, or None if any
+            account page could not be fetched or parsed (e.g., the session
+            has expired or the page layout changed); callers then fall back
+            to run()
+        """
+        records = {}
+
+        for account_id, account_name in accounts:
+            parsed = parse_account_html(self._fetch_account_html(base_url, account_id))
+            if parsed is None:
+                return None
+
+            summary, transactions = parsed
+            records[account_id] = AccountRecord(
+                account_id=account_id,
+                account_name=clean_account_name(account_name),
+                total=summary["Total Balance"],
+                available=summary["Available Balance"],
+                transactions=transactions,
+            )
+
+        return records
+
+    def _fetch_account_html(self, base_url: str, account_id: str) -> str:
+        """
+        Fetch an account detail page through the page's APIRequestContext.
+
+        Args:
+            base_url: Base URL of the site
+            account_id: Account to request
+
+        Returns:
+            Page HTML, or "" if the request failed
         """
-        # Find the Balance Detail table by looking for the header
-        balance_table = None
-        tables = self.page.locator("table").all()
-
-        for table in tables:
-            # Check if this table has a <th> containing "Balance Detail"
-            headers = table.locator("th").all()
-            for header in headers:
-                if "Balance Detail" in header.inner_text():
-                    balance_table = table
-                    break
-            if balance_table:
-                break
-
-        if not balance_table:
-            return {"Total Balance": 0.0, "Available Balance": 0.0}
-
-        # Extract all rows
-        rows = balance_table.locator("tr").all()
-
-        total_balance = 0.0
-        available_balance = 0.0
-
-        for row in rows:
-            cells = row.locator("td").all()
-            if len(cells) >= 2:
-                label = cells[0].inner_text().strip()
-                value = cells[1].inner_text().strip()
-
-                # Check for "Ending balance" (maps to Total Balance)
-                if "Ending balance" in label:
-                    total_balance = parse_money(value)
-                # Check for "Available balance"
-                elif "Available balance" in label:
-                    available_balance = parse_money(value)
-        return {"Total Balance": total_balance, "Available Balance": available_balance}
+        try:
+            response = self.page.request.get(
+                f"{base_url}/bank/showAccount", params={"listAccounts": account_id}
+            )
+            return response.text() if response.ok else ""
+        except Exception as e:
+            log.debug("Account page request for {} failed: {}", account_id, e)
+            return ""
 
     def parse_transaction_history_table(
         self, table: Optional[Locator], credit: bool
@@ -223,19 +413,32 @@ class AccountsPage(BasePage):
         """
         if not table:
             return []
-        records = []
-        rows = table.locator("tr").all()
-        for row in rows:
-            cells = row.locator("td").all()
-            if len(cells) >= 4:
-                amount_key = "Credit Amount" if credit else "Debit Amount"
-                transaction = {
-                    "Transaction Date": cells[1].inner_text().strip(),
-                    "Transaction Description": cells[2].inner_text().strip(),
-                    amount_key: parse_money(cells[3].inner_text().strip()),
-                }
-                records.append(transaction)
-        return records
+        # Whole table in one round trip; cells are parsed in Python
+        return parse_transaction_rows(table.evaluate(TABLE_CELLS_JS), credit)
+
+    def read_account_page(self) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """
+        Read the current account's balances and transaction history at once.
+
+        Equivalent to parse_summary() followed by
+        parse_account_transaction_history(), but the Balance Detail, Credits
+        and Debits tables are all read in a single browser-side evaluate
+        (ACCOUNT_PAGE_JS) instead of one walk per table.
+
+        Returns:
+            Tuple of (summary, transactions) shaped like parse_summary() and
+            parse_account_transaction_history() results
+        """
+        # The tables are in the HTML itself; no need to wait for images
+        self.page.wait_for_load_state("domcontentloaded")
+        data = self.page.evaluate(ACCOUNT_PAGE_JS, BALANCE_DETAIL_TABLE_XPATH)
+
+        transactions = []
+        if data["credits"]:
+            transactions.extend(parse_transaction_rows(data["credits"], credit=True))
+        if data["debits"]:
+            transactions.extend(parse_transaction_rows(data["debits"], credit=False))
+        return parse_balance_rows(data["balance"] or []), transactions
 
     def parse_account_transaction_history(self) -> List[Dict[str, Any]]:
         """
@@ -255,10 +458,10 @@ class AccountsPage(BasePage):
             - "Debit Amount": Float value (for debit transactions)
 
         Note:
-            Waits for page load state before parsing.
+            Waits for the DOM to be parsed (not for images) before parsing.
             Returns empty list if no transaction tables found.
         """
-        self.page.wait_for_load_state()
+        self.page.wait_for_load_state("domcontentloaded")
         transactions = []
 
         # Parse Credits table
@@ -282,29 +485,176 @@ class AccountsPage(BasePage):
         return transactions
 
     @with_session_retry()
-    def run(self) -> None:
+    def run(self, accounts: Optional[List[Tuple[str, str]]] = None) -> None:
         """
         Run account scraping with automatic session recovery.
 
         Iterates through all accounts, collecting summary and transaction data.
         If session expires during iteration, automatically re-authenticates and retries.
 
+        Args:
+            accounts: (account_id, account_name) pairs to scrape; defaults to
+                every account in the dropdown
+
         Populates:
-            self.accounts_summary: Dictionary mapping account_id to balance data
-            self.transaction_history: Dictionary mapping account_id to transaction list
+            self.accounts: Dictionary mapping account_id to its AccountRecord
 
         Note:
             Decorated with @with_session_retry for automatic recovery from session timeouts.
             Maximum 2 retry attempts on session expiration.
         """
-        for account_id, account_name in self.iter_accounts():
-            # Account Summary
-            account_summary = self.parse_summary()
-            account_summary[ACCOUNT_SUMMARY_COLUMNS[0]] = account_id
-            account_summary[ACCOUNT_SUMMARY_COLUMNS[1]] = clean_account_name(
-                account_name
+        for account_id, account_name in self.iter_accounts(accounts):
+            # Account summary and transaction history in one page read
+            summary, transactions = self.read_account_page()
+            self.accounts[account_id] = AccountRecord(
+                account_id=account_id,
+                account_name=clean_account_name(account_name),
+                total=summary["Total Balance"],
+                available=summary["Available Balance"],
+                transactions=transactions,
+            )
+
+
+def parse_balance_detail_html(html: str) -> Optional[Dict[str, float]]:
+    """
+    Parse the Balance Detail table from raw account page HTML.
+
+    Mirrors AccountsPage.parse_summary(), which reads the same table from the
+    rendered DOM.
+
+    Args:
+        html: Account detail page HTML
+
+    Returns:
+        Dictionary with "Total Balance" and "Available Balance" floats, or
+        None if the page has no Balance Detail table
+    """
+    if not html:
+        return None
+    return _parse_balance_detail_tree(lxml.html.fromstring(html))
+
+
+def parse_account_html(
+    html: str,
+) -> Optional[Tuple[Dict[str, float], List[Dict[str, Any]]]]:
+    """
+    Parse balances and transaction history from raw account page HTML.
+
+    Mirrors AccountsPage.read_account_page(), which reads the same tables
+    from the rendered DOM. Visibility of the Credits and Debits divs can't
+    be checked without rendering, so any table inside them is read.
+
+    Args:
+        html: Account detail page HTML
+
+    Returns:
+        Tuple of (summary, transactions) shaped like read_account_page()'s,
+        or None if the page has no Balance Detail table
+    """
+    if not html:
+        return None
+
+    tree = lxml.html.fromstring(html)
+    summary = _parse_balance_detail_tree(tree)
+    if summary is None:
+        return None
+
+    transactions = []
+    for div_id, credit in (("credits", True), ("debits", False)):
+        tables = tree.xpath(f"//div[@id='{div_id}']//table")
+        if tables:
+            # Descendant cells of each row, like the browser-side scripts
+            rows = (
+                [cell.text_content().strip() for cell in row.iter("td")]
+                for row in tables[0].iter("tr")
             )
-            self.accounts_summary[account_id] = account_summary
-            # Transaction history
-            transactions = self.parse_account_transaction_history()
-            self.transaction_history[account_id] = transactions
+            transactions.extend(parse_transaction_rows(rows, credit))
+    return summary, transactions
+
+
+def _parse_balance_detail_tree(tree: Any) -> Optional[Dict[str, float]]:
+    """
+    Parse the Balance Detail table from a parsed account page.
+
+    Args:
+        tree: lxml root element of the account detail page
+
+    Returns:
+        Dictionary with "Total Balance" and "Available Balance" floats, or
+        None if the page has no Balance Detail table
+    """
+    tables = tree.xpath(BALANCE_DETAIL_TABLE_XPATH)
+    if not tables:
+        return None
+
+    # Layout tables wrapping the Balance Detail table match too; the last
+    # match in document order is the innermost one
+    return parse_balance_rows(
+        [cell.text_content() for cell in row.findall("td")]
+        for row in tables[-1].iter("tr")
+    )
+
+
+def parse_balance_rows(rows: Iterable[Sequence[str]]) -> Dict[str, float]:
+    """
+    Extract Total Balance and Available Balance from Balance Detail rows.
+
+    Args:
+        rows: Cell texts of each Balance Detail table row; surrounding
+            whitespace is tolerated
+
+    Returns:
+        Dictionary with "Total Balance" (from the ending balance row) and
+        "Available Balance" floats; 0.0 where a row is missing
+    """
+    total_balance = 0.0
+    available_balance = 0.0
+
+    for cells in rows:
+        if len(cells) >= 2:
+            # Substring checks and parse_money ignore surrounding whitespace
+            label, value = cells[0], cells[1]
+
+            # Check for "Ending balance" (maps to Total Balance)
+            if "Ending balance" in label:
+                total_balance = parse_money(value)
+            # Check for "Available balance"
+            elif "Available balance" in label:
+                available_balance = parse_money(value)
+    return {"Total Balance": total_balance, "Available Balance": available_balance}
+
+
+def parse_transaction_rows(
+    rows: Iterable[Sequence[str]], credit: bool
+) -> List[Dict[str, Any]]:
+    """
+    Build transaction records from Credits or Debits table rows.
+
+    Args:
+        rows: Trimmed cell texts of each table row, as returned by the
+            browser-side scripts; rows with fewer than four cells (headers,
+            spacers) are skipped
+        credit: True for the Credits table, False for the Debits table
+
+    Returns:
+        List of transaction dictionaries shaped like
+        AccountsPage.parse_transaction_history_table() results
+    """
+    dates, descriptions, amount_texts = [], [], []
+    for cells in rows:
+        if len(cells) >= 4:
+            dates.append(cells[1])
+            descriptions.append(cells[2])
+            amount_texts.append(cells[3])
+
+    # Parse the whole amount column at once instead of cell by cell
+    amounts = parse_money_series(pd.Series(amount_texts, dtype=object)).tolist()
+    amount_key = "Credit Amount" if credit else "Debit Amount"
+    return [
+        {
+            "Transaction Date": date,
+            "Transaction Description": description,
+            amount_key: amount,
+        }
+        for date, description, amount in zip(dates, descriptions, amounts)
+    ]
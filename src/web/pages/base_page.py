@@ -2,7 +2,8 @@
 
 import random
 import time
-from typing import Optional, Union
+from contextlib import contextmanager
+from typing import Dict, Iterator, Mapping, Optional, Union
 
 from playwright.sync_api import Page, Locator
 
@@ -12,9 +13,70 @@ from src.core.config import settings
 class BasePage:
     """Base page with humanized behaviors and common parsing utilities."""
 
-    def __init__(self, page: Page):
+    def __init__(self, page: Page, humanize: bool = True):
+        """
+        Initialize the page object.
+
+        Args:
+            page: Playwright Page object for browser automation
+            humanize: False opts this page out of humanized delays and
+                typing even when settings.enable_humanized_behavior is set
+                (e.g., for machine-only forms in headless scraping runs)
+        """
         self.page = page
         self.config = settings
+        # Session context for @with_session_retry, set via set_session_context()
+        self.login_page = None
+        self.credentials: Optional[Mapping[str, str]] = None
+        # Locators built from string selectors, reused across actions
+        self._locator_cache: Dict[str, Locator] = {}
+        # Cleared by humanize=False, or by no_humanization() for
+        # non-interactive scraping loops
+        self._humanization_allowed = humanize
+
+    @property
+    def humanized(self) -> bool:
+        """Whether actions on this page currently get human-like delays."""
+        return self._humanization_allowed and self.config.enable_humanized_behavior
+
+    @contextmanager
+    def no_humanization(self) -> Iterator[None]:
+        """
+        Temporarily skip humanized delays for actions on this page.
+
+        Only this page object is affected; the shared settings are left
+        untouched, so pages driven by other threads keep their behavior.
+
+        Example:
+            >>> with accounts_page.no_humanization():
+            ...     accounts_page.run()
+        """
+        previous = self._humanization_allowed
+        self._humanization_allowed = False
+        try:
+            yield
+        finally:
+            self._humanization_allowed = previous
+
+    def _loc(self, locator: Union[str, Locator]) -> Locator:
+        """
+        Get a Locator for a selector string, reusing one built earlier.
+
+        Playwright Locators are lazy and re-resolve on every action, so a
+        cached Locator stays valid across navigations.
+
+        Args:
+            locator: CSS selector string or Playwright Locator object
+
+        Returns:
+            Locator for the selector (Locator objects are returned unchanged)
+        """
+        if not isinstance(locator, str):
+            return locator
+        elem = self._locator_cache.get(locator)
+        if elem is None:
+            elem = self._locator_cache[locator] = self.page.locator(locator)
+        return elem
 
     def click(self, locator: Union[str, Locator], description: str = "element") -> None:
         """
@@ -24,16 +86,13 @@ class BasePage:
             locator: CSS selector string or Playwright Locator object
             description: Human-readable description for logging
         """
-        if not self.config.enable_humanized_behavior:
+        if not self.humanized:
             # Fast path: direct click without humanization
-            if isinstance(locator, str):
-                self.page.locator(locator).click()
-            else:
-                locator.click()
+            self._loc(locator).click()
             return
 
         # Get the locator object
-        elem = self.page.locator(locator) if isinstance(locator, str) else locator
+        elem = self._loc(locator)
 
         # Humanized behavior
         self._smooth_scroll_to_element(elem)
@@ -45,23 +104,20 @@ class BasePage:
         self, locator: Union[str, Locator], text: str, description: str = "field"
     ) -> None:
         """
-        Fill a text field with typing simulation (character-by-character).
+        Fill a text field with typing simulation (fill plus a typing-length pause).
 
         Args:
             locator: CSS selector string or Playwright Locator object
             text: Text to type
             description: Human-readable description for logging
         """
-        if not self.config.enable_humanized_behavior:
+        if not self.humanized:
             # Fast path: instant fill
-            if isinstance(locator, str):
-                self.page.locator(locator).fill(text)
-            else:
-                locator.fill(text)
+            self._loc(locator).fill(text)
             return
 
         # Get the locator object
-        elem = self.page.locator(locator) if isinstance(locator, str) else locator
+        elem = self._loc(locator)
 
         # Humanized typing
         self._smooth_scroll_to_element(elem)
@@ -85,7 +141,7 @@ class BasePage:
             label: Option label to select (provide either value or label)
             description: Human-readable description for logging
         """
-        if not self.config.enable_humanized_behavior:
+        if not self.humanized:
             # Fast path
             if isinstance(locator, str):
                 # For string selectors, use page.select_option
@@ -102,7 +158,7 @@ class BasePage:
             return
 
         # Get the locator object
-        elem = self.page.locator(locator) if isinstance(locator, str) else locator
+        elem = self._loc(locator)
 
         # Humanized selection
         self._smooth_scroll_to_element(elem)
@@ -137,7 +193,7 @@ class BasePage:
         """
         self.page.wait_for_selector(selector, timeout=timeout, state=state)
 
-        if self.config.enable_humanized_behavior:
+        if self.humanized:
             # Add a small delay after element appears (simulating human perception time)
             self._random_delay(min_ms=150, max_ms=400)
 
@@ -151,7 +207,7 @@ class BasePage:
             min_ms: Minimum delay in milliseconds (overrides config)
             max_ms: Maximum delay in milliseconds (overrides config)
         """
-        if not self.config.enable_humanized_behavior:
+        if not self.humanized:
             return
 
         min_delay = min_ms if min_ms is not None else self.config.min_action_delay_ms
@@ -162,25 +218,20 @@ class BasePage:
 
     def _simulate_typing(self, element: Locator, text: str) -> None:
         """
-        Type text character-by-character with variable speed.
+        Enter text in one fill, then pause for roughly the time typing it would take.
+
+        A single fill() replaces one keystroke round trip per character; the
+        pause keeps the overall timing of human typing.
 
         Args:
             element: Playwright Locator object to type into
             text: Text to type
         """
-        for char in text:
-            element.type(char)
-
-            # Variable typing speed
-            base_speed = self.config.typing_speed_ms / 1000
-            variance = random.uniform(0.5, 1.5)  # 50% slower to 50% faster
-            char_delay = base_speed * variance
-
-            # Occasional longer pauses (simulating thinking)
-            if random.random() < 0.1:  # 10% chance
-                char_delay *= random.uniform(2, 4)
+        element.fill(text)
 
-            time.sleep(char_delay)
+        # 50% to 100% of the configured per-character typing speed
+        typing_ms = len(text) * self.config.typing_speed_ms
+        self._random_delay(min_ms=typing_ms // 2, max_ms=typing_ms)
 
     def _smooth_scroll_to_element(self, element: Locator) -> None:
         """
@@ -189,7 +240,7 @@ class BasePage:
         Args:
             element: Playwright Locator to scroll to
         """
-        if not self.config.enable_humanized_behavior:
+        if not self.humanized:
             element.scroll_into_view_if_needed()
             return
 
@@ -198,13 +249,13 @@ class BasePage:
         element.scroll_into_view_if_needed()
         self._random_delay(min_ms=200, max_ms=500)
 
-    def set_session_context(self, login_page, credentials: dict):
+    def set_session_context(self, login_page, credentials: Mapping[str, str]):
         """
         Set session context for automatic session recovery.
 
         Args:
             login_page: LoginPage instance for re-authentication
-            credentials: dict with 'username', 'password', and 'base_url' keys
+            credentials: Mapping with 'username', 'password', and 'base_url' keys
 
         This enables the @with_session_retry decorator to automatically
         re-authenticate if the session expires.
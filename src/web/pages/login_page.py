@@ -1,8 +1,15 @@
 """Login page automation for Altoro Mutual demo site."""
 
+import time
 from playwright.sync_api import Page, expect
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 from pathlib import Path
-from datetime import datetime
+from typing import Any, Dict, List
+
+from src.core.config import settings
+
+# UTC timestamp format used in error screenshot filenames
+SCREENSHOT_TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
 
 
 class LoginPage:
@@ -19,14 +26,17 @@ class LoginPage:
     Attributes:
         page: Playwright Page object for browser automation
         screenshot_dir: Directory path for saving error screenshots
+        saved_cookies: Cookies captured by save_session() after a login,
+            kept in memory only
+        login_wait_timeout: Milliseconds login() waits for the logged-in page
+        assert_login_timeout: Milliseconds assert_logged_in() waits
+
+    Note:
+        Both timeouts come from settings (login_wait_ms, assert_login_ms).
+        Lower values fail fast on a broken login at the cost of tolerance
+        for a slow server.
     """
 
-    # Timeout constants
-    LOGIN_WAIT_TIMEOUT = 5000  # Wait for login completion
-    ASSERT_LOGIN_TIMEOUT = 7000  # Wait for assertion verification
-    SESSION_CHECK_TIMEOUT = 2000  # Quick session state check
-    FORM_CHECK_TIMEOUT = 1000  # Quick login form visibility check
-
     def __init__(self, page: Page, screenshot_dir: str) -> None:
         """
         Initialize LoginPage with Playwright page and screenshot directory.
@@ -37,6 +47,15 @@ class LoginPage:
         """
         self.page = page
         self.screenshot_dir = Path(screenshot_dir)
+        self._screenshot_dir_ready = False
+        self.saved_cookies: List[Dict[str, Any]] = []
+        self.login_wait_timeout = settings.login_wait_ms
+        self.assert_login_timeout = settings.assert_login_ms
+        # Locators are lazy and re-resolve on every use, so these stay valid
+        # across navigations and are built once per page
+        self._my_account = page.locator("text=MY ACCOUNT")
+        self._uid_input = page.locator("#uid")
+        self._error_message = page.locator("span#_ctl0__ctl0_Content_Main_message")
 
     def goto(self, base_url: str) -> None:
         """
@@ -48,26 +67,70 @@ class LoginPage:
         """
         self.page.goto(f"{base_url}/login.jsp", wait_until="domcontentloaded")
 
-    def login(self, username: str, password: str) -> None:
+    def submit_credentials(self, username: str, password: str) -> None:
         """
-        Perform login by filling credentials and submitting form.
+        Fill the login form and submit it without waiting for the outcome.
+
+        Used directly for logins expected to fail, where the logged-in page
+        never appears.
 
         Args:
             username: User login name
             password: User password
         """
-        self.page.fill("#uid", username)
+        self._uid_input.fill(username)
         self.page.fill("#passw", password)
         self.page.click('input[name="btnSubmit"]')
-        self.page.wait_for_selector("text=MY ACCOUNT", timeout=self.LOGIN_WAIT_TIMEOUT)
+
+    def login(self, username: str, password: str) -> None:
+        """
+        Perform login by filling credentials and submitting form.
+
+        Args:
+            username: User login name
+            password: User password
+        """
+        self.submit_credentials(username, password)
+        self._my_account.wait_for(timeout=self.login_wait_timeout)
+
+    def save_session(self) -> None:
+        """
+        Capture the browser context's cookies after a successful login.
+
+        The saved cookies let restore_session() recover a wedged page without
+        going through the login form again. They stay in memory on this
+        object; the only on-disk copy of a session is Part 1's storage state
+        file (see save_storage_state()), which is owner-only and deleted at
+        the end of run_all.
+        """
+        self.saved_cookies = self.page.context.cookies()
+
+    def restore_session(self, base_url: str) -> bool:
+        """
+        Try to recover the session by re-applying saved cookies.
+
+        Re-adds the cookies captured by save_session() and loads the bank main
+        page. This is enough when the server-side session is still alive but
+        the page lost its state or cookies.
+
+        Args:
+            base_url: Base URL of the site (e.g., "https://demo.testfire.net")
+
+        Returns:
+            True if the page is logged in afterwards, False if there were no
+            saved cookies or a full login is still required
+        """
+        if not self.saved_cookies:
+            return False
+        self.page.context.add_cookies(self.saved_cookies)
+        self.page.goto(f"{base_url}/bank/main.jsp", wait_until="domcontentloaded")
+        return self.is_logged_in()
 
     def assert_logged_in(self) -> None:
         """
         Assert that user is logged in with stronger verification.
         """
-        expect(self.page.locator("text=MY ACCOUNT")).to_be_visible(
-            timeout=self.ASSERT_LOGIN_TIMEOUT
-        )
+        expect(self._my_account).to_be_visible(timeout=self.assert_login_timeout)
 
     def is_logged_in(self) -> bool:
         """
@@ -79,14 +142,14 @@ class LoginPage:
 
         Returns:
             True if both checks pass, False otherwise or on exception
+
+        Note:
+            Both checks are instant probes of the current page; is_visible()
+            does not wait for elements to appear.
         """
         try:
-            my_account_visible = self.page.locator("text=MY ACCOUNT").is_visible(
-                timeout=self.SESSION_CHECK_TIMEOUT
-            )
-            login_form_hidden = not self.page.locator('input[name="uid"]').is_visible(
-                timeout=self.FORM_CHECK_TIMEOUT
-            )
+            my_account_visible = self._my_account.is_visible()
+            login_form_hidden = not self._uid_input.is_visible()
             return my_account_visible and login_form_hidden
         except Exception:
             return False
@@ -103,9 +166,7 @@ class LoginPage:
             True if either check passes, True on exception (safe default)
         """
         try:
-            login_form_visible = self.page.locator('input[name="uid"]').is_visible(
-                timeout=self.SESSION_CHECK_TIMEOUT
-            )
+            login_form_visible = self._uid_input.is_visible()
             current_url = self.page.url
             on_login_page = "/login.jsp" in current_url or current_url.endswith("/")
 
@@ -113,15 +174,25 @@ class LoginPage:
         except Exception:
             return True  # Assume logged out if state cannot be determined
 
-    def capture_error_message(self) -> str:
+    def capture_error_message(self, timeout: float = 0) -> str:
         """
         Capture login error message from page if visible.
 
+        Args:
+            timeout: Milliseconds to wait for the message to appear; 0 only
+                checks the current page
+
         Returns:
             Error message text if present, empty string otherwise
         """
-        msg_locator = self.page.locator("span#_ctl0__ctl0_Content_Main_message")
-        return msg_locator.inner_text().strip() if msg_locator.count() else ""
+        if timeout:
+            try:
+                self._error_message.wait_for(timeout=timeout)
+            except PlaywrightTimeoutError:
+                return ""
+        if not self._error_message.count():
+            return ""
+        return self._error_message.inner_text().strip()
 
     def error_screenshot(self, tag: str) -> str:
         """
@@ -135,10 +206,12 @@ class LoginPage:
 
         Note:
             Filename format: {tag}_{timestamp}.png
-            Creates screenshot directory if it doesn't exist
+            Creates screenshot directory on the first screenshot
         """
-        self.screenshot_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+        if not self._screenshot_dir_ready:
+            self.screenshot_dir.mkdir(parents=True, exist_ok=True)
+            self._screenshot_dir_ready = True
+        timestamp = time.strftime(SCREENSHOT_TIMESTAMP_FORMAT, time.gmtime())
         filename = f"{tag}_{timestamp}.png"
         screenshot_path = self.screenshot_dir / filename
         self.page.screenshot(path=str(screenshot_path))
@@ -1,12 +1,52 @@
 """Product catalog extraction page automation for Altoro Mutual."""
 
-from typing import List, Dict, Any, Tuple
-from playwright.sync_api import Page
+import re
+from typing import Iterable, List, Optional, Tuple
+from urllib.parse import urljoin
 
+from playwright.sync_api import Page, Route
+
+from src.api.response_cache import ResponseCache
 from src.web.pages.base_page import BasePage
 from src.core.session_handler import with_session_retry
 from src.core.logger import log
 
+# Paragraph classifiers, lowercase; shared by every category page
+PROMOTIONAL_KEYWORDS = ("bonus", "offer", "promotion", "special", "limited time")
+TERM_PREFIXES = ("note:", "terms:", "conditions:", "disclaimer:")
+NON_DESCRIPTION_KEYWORDS = (
+    "bonus",
+    "offer",
+    "note:",
+    "terms:",
+    "for more information",
+    "last updated on",
+)
+
+# One case-insensitive scan per paragraph instead of a lower() copy and a
+# Python-level any() over the keywords
+PROMOTION_RE = re.compile(
+    "|".join(map(re.escape, ("$", *PROMOTIONAL_KEYWORDS))), re.IGNORECASE
+)
+NON_DESCRIPTION_RE = re.compile(
+    "|".join(map(re.escape, NON_DESCRIPTION_KEYWORDS)), re.IGNORECASE
+)
+
+# Everything extract_category_data() reads from a category page in one round
+# trip: the H1 text (null if missing), every paragraph, and the items of the
+# first product list
+CATEGORY_PAGE_JS = """() => {
+    const heading = document.querySelector("h1");
+    const list = document.querySelector(".fl ul");
+    return {
+        heading: heading ? heading.innerText.trim() : null,
+        paragraphs: Array.from(document.querySelectorAll("p"), p => p.innerText.trim()),
+        products: list
+            ? Array.from(list.querySelectorAll("li"), li => li.innerText.trim())
+            : [],
+    };
+}"""
+
 
 class ProductsPage(BasePage):
     """
@@ -15,7 +55,7 @@ class ProductsPage(BasePage):
     Provides methods for:
     - Navigating to PERSONAL and SMALL BUSINESS sections
     - Extracting category links from landing pages
-    - Clicking through product categories and scraping data
+    - Opening product categories by URL and scraping data
     - Parsing promotional offers and terms
     - Auto-recovery from session timeouts
 
@@ -26,10 +66,9 @@ class ProductsPage(BasePage):
     - Products displayed as list items (not individual detail pages)
 
     Navigation Flow:
-    1. Click PERSONAL navigation -> Shows landing page with H2 links
-    2. For each H2 > A link: Click -> Scrape category page -> Go back
-    3. Click SMALL BUSINESS navigation -> Shows landing page with H2 links
-    4. For each H2 > A link: Click -> Scrape category page -> Go back
+    1. Click PERSONAL navigation -> Read H2 > A category links
+    2. Click SMALL BUSINESS navigation -> Read H2 > A category links
+    3. For each category link: Go to its URL -> Scrape category page
 
     Typical category page contains:
         - H1 with category name
@@ -40,14 +79,28 @@ class ProductsPage(BasePage):
         - Last updated information
     """
 
-    def __init__(self, page: Page) -> None:
+    def __init__(
+        self,
+        page: Page,
+        page_cache: Optional[ResponseCache] = None,
+        page_cache_ttl: Optional[float] = None,
+    ) -> None:
         """
         Initialize ProductsPage with Playwright page.
 
         Args:
             page: Playwright Page object for browser automation
+            page_cache: Persistent cache of category page HTML; scrape_categories()
+                serves cached pages from it instead of the network. None
+                always fetches.
+            page_cache_ttl: Seconds a cached category page stays valid; None
+                keeps it indefinitely
         """
         super().__init__(page)
+        # Category links of both sections, collected once per page object
+        self._category_links: Optional[List[Tuple[str, str, str]]] = None
+        self.page_cache = page_cache
+        self.page_cache_ttl = page_cache_ttl
 
     def navigate_personal(self) -> None:
         """
@@ -63,7 +116,7 @@ class ProductsPage(BasePage):
         personal_link = self.page.get_by_role("link", name="PERSONAL").first
         if personal_link.count():
             self.click(personal_link, description="PERSONAL navigation link")
-            self.page.wait_for_load_state()
+            self.page.wait_for_load_state("domcontentloaded")
 
     def navigate_small_business(self) -> None:
         """
@@ -81,7 +134,7 @@ class ProductsPage(BasePage):
             self.click(
                 small_business_link, description="SMALL BUSINESS navigation link"
             )
-            self.page.wait_for_load_state()
+            self.page.wait_for_load_state("domcontentloaded")
 
     def get_category_links(self) -> List[Tuple[str, str]]:
         """
@@ -105,20 +158,19 @@ class ProductsPage(BasePage):
         Note:
             Returns empty list if no H2 > A links found on page.
         """
-        category_links = []
-
-        # Find all H2 tags
-        h2_elements = self.page.locator("h2").all()
-        for h2_tag in h2_elements:
-            # Find A tag inside H2
-            link_tag = h2_tag.locator("a").first
-            if link_tag.count() > 0:
-                category_name = link_tag.inner_text().strip()
-                href = link_tag.get_attribute("href") or ""
-                if category_name and href:
-                    category_links.append((category_name, href))
-
-        return category_links
+        # Read the first link of every H2 in one round trip instead of a few
+        # locator calls per heading
+        links = self.page.locator("h2").evaluate_all(
+            """headings => headings.map(h2 => {
+                const a = h2.querySelector("a");
+                return a ? [a.innerText.trim(), a.getAttribute("href") || ""] : null;
+            })"""
+        )
+        return [
+            (category_name, href)
+            for category_name, href in filter(None, links)
+            if category_name and href
+        ]
 
     def click_category_link(self, category_name: str) -> None:
         """
@@ -130,21 +182,24 @@ class ProductsPage(BasePage):
             category_name: Display name of the category (e.g., "Deposit Products")
 
         Note:
-            Waits for page load after clicking.
+            Waits for the DOM to be parsed (not for images) after clicking.
             Uses humanized clicking behavior from BasePage.
         """
         # Find H2 containing the category name, then click its link
         category_link = self.page.locator(f"h2 >> a:has-text('{category_name}')")
         if category_link.count():
             self.click(category_link, description=f"{category_name} category link")
-            self.page.wait_for_load_state()
+            self.page.wait_for_load_state("domcontentloaded")
 
-    def _extract_promotions(self) -> str:
+    def _extract_promotions(self, paragraphs: List[str]) -> str:
         """
         Extract promotional offers from page content.
 
         Searches for paragraphs containing monetary amounts or promotional keywords.
 
+        Args:
+            paragraphs: Trimmed paragraph texts of the category page
+
         Returns:
             String containing promotional text, or empty string if none found
 
@@ -153,50 +208,31 @@ class ProductsPage(BasePage):
             - Dollar signs ($)
             - Keywords: "bonus", "offer", "promotion", "special", "limited time"
         """
-        promotions = []
-        promotional_keywords = [
-            "bonus",
-            "offer",
-            "promotion",
-            "special",
-            "limited time",
-        ]
-
-        paragraphs = self.page.locator("p").all()
-        for paragraph in paragraphs:
-            text = paragraph.inner_text().strip()
-            # Check for dollar signs or promotional keywords
-            if "$" in text or any(
-                keyword in text.lower() for keyword in promotional_keywords
-            ):
-                promotions.append(text)
+        # Dollar signs or promotional keywords
+        promotions = [text for text in paragraphs if PROMOTION_RE.search(text)]
 
         return " | ".join(promotions) if promotions else ""
 
-    def _extract_terms(self) -> str:
+    def _extract_terms(self, paragraphs: List[str]) -> str:
         """
         Extract terms and conditions from page content.
 
         Searches for paragraphs starting with "Note:", "Terms:", or "Conditions:".
 
+        Args:
+            paragraphs: Trimmed paragraph texts of the category page
+
         Returns:
             String containing terms text, or empty string if none found
         """
-        terms = []
-        term_keywords = ["note:", "terms:", "conditions:", "disclaimer:"]
-
-        paragraphs = self.page.locator("p").all()
-        for paragraph in paragraphs:
-            text = paragraph.inner_text().strip()
-            # Check if paragraph starts with term keywords
-            if any(text.lower().startswith(keyword) for keyword in term_keywords):
-                terms.append(text)
+        # Paragraphs starting with a term keyword
+        terms = [text for text in paragraphs if text.lower().startswith(TERM_PREFIXES)]
 
         return " | ".join(terms) if terms else ""
 
     def extract_category_data(
         self, section: str, expected_category: str
-    ) -> List[Dict[str, Any]]:
+    ) -> List[Tuple[str, ...]]:
         """
         Extract all product information from current category page.
 
@@ -206,14 +242,13 @@ class ProductsPage(BasePage):
         - Individual product names from UL/LI list
         - Promotional offers
         - Terms and conditions
-        - Last updated date
 
         Args:
             section: Section name ("PERSONAL" or "SMALL BUSINESS")
             expected_category: Expected category name for validation
 
         Returns:
-            List of product dictionaries, each containing:
+            List of product rows, tuples in PRODUCT_COLUMNS order:
             - Section: PERSONAL or SMALL BUSINESS
             - Category: Category name
             - Product Name: Individual product name from list
@@ -221,7 +256,6 @@ class ProductsPage(BasePage):
             - Features: Combined features (currently same as description)
             - Promotions: Promotional offers text
             - Terms: Terms and conditions text
-            - Last Updated: Last updated date
 
         Note:
             Returns empty list if no products found on page.
@@ -230,136 +264,172 @@ class ProductsPage(BasePage):
         """
         products = []
 
+        # Heading, paragraphs and product list in a single browser round trip
+        page_data = self.page.evaluate(CATEGORY_PAGE_JS)
+
         # Extract category name from H1
-        category_h1 = self.page.locator("h1").first
         category_name = (
-            category_h1.inner_text().strip()
-            if category_h1.count() > 0
+            page_data["heading"]
+            if page_data["heading"] is not None
             else expected_category
         )
 
+        # Paragraphs are shared by the description, promotions and terms,
+        # which are the same for every product in the category
+        paragraphs = page_data["paragraphs"]
+        promotions = self._extract_promotions(paragraphs)
+        terms = self._extract_terms(paragraphs)
+
         # Extract description from first paragraph(s)
         description = ""
-        paragraphs = self.page.locator("p").all()
-        for paragraph in paragraphs:
-            text = paragraph.inner_text().strip()
+        for text in paragraphs:
             # Skip promotional and terms paragraphs
-            if text and not any(
-                keyword in text.lower()
-                for keyword in [
-                    "bonus",
-                    "offer",
-                    "note:",
-                    "terms:",
-                    "for more information",
-                    "last updated on",
-                ]
-            ):
+            if text and not NON_DESCRIPTION_RE.search(text):
                 description = text
 
         # Extract product list from UL/LI
-        product_list = self.page.locator(".fl ul").first
-        if product_list.count() > 0:
-            list_items = product_list.locator("li").all()
-            for list_item in list_items:
-                product_name = list_item.inner_text().strip()
-                if product_name:
-                    products.append(
-                        {
-                            "Section": section,
-                            "Category": category_name,
-                            "Product Name": product_name,
-                            "Description": description,
-                            "Features": description,  # Using description as features
-                            "Promotions": self._extract_promotions(),
-                            "Terms": self._extract_terms(),
-                        }
+        for product_name in page_data["products"]:
+            if product_name:
+                products.append(
+                    (
+                        section,
+                        category_name,
+                        product_name,
+                        description,
+                        description,  # Features: using description as features
+                        promotions,
+                        terms,
                     )
+                )
         return products
 
     @with_session_retry()
-    def scrape_all_products(self) -> List[Dict[str, Any]]:
+    def collect_category_links(self) -> List[Tuple[str, str, str]]:
         """
-        Scrape all products from all categories (PERSONAL and SMALL BUSINESS).
+        List every product category of both sections with its absolute URL.
 
-        Workflow:
-        1. Navigate to PERSONAL section landing page
-        2. Extract all H2 > A category links
-        3. For each category link:
-           a. Click link to navigate to category page
-           b. Extract products from category page
-           c. Go back to landing page
-        4. Navigate to SMALL BUSINESS section landing page
-        5. Extract all H2 > A category links
-        6. For each category link:
-           a. Click link to navigate to category page
-           b. Extract products from category page
-           c. Go back to landing page
+        Visits the PERSONAL and SMALL BUSINESS landing pages and reads their
+        H2 > A category links.
 
         Returns:
-            List of all product dictionaries from all categories
+            List of (section, category_name, url) tuples, PERSONAL first
 
         Note:
-            Decorated with @with_session_retry for automatic recovery from session timeouts.
-            Maximum 2 retry attempts on session expiration.
-            Logs progress for each category processed.
-            Uses page.go_back() to return to landing page after each category.
+            The links are kept after the first successful call, so later
+            calls (e.g., a rerun after session recovery) skip the landing
+            pages.
         """
-        all_products = []
-
-        # Scrape PERSONAL categories
-        log.info("Starting PERSONAL product extraction...")
-        self.navigate_personal()
-
-        # Extract category links from PERSONAL landing page
-        personal_category_links = self.get_category_links()
-        log.info(f"Found {len(personal_category_links)} PERSONAL categories")
-
-        for category_name, href in personal_category_links:
-            log.info(f"Extracting PERSONAL -> {category_name}...")
+        if self._category_links is not None:
+            return self._category_links
+
+        categories = []
+        for section, navigate in (
+            ("PERSONAL", self.navigate_personal),
+            ("SMALL BUSINESS", self.navigate_small_business),
+        ):
+            navigate()
+            links = self.get_category_links()
+            log.info("Found {} {} categories", len(links), section)
+            categories.extend(
+                (section, category_name, urljoin(self.page.url, href))
+                for category_name, href in links
+            )
+        self._category_links = categories
+        return categories
 
-            # Click category link to navigate to category page
-            self.click_category_link(category_name)
+    @with_session_retry()
+    def scrape_categories(
+        self, categories: Iterable[Tuple[str, str, str]]
+    ) -> List[Tuple[str, ...]]:
+        """
+        Scrape the given category pages by opening their URLs directly.
 
-            # Extract products from category page
-            category_products = self.extract_category_data("PERSONAL", category_name)
-            all_products.extend(category_products)
-            log.info(
-                f"  Extracted {len(category_products)} products from {category_name}"
-            )
+        Args:
+            categories: (section, category_name, url) tuples, as returned by
+                collect_category_links()
 
-            # Go back to PERSONAL landing page
-            self.page.go_back()
-            self.page.wait_for_load_state()
+        Returns:
+            List of product rows (PRODUCT_COLUMNS order), in category order
 
-        # Scrape SMALL BUSINESS categories
-        log.info("Starting SMALL BUSINESS product extraction...")
-        self.navigate_small_business()
+        Note:
+            Independent of the landing pages, so a batch of categories can be
+            scraped in a separate browser session.
+            With a page_cache, the category documents are answered from it
+            (and stored on a miss); the browser still renders them.
+        """
+        categories = list(categories)
+        category_urls = {url for _, _, url in categories}
+
+        def is_category_url(url: str) -> bool:
+            return url in category_urls
+
+        if self.page_cache is not None:
+            self.page.route(is_category_url, self._serve_cached_page)
+        try:
+            all_products = []
+            for section, category_name, url in categories:
+                log.info("Extracting {} -> {}...", section, category_name)
+                self.page.goto(url, wait_until="domcontentloaded")
+
+                category_products = self.extract_category_data(section, category_name)
+                all_products.extend(category_products)
+                log.info(
+                    "  Extracted {} products from {}",
+                    len(category_products),
+                    category_name,
+                )
+        finally:
+            if self.page_cache is not None:
+                self.page.unroute(is_category_url, self._serve_cached_page)
+        return all_products
 
-        # Extract category links from SMALL BUSINESS landing page
-        small_business_category_links = self.get_category_links()
-        log.info(
-            f"Found {len(small_business_category_links)} SMALL BUSINESS categories"
-        )
+    def _serve_cached_page(self, route: Route) -> None:
+        """
+        Answer a category page request from page_cache, fetching it on a miss.
 
-        for category_name, href in small_business_category_links:
-            log.info(f"Extracting SMALL BUSINESS -> {category_name}...")
+        Only successful GET documents are cached; anything else goes to the
+        network untouched.
 
-            # Click category link to navigate to category page
-            self.click_category_link(category_name)
+        Args:
+            route: Intercepted category page route
+        """
+        request = route.request
+        if request.method != "GET" or request.resource_type != "document":
+            route.continue_()
+            return
+
+        key = f"page:{request.url}"
+        body = self.page_cache.get(key)
+        if body is not None:
+            route.fulfill(status=200, content_type="text/html", body=body)
+            return
+
+        response = route.fetch()
+        if response.ok:
+            self.page_cache.set(key, response.text(), ttl=self.page_cache_ttl)
+        route.fulfill(response=response)
+
+    def scrape_all_products(self) -> List[Tuple[str, ...]]:
+        """
+        Scrape all products from all categories (PERSONAL and SMALL BUSINESS).
 
-            # Extract products from category page
-            category_products = self.extract_category_data(
-                "SMALL BUSINESS", category_name
-            )
-            all_products.extend(category_products)
-            log.info(
-                f"  Extracted {len(category_products)} products from {category_name}"
-            )
+        Workflow:
+        1. Navigate to the PERSONAL and SMALL BUSINESS landing pages and
+           collect every H2 > A category link (collect_category_links())
+        2. Open each category page directly by its URL and extract its
+           products (scrape_categories())
 
-            # Go back to SMALL BUSINESS landing page
-            self.page.go_back()
-            self.page.wait_for_load_state()
+        Returns:
+            List of all product rows (PRODUCT_COLUMNS order) from all categories
 
-        log.info(f"Product extraction complete - Total products: {len(all_products)}")
+        Note:
+            Both steps are decorated with @with_session_retry for automatic
+            recovery from session timeouts.
+            Logs progress for each category processed.
+            Category pages are opened with page.goto() rather than clicked
+            and left with page.go_back(), so each category costs one
+            navigation instead of two.
+        """
+        all_products = self.scrape_categories(self.collect_category_links())
+        log.info("Product extraction complete - Total products: {}", len(all_products))
         return all_products
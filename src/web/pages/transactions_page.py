@@ -1,13 +1,39 @@
 """Transaction history page automation for Altoro Mutual."""
 
-from typing import List, Dict, Any
-from datetime import datetime
+from collections import namedtuple
+from typing import Iterator, List
+
+import numpy as np
+import pandas as pd
 from playwright.sync_api import Page
 
-from src.core.utils import parse_money
+from src.core.utils import parse_money_series
 from src.web.pages.base_page import BasePage
 from src.core.constants import SELECTOR_TRANSACTIONS_TABLE
 
+# Sets both date filter fields and submits their form in one round trip;
+# requestSubmit() runs the form's submit handlers and sends the Submit button
+# like a real click would
+FILTER_DATES_JS = """([startDate, endDate]) => {
+    const start = document.querySelector('input[name="startDate"]');
+    const end = document.querySelector('input[name="endDate"]');
+    start.value = startDate;
+    end.value = endDate;
+    for (const field of [start, end]) {
+        field.dispatchEvent(new Event("input", { bubbles: true }));
+        field.dispatchEvent(new Event("change", { bubbles: true }));
+    }
+    start.form.requestSubmit(
+        start.form.querySelector('input[type="submit"][value="Submit"]')
+    );
+}"""
+
+# One parsed transaction table row; _asdict() gives the dictionary form
+Transaction = namedtuple(
+    "Transaction",
+    "transaction_id transaction_time account_id action amount debit credit",
+)
+
 
 class TransactionsPage(BasePage):
     """
@@ -35,14 +61,16 @@ class TransactionsPage(BasePage):
         - credit: Credit amount (for reporting)
     """
 
-    def __init__(self, page: Page) -> None:
+    def __init__(self, page: Page, humanize: bool = True) -> None:
         """
         Initialize TransactionsPage with Playwright page.
 
         Args:
             page: Playwright Page object for browser automation
+            humanize: False fills and submits the date filter without
+                humanized delays, regardless of settings
         """
-        super().__init__(page)
+        super().__init__(page, humanize=humanize)
 
     def open_recent(self) -> None:
         """
@@ -68,10 +96,19 @@ class TransactionsPage(BasePage):
             - Clicks Submit button
             - Waits for filtered results to load
             - Date format must be yyyy-mm-dd as required by the web form
+            - Without humanized behavior, the fields are set and the form is
+              submitted in a single evaluate instead of typed and clicked
         """
+        if not self.humanized:
+            date_fields = self._loc('input[name="startDate"], input[name="endDate"]')
+            if date_fields.count() >= 2:
+                with self.page.expect_navigation(wait_until="domcontentloaded"):
+                    self.page.evaluate(FILTER_DATES_JS, [start_date, end_date])
+            return
+
         # Find date input fields by their name attributes
-        start_date_field = self.page.locator('input[name="startDate"]')
-        end_date_field = self.page.locator('input[name="endDate"]')
+        start_date_field = self._loc('input[name="startDate"]')
+        end_date_field = self._loc('input[name="endDate"]')
 
         if start_date_field.count() and end_date_field.count():
             self.fill(
@@ -80,21 +117,41 @@ class TransactionsPage(BasePage):
             self.fill(end_date_field, end_date, description="Before (endDate) field")
 
             # Find and click the Submit button
-            submit_button = self.page.locator('input[type="submit"][value="Submit"]')
+            submit_button = self._loc('input[type="submit"][value="Submit"]')
             self.click(submit_button, description="Submit button")
 
             # Wait for filtered results to load
-            self.page.wait_for_load_state()
+            self.page.wait_for_load_state("domcontentloaded")
 
-    def read_transactions(self, time_format: str) -> List[Dict[str, Any]]:
+    def read_transactions(self, time_format: str) -> List[Transaction]:
         """
         Parse and extract all transactions from the transaction table.
 
+        List form of iter_transactions(), for callers that need every
+        transaction at once (e.g., to build a DataFrame).
+
         Args:
             time_format: Datetime format string for parsing (e.g., "%Y-%m-%d %H:%M")
 
         Returns:
-            List of transaction dictionaries, each containing:
+            List of Transaction tuples as yielded by iter_transactions()
+        """
+        return list(self.iter_transactions(time_format))
+
+    def iter_transactions(self, time_format: str) -> Iterator[Transaction]:
+        """
+        Parse the transaction table, yielding one transaction at a time.
+
+        The table is read and its columns parsed when iteration starts, so
+        consume the iterator before navigating away; the per-row
+        tuples are only built as they are consumed, so streaming
+        callers never hold them all at once.
+
+        Args:
+            time_format: Datetime format string for parsing (e.g., "%Y-%m-%d %H:%M")
+
+        Yields:
+            Transaction named tuples, each containing:
             - transaction_id: str - Unique transaction ID
             - transaction_time: datetime - Transaction timestamp
             - account_id: str - Account ID
@@ -115,59 +172,48 @@ class TransactionsPage(BasePage):
             - If Action = "Withdrawal" OR Amount is negative: debit = abs(amount), credit = 0
             - If Action = "Deposit" OR Amount is positive: credit = amount, debit = 0
 
-            Returns empty list if no transactions found.
+            Yields nothing if no transactions found.
         """
         # Locate the transaction table by its ID
-        table_locator = self.page.locator(SELECTOR_TRANSACTIONS_TABLE)
-
-        # Get all table rows
-        table_rows = table_locator.locator("tr").all()
-
-        # Skip header row (first row)
-        data_rows = table_rows[1:] if len(table_rows) > 1 else []
-
-        transactions = []
-        for row in data_rows:
-            cells = [cell.inner_text().strip() for cell in row.locator("td").all()]
-
-            # Ensure row has all required columns (5 columns)
-            if len(cells) >= 5:
-                # Parse each column
-                transaction_id = cells[0]
-                transaction_time_str = cells[1]
-                account_id = cells[2]
-                action = cells[3]
-                amount_str = cells[4]
-
-                # Parse transaction time
-                try:
-                    transaction_time = datetime.strptime(
-                        transaction_time_str, time_format
-                    )
-                except ValueError:
-                    # Skip row if time parsing fails
-                    continue
-
-                # Parse amount
-                amount = parse_money(amount_str)
-
-                # Determine debit/credit based on action and amount
-                if action == "Withdrawal" or amount < 0:
-                    debit = abs(amount)
-                    credit = 0.0
-                else:  # Deposit or positive amount
-                    debit = 0.0
-                    credit = abs(amount)
-
-                transaction = {
-                    "transaction_id": transaction_id,
-                    "transaction_time": transaction_time,
-                    "account_id": account_id,
-                    "action": action,
-                    "amount": amount,
-                    "debit": debit,
-                    "credit": credit,
-                }
-                transactions.append(transaction)
-
-        return transactions
+        table_locator = self._loc(SELECTOR_TRANSACTIONS_TABLE)
+
+        # Read every row's cell texts in one round trip
+        table_rows = table_locator.locator("tr").evaluate_all(
+            """rows => rows.map(row =>
+                Array.from(row.querySelectorAll("td"), td => td.innerText.trim()))"""
+        )
+
+        # Skip header row (first row) and rows missing required columns (5)
+        data_rows = [cells for cells in table_rows[1:] if len(cells) >= 5]
+
+        # Parse all transaction times in one vectorized call; cache=True
+        # parses each distinct timestamp once. Unparseable times become NaT.
+        transaction_times = pd.to_datetime(
+            [cells[1] for cells in data_rows],
+            format=time_format,
+            errors="coerce",
+            cache=True,
+        ).to_pydatetime()
+
+        # Parse the amount column and split it into debits and credits in
+        # vectorized passes: withdrawals and negative amounts are debits,
+        # everything else (deposits, positive amounts) is a credit
+        amounts = parse_money_series(
+            pd.Series([cells[4] for cells in data_rows], dtype=object)
+        ).to_numpy()
+        actions = np.array([cells[3] for cells in data_rows], dtype=object)
+        is_debit = (actions == "Withdrawal") | (amounts < 0)
+        magnitudes = np.abs(amounts)
+        debits = np.where(is_debit, magnitudes, 0.0).tolist()
+        credits = np.where(is_debit, 0.0, magnitudes).tolist()
+
+        for cells, transaction_time, amount, debit, credit in zip(
+            data_rows, transaction_times, amounts.tolist(), debits, credits
+        ):
+            # Skip row if time parsing failed
+            if pd.isna(transaction_time):
+                continue
+
+            yield Transaction(
+                cells[0], transaction_time, cells[2], cells[3], amount, debit, credit
+            )
@@ -1,6 +1,8 @@
 """Fund transfer page automation for Altoro Mutual."""
 
-from typing import Dict, Any
+import html
+import re
+from typing import Dict, Any, Literal, Optional
 from datetime import datetime, timezone
 from pathlib import Path
 from playwright.sync_api import Page
@@ -8,6 +10,57 @@ from playwright.sync_api import Page
 from src.web.pages.base_page import BasePage
 from src.core.session_handler import with_session_retry
 
+# When run_transfer() takes the confirmation screenshot: every transfer,
+# only transfers whose status is not "success", or never. "api" also never
+# takes one, and posts the transfer form directly instead of rendering it
+ScreenshotPolicy = Literal["always", "on_error", "never", "api"]
+
+# Confirmation screenshot encoding: viewport PNG, or a JPEG clipped to the
+# confirmation message (several times smaller and faster to encode)
+ScreenshotFormat = Literal["png", "jpeg"]
+JPEG_QUALITY = 70
+
+# Confirmation spans a JPEG screenshot is clipped to
+CONFIRMATION_SELECTOR = "#_ctl0__ctl0_Content_Main_postResp, #soapResp"
+
+# Absolute URL the transfer form (#tForm) posts to
+TRANSFER_ACTION_JS = '() => document.getElementById("tForm").action'
+
+# Inner HTML of the primary and SOAP confirmation spans in a transfer response
+CONFIRMATION_SPAN_RE = re.compile(
+    r'id="(?:_ctl0__ctl0_Content_Main_postResp|soapResp)"[^>]*>(.*?)</span>',
+    re.IGNORECASE | re.DOTALL,
+)
+HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+# Present in a response only when the POST was answered with the login form
+LOGIN_FORM_MARKER = 'name="uid"'
+
+# Trimmed texts of both confirmation spans (null if missing) and, only when
+# both are empty, of the single innermost element saying "successfully
+# transferred" (empty if none or several, like a strict get_by_text)
+CONFIRMATION_JS = """() => {
+    const spanText = id => {
+        const span = document.getElementById(id);
+        return span ? span.innerText.trim() : null;
+    };
+    const primary = spanText("_ctl0__ctl0_Content_Main_postResp");
+    const soap = spanText("soapResp");
+    let fallback = "";
+    if (!primary && !soap) {
+        const pattern = /successfully transferred/i;
+        const matches = Array.from(document.body.querySelectorAll("*")).filter(
+            element => pattern.test(element.textContent)
+                && !Array.from(element.children).some(
+                    child => pattern.test(child.textContent))
+        );
+        if (matches.length === 1) {
+            fallback = matches[0].innerText.trim();
+        }
+    }
+    return { primary, soap, fallback };
+}"""
+
 
 class TransferPage(BasePage):
     """
@@ -35,16 +88,34 @@ class TransferPage(BasePage):
         - Timestamp information
     """
 
-    def __init__(self, page: Page, screenshot_dir: str) -> None:
+    def __init__(
+        self,
+        page: Page,
+        screenshot_dir: str,
+        screenshot_policy: ScreenshotPolicy = "always",
+        humanize: bool = True,
+        screenshot_format: ScreenshotFormat = "png",
+    ) -> None:
         """
         Initialize TransferPage with Playwright page and screenshot directory.
 
         Args:
             page: Playwright Page object for browser automation
             screenshot_dir: Directory path for saving screenshots
+            screenshot_policy: When run_transfer() saves a confirmation
+                screenshot ("always", "on_error" or "never"); "api" never
+                saves one and runs the transfer as a direct form POST
+                (execute_transfer_api) instead of through the rendered form
+            humanize: False drives the transfer form without humanized
+                delays and typing, regardless of settings
+            screenshot_format: "png" for viewport screenshots, "jpeg" for
+                screenshots clipped to the confirmation message
         """
-        super().__init__(page)
+        super().__init__(page, humanize=humanize)
         self.screenshot_dir = Path(screenshot_dir)
+        self.screenshot_policy = screenshot_policy
+        self.screenshot_format = screenshot_format
+        self._transfer_action: Optional[str] = None
 
     def navigate(self) -> None:
         """
@@ -73,29 +144,72 @@ class TransferPage(BasePage):
             - Waits for confirmation message after submission
         """
         # Select source account by value
-        from_account_dropdown = self.page.locator("#fromAccount")
+        from_account_dropdown = self._loc("#fromAccount")
         self.select_option(
             from_account_dropdown, value=from_account_value, description="From Account"
         )
 
         # Select destination account by value
-        to_account_dropdown = self.page.locator("#toAccount")
+        to_account_dropdown = self._loc("#toAccount")
         self.select_option(
             to_account_dropdown, value=to_account_value, description="To Account"
         )
 
         # Fill transfer amount
-        amount_field = self.page.locator("#transferAmount")
+        amount_field = self._loc("#transferAmount")
         self.fill(amount_field, f"{amount:.2f}", description="Transfer Amount field")
 
         # Submit the transfer
-        submit_button = self.page.locator(
-            'input[type="submit"][value="Transfer Money"]'
-        )
+        submit_button = self._loc('input[type="submit"][value="Transfer Money"]')
         self.click(submit_button, description="Transfer Money button")
 
         # Wait for confirmation message to appear
-        self.page.wait_for_load_state()
+        self.page.wait_for_load_state("domcontentloaded")
+
+    def execute_transfer_api(
+        self, from_account_value: str, to_account_value: str, amount: float
+    ) -> Dict[str, str]:
+        """
+        Execute a fund transfer by posting the transfer form directly.
+
+        The form's action URL is read from the Transfer Funds page on the
+        first call; later calls reuse it and never render a page. The POST
+        goes through page.request, so it carries the browser's session
+        cookies.
+
+        Args:
+            from_account_value: Source account ID value (e.g., "800002")
+            to_account_value: Destination account ID value (e.g., "800003")
+            amount: Amount to transfer (will be formatted to 2 decimal places)
+
+        Returns:
+            Same keys as capture_confirmation()
+
+        Raises:
+            RuntimeError: If the session expired and the POST was answered
+                with the login form (retried by @with_session_retry)
+        """
+        if self._transfer_action is None:
+            self.navigate()
+            self._transfer_action = self.page.evaluate(TRANSFER_ACTION_JS)
+
+        response = self.page.request.post(
+            self._transfer_action,
+            form={
+                "fromAccount": from_account_value,
+                "toAccount": to_account_value,
+                "transferAmount": f"{amount:.2f}",
+            },
+        )
+        body = response.text()
+        if LOGIN_FORM_MARKER in body:
+            # Show the login page so the retry wrapper sees the logout
+            self.page.goto(response.url, wait_until="domcontentloaded")
+            raise RuntimeError(
+                f"Session expired: transfer POST redirected to {response.url}"
+            )
+
+        return parse_confirmation_html(body)
 
     def capture_confirmation(self) -> Dict[str, str]:
         """
@@ -117,61 +231,69 @@ class TransferPage(BasePage):
             - #_ctl0__ctl0_Content_Main_postResp
             - #soapResp
             - Text containing "successfully transferred"
+            All three are read in a single evaluate (CONFIRMATION_JS).
         """
         confirmation_data = {"message": "", "reference_number": "", "status": "unknown"}
+        texts = self.page.evaluate(CONFIRMATION_JS)
 
         # Try to get confirmation from primary response span
-        primary_span = self.page.locator("#_ctl0__ctl0_Content_Main_postResp")
-        if primary_span.count() > 0:
-            message_text = primary_span.inner_text().strip()
-            if message_text:
-                confirmation_data["message"] = message_text
-                if "successfully" in message_text.lower():
-                    confirmation_data["status"] = "success"
+        message_text = texts["primary"]
+        if message_text:
+            confirmation_data["message"] = message_text
+            if "successfully" in message_text.lower():
+                confirmation_data["status"] = "success"
 
         # Try to get confirmation from SOAP response span
-        soap_span = self.page.locator("#soapResp")
-        if soap_span.count() > 0:
-            soap_text = soap_span.inner_text().strip()
-            if soap_text:
-                # If primary was empty, use this
-                if not confirmation_data["message"]:
-                    confirmation_data["message"] = soap_text
-                if "successfully" in soap_text.lower():
-                    confirmation_data["status"] = "success"
+        soap_text = texts["soap"]
+        if soap_text:
+            # If primary was empty, use this
+            if not confirmation_data["message"]:
+                confirmation_data["message"] = soap_text
+            if "successfully" in soap_text.lower():
+                confirmation_data["status"] = "success"
 
         # Fallback: Check for any element containing success message
-        if not confirmation_data["message"]:
-            try:
-                success_element = self.page.get_by_text("successfully transferred")
-                if success_element.count() > 0:
-                    confirmation_data["message"] = success_element.inner_text().strip()
-                    confirmation_data["status"] = "success"
-            except Exception:
-                pass
+        if not confirmation_data["message"] and texts["fallback"]:
+            confirmation_data["message"] = texts["fallback"]
+            confirmation_data["status"] = "success"
 
         return confirmation_data
 
-    def take_screenshot(self, tag: str) -> str:
+    def take_screenshot(self, tag: str, timestamp: Optional[str] = None) -> str:
         """
         Take a screenshot for transfer confirmation.
 
         Args:
             tag: Identifier tag for the screenshot filename
+            timestamp: UTC "%Y%m%d_%H%M%S" timestamp for the filename; the
+                current time if None
 
         Returns:
             Full path to the saved screenshot file
 
         Note:
-            Filename format: {tag}_{timestamp}.png
+            Filename format: {tag}_{timestamp}.png ({tag}_{timestamp}.jpg
+            for screenshot_format "jpeg")
             Creates screenshot directory if it doesn't exist
             Uses UTC timestamp
+            A JPEG falls back to the viewport if no confirmation span is
+            visible
         """
         self.screenshot_dir.mkdir(parents=True, exist_ok=True)
-        timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-        filename = f"{tag}_{timestamp}.png"
-        screenshot_path = self.screenshot_dir / filename
-        self.page.screenshot(path=str(screenshot_path))
+        if timestamp is None:
+            timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+
+        if self.screenshot_format == "jpeg":
+            screenshot_path = self.screenshot_dir / f"{tag}_{timestamp}.jpg"
+            box = self._loc(CONFIRMATION_SELECTOR).first.bounding_box()
+            if box is not None and not (box["width"] and box["height"]):
+                box = None
+            self.page.screenshot(
+                path=str(screenshot_path), type="jpeg", quality=JPEG_QUALITY, clip=box
+            )
+        else:
+            screenshot_path = self.screenshot_dir / f"{tag}_{timestamp}.png"
+            self.page.screenshot(path=str(screenshot_path))
         return str(screenshot_path)
 
     @with_session_retry()
@@ -185,9 +307,12 @@ class TransferPage(BasePage):
         1. Navigate to Transfer Funds page
         2. Execute transfer
         3. Capture confirmation details
-        4. Take screenshot
+        4. Take screenshot (as screenshot_policy allows)
         5. Return comprehensive transfer result
 
+        With screenshot_policy "api", steps 1-3 are a single form POST
+        (execute_transfer_api) and no screenshot is taken.
+
         Args:
             from_account_label: Source account label (e.g., "800002 Savings")
             to_account_label: Destination account label (e.g., "800003 Checking")
@@ -201,7 +326,7 @@ class TransferPage(BasePage):
             - "confirmation_message": Success message text
             - "reference_number": Transaction reference if available
             - "status": "success" or "error"
-            - "screenshot": Path to screenshot file
+            - "screenshot": Path to screenshot file, empty string if skipped
             - "timestamp": UTC timestamp of transfer
 
         Note:
@@ -214,18 +339,30 @@ class TransferPage(BasePage):
         from_account_value = from_account_label.split()[0]
         to_account_value = to_account_label.split()[0]
 
-        # Navigate to transfer page
-        self.navigate()
+        if self.screenshot_policy == "api":
+            # No screenshot to take, so skip rendering the form entirely
+            confirmation = self.execute_transfer_api(
+                from_account_value, to_account_value, amount
+            )
+        else:
+            # Navigate to transfer page
+            self.navigate()
 
-        # Execute the transfer
-        self.execute_transfer(from_account_value, to_account_value, amount)
+            # Execute the transfer
+            self.execute_transfer(from_account_value, to_account_value, amount)
 
-        # Capture confirmation details
-        confirmation = self.capture_confirmation()
+            # Capture confirmation details
+            confirmation = self.capture_confirmation()
 
-        # Take screenshot
+        # Take screenshot; encoding a PNG is the slowest step left after the
+        # transfer, so it can be limited to failures or skipped
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        screenshot_path = self.take_screenshot("transfer")
+        screenshot_path = ""
+        if self.screenshot_policy == "always" or (
+            self.screenshot_policy == "on_error" and confirmation["status"] != "success"
+        ):
+            # Same timestamp as the result, so the two always match
+            screenshot_path = self.take_screenshot("transfer", timestamp)
 
         # Compile result
         result = {
@@ -240,3 +377,25 @@ class TransferPage(BasePage):
         }
 
         return result
+
+
+def parse_confirmation_html(body: str) -> Dict[str, str]:
+    """
+    Extract the confirmation from a transfer response's HTML.
+
+    Args:
+        body: HTML returned by the transfer form POST
+
+    Returns:
+        Same keys as TransferPage.capture_confirmation(); the message is the
+        first non-empty confirmation span
+    """
+    confirmation_data = {"message": "", "reference_number": "", "status": "unknown"}
+    for match in CONFIRMATION_SPAN_RE.finditer(body):
+        text = html.unescape(HTML_TAG_RE.sub("", match.group(1))).strip()
+        if text:
+            confirmation_data["message"] = text
+            if "successfully" in text.lower():
+                confirmation_data["status"] = "success"
+            break
+    return confirmation_data